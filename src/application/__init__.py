@@ -5,15 +5,22 @@ Use cases work with abstract concepts (roads, POIs, zones) without knowing
 the data source specifics (OSM, GeoJSON, etc.).
 """
 
+from application.exceptions import PipelineRecoverableError
 from application.ports.extractor import DataExtractor
 from application.ports.repository import GeoRepository
-from application.use_cases.run_pipeline import RunPipelineUseCase, PipelineResult
+from application.use_cases.run_pipeline import (
+    DEFAULT_ENTITY_TYPES,
+    RunPipelineUseCase,
+    PipelineResult,
+)
 from application.use_cases.compute_zone_hierarchy import ComputeZoneHierarchyUseCase
 
 __all__ = [
     "DataExtractor",
     "GeoRepository",
     "RunPipelineUseCase",
+    "DEFAULT_ENTITY_TYPES",
     "PipelineResult",
     "ComputeZoneHierarchyUseCase",
+    "PipelineRecoverableError",
 ]
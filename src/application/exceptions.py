@@ -0,0 +1,11 @@
+"""Application exceptions - Orchestration failures."""
+
+
+class PipelineRecoverableError(Exception):
+    """Transient failure a pipeline run may recover from by running sequentially.
+
+    Adapters raise it for conditions caused by parallel load (e.g. waiting
+    too long for a pooled connection), never for data or programming errors.
+    """
+
+    pass
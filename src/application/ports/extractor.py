@@ -2,8 +2,14 @@
 
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
+from itertools import islice
+from typing import TYPE_CHECKING
 
 from domain import Road, POI, Zone
+from domain.value_objects import lon_lat_columns
+
+if TYPE_CHECKING:
+    import pyarrow as pa
 
 
 class DataExtractor(ABC):
@@ -39,3 +45,59 @@ class DataExtractor(ABC):
             Zone domain entities
         """
         ...
+
+    def extract_roads_arrow(self, batch_size: int = 10_000) -> Iterator["pa.RecordBatch"]:
+        """Extract roads as columnar Arrow record batches.
+
+        Default implementation groups extract_roads() by column, so each
+        batch is one Python object instead of batch_size Road entities.
+        Adapters with a native columnar source may override it.
+
+        Requires the optional ``arrow`` extra (pyarrow).
+
+        Args:
+            batch_size: Number of roads per record batch
+
+        Yields:
+            Record batches with one row per road
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as exc:
+            raise ImportError(
+                "extract_roads_arrow requires pyarrow: pip install 'chorographer[arrow]'"
+            ) from exc
+
+        schema = pa.schema([
+            ("id", pa.int64()),
+            ("lons", pa.list_(pa.float64())),
+            ("lats", pa.list_(pa.float64())),
+            ("road_type", pa.string()),
+            ("surface", pa.string()),
+            ("smoothness", pa.string()),
+            ("name", pa.string()),
+            ("lanes", pa.int32()),
+            ("oneway", pa.bool_()),
+            ("max_speed", pa.int32()),
+            ("tags", pa.map_(pa.string(), pa.string())),
+        ])
+
+        roads = self.extract_roads()
+        while batch := list(islice(roads, batch_size)):
+            columns = [lon_lat_columns(r.geometry) for r in batch]
+            yield pa.record_batch(
+                [
+                    [r.id for r in batch],
+                    [list(lons) for lons, _ in columns],
+                    [list(lats) for _, lats in columns],
+                    [r.road_type.value for r in batch],
+                    [r.surface.value for r in batch],
+                    [r.smoothness.value for r in batch],
+                    [r.name for r in batch],
+                    [r.lanes for r in batch],
+                    [r.oneway for r in batch],
+                    [r.max_speed for r in batch],
+                    [list(r.tags.items()) if r.tags else [] for r in batch],
+                ],
+                schema=schema,
+            )
@@ -1,7 +1,8 @@
 """Geo repository port - Abstract interface for persisting domain entities."""
 
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
+from typing import Any
 
 from domain import Road, POI, Zone, Segment
 
@@ -60,3 +61,39 @@ class GeoRepository(ABC):
             Number of segments saved
         """
         ...
+
+    # Row encoding hooks. Batch pipelines call encode_* in a worker thread
+    # and hand the result to save_encoded_*, keeping entity-to-row
+    # conversion off the event loop. The defaults pass entities through.
+
+    def encode_roads(self, roads: list[Road]) -> Sequence[Any]:
+        """Convert roads to storage rows (may run in a worker thread)."""
+        return roads
+
+    async def save_encoded_roads(self, rows: Sequence[Any]) -> int:
+        """Save rows produced by encode_roads."""
+        return await self.save_roads(rows)
+
+    def encode_pois(self, pois: list[POI]) -> Sequence[Any]:
+        """Convert POIs to storage rows (may run in a worker thread)."""
+        return pois
+
+    async def save_encoded_pois(self, rows: Sequence[Any]) -> int:
+        """Save rows produced by encode_pois."""
+        return await self.save_pois(rows)
+
+    def encode_zones(self, zones: list[Zone]) -> Sequence[Any]:
+        """Convert zones to storage rows (may run in a worker thread)."""
+        return zones
+
+    async def save_encoded_zones(self, rows: Sequence[Any]) -> int:
+        """Save rows produced by encode_zones."""
+        return await self.save_zones(rows)
+
+    def encode_segments(self, segments: list[Segment]) -> Sequence[Any]:
+        """Convert segments to storage rows (may run in a worker thread)."""
+        return segments
+
+    async def save_encoded_segments(self, rows: Sequence[Any]) -> int:
+        """Save rows produced by encode_segments."""
+        return await self.save_segments(rows)
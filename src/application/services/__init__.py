@@ -1,5 +1,6 @@
 """Application services for cross-cutting concerns."""
 
 from application.services.async_pipeline import AsyncBatcher
+from application.services.fused_pipeline import FusedRoadSegmentPipeline
 
-__all__ = ["AsyncBatcher"]
+__all__ = ["AsyncBatcher", "FusedRoadSegmentPipeline"]
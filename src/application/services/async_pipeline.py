@@ -1,22 +1,41 @@
 """Async pipeline utilities for producer-consumer patterns.
 
 This module provides utilities to overlap extraction (CPU-bound) with
-database loading (I/O-bound) using asyncio.Queue.
+database loading (I/O-bound) using a thread-safe queue.Queue.
 """
 
 import asyncio
-from collections.abc import Awaitable, Callable, Iterator
-from typing import Generic, TypeVar
+import contextvars
+import queue
+import threading
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Generic, TypeVar
+
+from infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
 
 T = TypeVar("T")
 
+# How often a blocked producer re-checks whether the consumer has gone away
+_PUT_POLL_SECONDS = 0.1
+
 
 class AsyncBatcher(Generic[T]):
     """Converts sync iterator to async batches via queue.
 
     Implements a producer-consumer pattern where:
-    - Producer: Reads from sync iterator in executor (non-blocking)
-    - Consumer: Processes batches asynchronously (e.g., DB writes)
+    - Producer: Reads the whole sync iterator in one executor call and
+      hands batches over a bounded queue.Queue (blocking put = backpressure)
+    - Consumers: One or more tasks processing batches asynchronously
+      (e.g., DB writes on separate pool connections)
+
+    Handing batches over a plain queue.Queue avoids marshalling every put
+    back onto the event loop, which is what asyncio.Queue would require
+    from a worker thread. Idle consumers wait on an asyncio.Event that the
+    producer sets after each put, so no worker thread is parked on get().
 
     This allows extraction and loading to happen concurrently,
     improving overall pipeline throughput.
@@ -34,6 +53,13 @@ class AsyncBatcher(Generic[T]):
         iterator: Iterator[T],
         batch_size: int = 1000,
         max_queue_size: int = 10,
+        executor: ThreadPoolExecutor | None = None,
+        max_merge_factor: int = 4,
+        min_batch: int = 100,
+        max_batch: int = 10_000,
+        adapt_every: int = 8,
+        inflight: threading.Semaphore | None = None,
+        encoder: Callable[[list[T]], Sequence[Any]] | None = None,
     ) -> None:
         """Initialize the async batcher.
 
@@ -41,55 +67,193 @@ class AsyncBatcher(Generic[T]):
             iterator: Sync iterator to read from
             batch_size: Number of items per batch
             max_queue_size: Max batches to buffer (backpressure control)
+            executor: Dedicated executor for the producer. When None,
+                the producer runs via asyncio.to_thread.
+            max_merge_factor: Cap on queued batches merged into one
+                processor call (in multiples of batch_size)
+            min_batch: Lower bound when adapting batch_size
+            max_batch: Upper bound when adapting batch_size
+            adapt_every: Number of produced batches between adjustments
+            inflight: Semaphore shared across batchers; one permit is held
+                per batch from enqueue until its processor call finishes,
+                bounding buffered rows across all concurrent streams
+            encoder: Optional batch encoder (e.g. entity -> insert row) run
+                in the producer thread; the processor then receives its
+                output instead of the raw items
         """
         self.iterator = iterator
         self.batch_size = batch_size
-        self.queue: asyncio.Queue[list[T] | None] = asyncio.Queue(max_queue_size)
-        self._producer_error: Exception | None = None
+        self.max_merge_factor = max_merge_factor
+        self._executor = executor
+        self.queue: queue.Queue[list[Any] | None] = queue.Queue(max_queue_size)
+        self._closed = threading.Event()
+        # Set from the producer thread (via call_soon_threadsafe) after each
+        # put, so waiting consumers never tie up a worker thread
+        self._ready = asyncio.Event()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._consumer_count = 1
+        self.min_batch = min(min_batch, batch_size)
+        self.max_batch = max(max_batch, batch_size)
+        self.adapt_every = adapt_every
+        self._batches_since_adapt = 0
+        self._queue_full_puts = 0
+        self._queue_empty_gets = 0
+        self._inflight = inflight
+        self._encoder = encoder
 
-    def _iter_batches(self) -> list[T] | None:
+    def _iter_batches(self) -> list[Any] | None:
         """Read next batch from iterator (runs in executor).
 
         Returns:
-            List of items or None if iterator exhausted
+            List of items (encoded if an encoder is set) or None if the
+            iterator is exhausted
         """
-        batch: list[T] = []
-        try:
-            for item in self.iterator:
-                batch.append(item)
-                if len(batch) >= self.batch_size:
-                    return batch
-        except Exception as e:
-            self._producer_error = e
-            raise
+        # islice keeps the fill loop in C; the iterator remembers its
+        # position across calls.
+        batch = list(islice(self.iterator, self.batch_size))
+        if batch and self._encoder is not None:
+            batch = list(self._encoder(batch))
 
         return batch if batch else None
 
-    async def produce(self) -> None:
-        """Producer: read from iterator and enqueue batches."""
-        loop = asyncio.get_event_loop()
+    def _adapt_batch_size(self) -> None:
+        """Resize batches from observed queue pressure (runs in producer).
 
-        while True:
+        A queue that is usually full on put means the consumer is the
+        bottleneck, so larger batches amortize its per-call cost. A queue
+        that is usually empty on get means the consumer is starved, so
+        smaller batches get work to it sooner.
+        """
+        self._batches_since_adapt += 1
+        if self._batches_since_adapt < self.adapt_every:
+            return
+
+        full_puts = self._queue_full_puts
+        empty_gets = self._queue_empty_gets
+        self._batches_since_adapt = 0
+        self._queue_full_puts = 0
+        self._queue_empty_gets = 0
+
+        fill_ratio = full_puts / (full_puts + empty_gets + 1)
+        if fill_ratio > 0.75:
+            new_size = min(self.batch_size * 2, self.max_batch)
+        elif fill_ratio < 0.25:
+            new_size = max(self.batch_size // 2, self.min_batch)
+        else:
+            return
+
+        if new_size != self.batch_size:
+            logger.debug(
+                "Adjusted batch size",
+                old=self.batch_size,
+                new=new_size,
+                fill_ratio=round(fill_ratio, 2),
+            )
+            self.batch_size = new_size
+
+    def _acquire_slot(self) -> bool:
+        """Take an in-flight permit, giving up once the batcher is closed."""
+        if self._inflight is None:
+            return True
+        while not self._closed.is_set():
+            if self._inflight.acquire(timeout=_PUT_POLL_SECONDS):
+                return True
+        return False
+
+    def _release_slots(self, count: int) -> None:
+        """Return in-flight permits for batches that are done."""
+        if self._inflight is not None:
+            for _ in range(count):
+                self._inflight.release()
+
+    def _put(self, batch: list[Any] | None) -> bool:
+        """Blocking put that gives up once the batcher is closed.
+
+        Returns:
+            True if the batch was enqueued
+        """
+        if batch is not None:
+            if not self._acquire_slot():
+                return False
+            if not self._put_item(batch):
+                self._release_slots(1)
+                return False
+            return True
+        return self._put_item(batch)
+
+    def _put_item(self, batch: list[Any] | None) -> bool:
+        """Blocking queue put, polling for close."""
+        if self.queue.full():
+            self._queue_full_puts += 1
+        while not self._closed.is_set():
             try:
-                batch = await loop.run_in_executor(None, self._iter_batches)
-            except Exception:
-                # Signal consumer to stop on error
-                await self.queue.put(None)
-                return
+                self.queue.put(batch, timeout=_PUT_POLL_SECONDS)
+            except queue.Full:
+                continue
+            self._notify()
+            return True
+        return False
 
-            if batch is None:
-                # Signal completion
-                await self.queue.put(None)
-                break
+    def _notify(self) -> None:
+        """Wake consumers waiting for a batch (called from producer thread)."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._ready.set)
+
+    def produce(self) -> None:
+        """Producer: read from iterator and enqueue batches (runs in executor).
+
+        Errors propagate to the awaiting task after the sentinels are sent.
+        """
+        # Bind hot-loop methods once; this loop runs once per batch
+        iter_batches = self._iter_batches
+        put = self._put
+        adapt_batch_size = self._adapt_batch_size
+        try:
+            while True:
+                batch = iter_batches()
+                if batch is None:
+                    break
+                if not put(batch):
+                    return
+                adapt_batch_size()
+        finally:
+            # Signal completion (or error) with one sentinel per consumer.
+            # If consumers are gone, still try to wake getters blocked on an
+            # empty queue.
+            for _ in range(self._consumer_count):
+                if self._put(None):
+                    continue
+                try:
+                    self.queue.put_nowait(None)
+                except queue.Full:
+                    break
+                self._notify()
 
-            await self.queue.put(batch)
+    async def _get(self) -> list[Any] | None:
+        """Get the next batch, awaiting at most once per poll cycle."""
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            self._queue_empty_gets += 1
+
+        while True:
+            # Clear before re-checking so a put landing in between still
+            # wakes us through its scheduled set()
+            self._ready.clear()
+            try:
+                return self.queue.get_nowait()
+            except queue.Empty:
+                await self._ready.wait()
 
     async def consume(
         self,
-        processor: Callable[[list[T]], Awaitable[int]],
+        processor: Callable[[list[Any]], Awaitable[int]],
     ) -> int:
         """Consumer: process batches from queue.
 
+        After each blocking get, any batches already waiting in the queue
+        are merged into the same processor call.
+
         Args:
             processor: Async function that processes a batch and returns count
 
@@ -97,37 +261,105 @@ class AsyncBatcher(Generic[T]):
             Total items processed
         """
         total = 0
-        while True:
-            batch = await self.queue.get()
+        done = False
+        get = self._get
+        get_nowait = self.queue.get_nowait
+        while not done:
+            batch = await get()
             if batch is None:
                 break
-            total += await processor(batch)
+
+            # Drain whatever else is already queued so one processor call
+            # (and one DB round-trip) covers several producer batches.
+            merged = list(batch)
+            batches = 1
+            while len(merged) < self.batch_size * self.max_merge_factor:
+                try:
+                    nxt = get_nowait()
+                except queue.Empty:
+                    break
+                if nxt is None:
+                    done = True
+                    break
+                merged.extend(nxt)
+                batches += 1
+
+            try:
+                total += await processor(merged)
+            finally:
+                self._release_slots(batches)
         return total
 
+    def _start_producer(self) -> "asyncio.Future[None]":
+        """Launch the producer in a worker thread with the current context."""
+        if self._executor is None:
+            return asyncio.ensure_future(asyncio.to_thread(self.produce))
+
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+        return loop.run_in_executor(self._executor, ctx.run, self.produce)
+
+    async def _run_producer(self) -> None:
+        """Await the producer thread; on cancellation, stop it and wait."""
+        producer = self._start_producer()
+        try:
+            await asyncio.shield(producer)
+        except asyncio.CancelledError:
+            # The thread can't be interrupted; ask it to stop at its next
+            # put and wait so it never outlives the batcher
+            self._closed.set()
+            await asyncio.wait([producer])
+            raise
+
+    def _release_leftovers(self) -> None:
+        """Return permits held by batches nobody will process."""
+        while True:
+            try:
+                leftover = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if leftover is not None:
+                self._release_slots(1)
+
     async def run(
         self,
-        processor: Callable[[list[T]], Awaitable[int]],
+        processor: Callable[[list[Any]], Awaitable[int]],
+        consumer_concurrency: int = 4,
     ) -> int:
-        """Run producer and consumer concurrently.
+        """Run producer and consumers concurrently.
+
+        Producer and consumers share a TaskGroup: a failure in any of them
+        cancels the rest, so a failing processor can't leave the producer
+        blocked on a full queue.
 
         Args:
             processor: Async function that processes a batch and returns count
+            consumer_concurrency: Number of consumer tasks sharing the queue,
+                so several processor calls can be in flight at once
 
         Returns:
             Total items processed
 
         Raises:
-            Exception: Re-raises any producer error after consumer completes
+            Exception: The first producer or consumer error
         """
-        producer = asyncio.create_task(self.produce())
-        consumer = asyncio.create_task(self.consume(processor))
-
-        # Wait for producer to finish (consumer will stop on None sentinel)
-        await producer
-        total = await consumer
-
-        # Re-raise producer error if any
-        if self._producer_error is not None:
-            raise self._producer_error
+        self._consumer_count = max(1, consumer_concurrency)
+        self._loop = asyncio.get_running_loop()
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self._run_producer())
+                # Each consumer stops on its own None sentinel
+                consumers = [
+                    tg.create_task(self.consume(processor))
+                    for _ in range(self._consumer_count)
+                ]
+        except ExceptionGroup as group:
+            # Surface the root cause, as callers log and handle it directly
+            if len(group.exceptions) == 1:
+                raise group.exceptions[0] from None
+            raise
+        finally:
+            self._closed.set()
+            self._release_leftovers()
 
-        return total
+        return sum(consumer.result() for consumer in consumers)
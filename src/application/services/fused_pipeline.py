@@ -0,0 +1,134 @@
+"""Fused road + segment loading from a single pass over the roads."""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from application.ports.repository import GeoRepository
+from application.services.async_pipeline import AsyncBatcher
+from domain import Road
+from domain.services import split_road
+from infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+CoordCounts = dict[tuple[float, float], int]
+
+# One batched item: a road's insert row and the rows of its segments
+RoadWithSegments = tuple[Any, Sequence[Any]]
+
+
+class FusedRoadSegmentPipeline:
+    """Load roads and their segments from one pass over the roads.
+
+    Each road is encoded together with its segments in the batcher's
+    producer thread, so road geometries are walked once instead of once
+    per table. Every processor call saves its roads before their segments
+    (segments.road_id references roads), while other batches keep both
+    writes overlapping with extraction.
+
+    Segment boundaries depend on coordinates shared across all roads, so
+    coord_counts must already cover the full road set (see
+    count_road_coordinates).
+
+    Usage:
+        counts = count_road_coordinates(extractor.extract_roads())
+        pipeline = FusedRoadSegmentPipeline(
+            extractor.extract_roads(), counts, repository
+        )
+        roads_count, segments_count = await pipeline.run()
+    """
+
+    def __init__(
+        self,
+        roads: Iterator[Road],
+        coord_counts: CoordCounts,
+        repository: GeoRepository,
+        batch_size: int = 1000,
+        max_queue_size: int = 10,
+        executor: ThreadPoolExecutor | None = None,
+        inflight: threading.Semaphore | None = None,
+        write_slots: asyncio.Semaphore | None = None,
+    ) -> None:
+        """Initialize the fused pipeline.
+
+        Args:
+            roads: Sync iterator of roads
+            coord_counts: Coordinate counts over the full road set
+            repository: Repository receiving both roads and segments
+            batch_size: Number of roads per batch
+            max_queue_size: Max batches to buffer (backpressure control)
+            executor: Dedicated executor for the producer
+            inflight: Semaphore bounding buffered batches across streams
+            write_slots: Semaphore bounding concurrent repository writes
+        """
+        self._repository = repository
+        self._coord_counts = coord_counts
+        self._write_slots = write_slots
+        self._segments_count = 0
+        self._batcher: AsyncBatcher[Road] = AsyncBatcher(
+            roads,
+            batch_size=batch_size,
+            max_queue_size=max_queue_size,
+            executor=executor,
+            inflight=inflight,
+            encoder=self._encode,
+        )
+
+    def _encode(self, roads: list[Road]) -> list[RoadWithSegments]:
+        """Encode a batch of roads, pairing each row with its segment rows."""
+        coord_counts = self._coord_counts
+        encode_segments = self._repository.encode_segments
+        road_rows = self._repository.encode_roads(roads)
+        return [
+            (row, encode_segments(list(split_road(road, coord_counts))))
+            for road, row in zip(roads, road_rows, strict=True)
+        ]
+
+    async def _write(
+        self,
+        save: Callable[[Sequence[Any]], Awaitable[int]],
+        rows: Sequence[Any],
+    ) -> int:
+        """Run one repository write, within the shared write slots if set."""
+        if self._write_slots is None:
+            return await save(rows)
+        async with self._write_slots:
+            return await save(rows)
+
+    async def _save(self, items: list[RoadWithSegments]) -> int:
+        """Save a batch of roads, then the segments split from them."""
+        road_rows = [row for row, _ in items]
+        segment_rows = [seg for _, segs in items for seg in segs]
+
+        saved = await self._write(self._repository.save_encoded_roads, road_rows)
+        if segment_rows:
+            # Await first: `+= await` would read the counter before the
+            # write and drop counts from concurrent consumers
+            segments_saved = await self._write(
+                self._repository.save_encoded_segments, segment_rows
+            )
+            self._segments_count += segments_saved
+        return saved
+
+    async def run(self, consumer_concurrency: int = 4) -> tuple[int, int]:
+        """Stream roads and segments to the repository.
+
+        Args:
+            consumer_concurrency: Concurrent batch writes
+
+        Returns:
+            Tuple of (roads saved, segments saved)
+        """
+        self._segments_count = 0
+        roads_count = await self._batcher.run(
+            self._save, consumer_concurrency=consumer_concurrency
+        )
+        logger.debug(
+            "Fused road/segment stream finished",
+            roads=roads_count,
+            segments=self._segments_count,
+        )
+        return roads_count, self._segments_count
@@ -1,16 +1,25 @@
 """Run pipeline use case - ETL orchestration."""
 
 import asyncio
-from collections.abc import Awaitable, Callable, Iterator
+import threading
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from time import perf_counter
-from typing import Literal, TypeVar
+from typing import Any, Literal, TypeVar
 
+from application.exceptions import PipelineRecoverableError
 from application.ports.extractor import DataExtractor
 from application.ports.repository import GeoRepository
 from application.services.async_pipeline import AsyncBatcher
+from application.services.fused_pipeline import FusedRoadSegmentPipeline
 from domain import Road
-from domain.services import split_roads_into_segments
+from domain.services import (
+    count_road_coordinates,
+    iter_road_segments,
+    keep_shared_coordinates,
+    tally_road_coordinates,
+)
 from infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
@@ -19,6 +28,11 @@ T = TypeVar("T")
 
 EntityType = Literal["roads", "pois", "zones", "segments"]
 
+# Loaded when no entity types are given
+DEFAULT_ENTITY_TYPES: frozenset[EntityType] = frozenset({"pois", "zones"})
+
+CoordCounts = dict[tuple[float, float], int]
+
 
 @dataclass
 class PipelineResult:
@@ -61,6 +75,9 @@ class RunPipelineUseCase:
         enable_parallel: bool = True,
         batch_size: int = 1000,
         queue_depth: int = 10,
+        consumer_concurrency: int = 4,
+        max_concurrent_writes: int = 10,
+        max_inflight_batches: int | None = None,
     ) -> None:
         """Initialize the pipeline use case.
 
@@ -70,33 +87,98 @@ class RunPipelineUseCase:
             enable_parallel: Enable parallel processing (default True)
             batch_size: Batch size for parallel processing
             queue_depth: Max batches to buffer in queue
+            consumer_concurrency: Concurrent save_*_batch calls per stream
+            max_concurrent_writes: Cap on save_*_batch calls in flight across
+                all streams (match the repository's connection pool size)
+            max_inflight_batches: Cap on batches buffered or being written
+                across all streams (default: 2 x max_concurrent_writes)
         """
         self.extractor = extractor
         self.repository = repository
         self.enable_parallel = enable_parallel
         self.batch_size = batch_size
         self.queue_depth = queue_depth
+        self.consumer_concurrency = consumer_concurrency
+        self._write_slots = asyncio.Semaphore(max_concurrent_writes)
+        # Shared with the producer threads, hence a threading semaphore
+        self._inflight_batches = threading.BoundedSemaphore(
+            max_inflight_batches or 2 * max_concurrent_writes
+        )
+
+    @staticmethod
+    def _tally_roads(roads: Iterator[Road], coord_counts: CoordCounts) -> Iterator[Road]:
+        """Yield roads unchanged while counting their coordinates for segmenting."""
+        for road in roads:
+            tally_road_coordinates(road, coord_counts)
+            yield road
 
     async def _process_with_queue(
         self,
+        name: EntityType,
         iterator: Iterator[T],
-        save_batch_fn: Callable[[list[T]], Awaitable[int]],
+        encode_fn: Callable[[list[T]], Sequence[Any]],
+        save_batch_fn: Callable[[Sequence[Any]], Awaitable[int]],
     ) -> int:
         """Process entities using producer-consumer pattern.
 
         Args:
+            name: Entity type, used to name the stream's worker threads
             iterator: Sync iterator yielding entities
-            save_batch_fn: Async function to save a batch
+            encode_fn: Repository row encoder, run in the producer thread
+            save_batch_fn: Async function to save a batch of encoded rows
 
         Returns:
             Total entities processed
         """
-        batcher: AsyncBatcher[T] = AsyncBatcher(
-            iterator,
-            batch_size=self.batch_size,
-            max_queue_size=self.queue_depth,
-        )
-        return await batcher.run(save_batch_fn)
+
+        async def save_batch(batch: list[Any]) -> int:
+            # Streams run concurrently; keep total writes within the pool
+            async with self._write_slots:
+                return await save_batch_fn(batch)
+
+        # One dedicated producer thread per stream: a long blocking read on
+        # one stream can't starve the others of shared default-pool workers.
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"batcher-{name}")
+        try:
+            batcher: AsyncBatcher[T] = AsyncBatcher(
+                iterator,
+                batch_size=self.batch_size,
+                max_queue_size=self.queue_depth,
+                executor=executor,
+                inflight=self._inflight_batches,
+                encoder=encode_fn,
+            )
+            return await batcher.run(
+                save_batch,
+                consumer_concurrency=self.consumer_concurrency,
+            )
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _process_fused(self, coord_counts: CoordCounts) -> tuple[int, int]:
+        """Load roads and their segments from a single pass over the roads.
+
+        Args:
+            coord_counts: Coordinate counts over the full road set
+
+        Returns:
+            Tuple of (roads saved, segments saved)
+        """
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="batcher-roads")
+        try:
+            pipeline = FusedRoadSegmentPipeline(
+                self.extractor.extract_roads(),
+                coord_counts,
+                self.repository,
+                batch_size=self.batch_size,
+                max_queue_size=self.queue_depth,
+                executor=executor,
+                inflight=self._inflight_batches,
+                write_slots=self._write_slots,
+            )
+            return await pipeline.run(consumer_concurrency=self.consumer_concurrency)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     async def execute(
         self,
@@ -111,17 +193,22 @@ class RunPipelineUseCase:
         Returns:
             PipelineResult with counts and duration.
         """
-        types = entity_types or {"pois", "zones"}
-
-        if self.enable_parallel:
-            try:
-                return await self._execute_parallel(types)
-            except Exception as e:
-                logger.warning(
-                    "Parallel execution failed, falling back to sequential",
-                    error=str(e),
-                )
-                return await self._execute_sequential(types)
+        types = entity_types or set(DEFAULT_ENTITY_TYPES)
+
+        if not self.enable_parallel:
+            return await self._execute_sequential(types)
+
+        # Only transient load failures fall back; writes are upserts, so
+        # rows already loaded in parallel are simply rewritten. Anything
+        # else is a real error and propagates. except* also matches errors
+        # raised together by several batch consumers.
+        try:
+            return await self._execute_parallel(types)
+        except* PipelineRecoverableError as group:
+            logger.error(
+                "Parallel execution failed, falling back to sequential",
+                error=str(group.exceptions[0]),
+            )
 
         return await self._execute_sequential(types)
 
@@ -136,24 +223,26 @@ class RunPipelineUseCase:
         pois_count = 0
         zones_count = 0
         segments_count = 0
-        roads: list[Road] | None = None
+        # Segmenting needs coordinate counts over every road; they are
+        # tallied while roads stream to the repository, and segments are
+        # then streamed from a second pass instead of holding all roads.
+        coord_counts: CoordCounts = {}
 
-        if "segments" in types:
+        if "roads" in types:
             logger.info("Processing roads")
-            roads = list(self.extractor.extract_roads())
-            if "roads" in types:
-                roads_count = await self.repository.save_roads(roads)
-                logger.info("Roads processed", count=roads_count)
-        elif "roads" in types:
-            logger.info("Processing roads")
-            roads_count = await self.repository.save_roads(
-                self.extractor.extract_roads()
-            )
+            roads = self.extractor.extract_roads()
+            if "segments" in types:
+                roads = self._tally_roads(roads, coord_counts)
+            roads_count = await self.repository.save_roads(roads)
             logger.info("Roads processed", count=roads_count)
 
         if "segments" in types:
             logger.info("Processing segments")
-            segments = split_roads_into_segments(roads or [])
+            if "roads" in types:
+                coord_counts = keep_shared_coordinates(coord_counts)
+            else:
+                coord_counts = count_road_coordinates(self.extractor.extract_roads())
+            segments = iter_road_segments(self.extractor.extract_roads(), coord_counts)
             segments_count = await self.repository.save_segments(segments)
             logger.info("Segments processed", count=segments_count)
 
@@ -187,9 +276,11 @@ class RunPipelineUseCase:
     ) -> PipelineResult:
         """Parallel execution mode using producer-consumer pattern.
 
-        Processes entity types concurrently where possible:
-        - POIs and Zones can run in parallel (independent extractors)
-        - Roads must complete before segments (dependency)
+        Roads, POIs and zones start together since they only share the
+        repository. When both roads and segments are requested, they are
+        loaded by one fused stream after a coordinate-counting pass, with
+        each batch's roads written before its segments (the segments table
+        references roads).
         """
         start = perf_counter()
         logger.info("Running pipeline in parallel mode")
@@ -204,76 +295,89 @@ class RunPipelineUseCase:
         need_pois = "pois" in types
         need_zones = "zones" in types
         need_segments = "segments" in types
+        fused = "roads" in types and need_segments
 
-        # Phase 1: Process roads first if needed (segments depend on roads)
-        roads: list[Road] = []
-        if need_roads:
+        # Coordinate counts for segmenting, over the full road set
+        coord_counts: CoordCounts = {}
+
+        async def process_roads() -> int:
+            nonlocal coord_counts, segments_count
             logger.info("Processing roads (parallel mode)")
-            # Collect roads for potential segment processing
             if need_segments:
-                roads = list(self.extractor.extract_roads())
-                if "roads" in types:
-                    roads_count = await self._process_with_queue(
-                        iter(roads),
-                        self.repository.save_roads_batch,
-                    )
-                    logger.info("Roads processed", count=roads_count)
-            else:
-                roads_count = await self._process_with_queue(
-                    self.extractor.extract_roads(),
-                    self.repository.save_roads_batch,
+                # Segment boundaries depend on every road: count off the
+                # event loop before any segment is built
+                coord_counts = await asyncio.to_thread(
+                    count_road_coordinates, self.extractor.extract_roads()
                 )
-                logger.info("Roads processed", count=roads_count)
-
-        # Phase 2: Process segments, POIs, and zones in parallel
-        parallel_tasks: list[asyncio.Task[int]] = []
-        task_names: list[str] = []
+            if "roads" not in types:
+                return 0
+
+            if fused:
+                roads_saved, segments_count = await self._process_fused(coord_counts)
+                return roads_saved
+
+            return await self._process_with_queue(
+                "roads",
+                self.extractor.extract_roads(),
+                self.repository.encode_roads,
+                self.repository.save_encoded_roads,
+            )
 
-        if need_segments and roads:
+        async def process_segments(roads_task: asyncio.Task[int]) -> int:
+            await roads_task
             logger.info("Processing segments (parallel mode)")
-            segments = split_roads_into_segments(roads)
-            task = asyncio.create_task(
-                self._process_with_queue(
-                    iter(segments),
-                    self.repository.save_segments_batch,
-                )
+            # Segments only: built lazily in the batcher's producer thread
+            return await self._process_with_queue(
+                "segments",
+                iter_road_segments(self.extractor.extract_roads(), coord_counts),
+                self.repository.encode_segments,
+                self.repository.save_encoded_segments,
             )
-            parallel_tasks.append(task)
-            task_names.append("segments")
+
+        tasks: dict[EntityType, asyncio.Task[int]] = {}
+
+        if need_roads:
+            tasks["roads"] = asyncio.create_task(process_roads())
+
+        if need_segments and not fused:
+            tasks["segments"] = asyncio.create_task(process_segments(tasks["roads"]))
 
         if need_pois:
             logger.info("Processing POIs (parallel mode)")
-            task = asyncio.create_task(
+            tasks["pois"] = asyncio.create_task(
                 self._process_with_queue(
+                    "pois",
                     self.extractor.extract_pois(),
-                    self.repository.save_pois_batch,
+                    self.repository.encode_pois,
+                    self.repository.save_encoded_pois,
                 )
             )
-            parallel_tasks.append(task)
-            task_names.append("pois")
 
         if need_zones:
             logger.info("Processing zones (parallel mode)")
-            task = asyncio.create_task(
+            tasks["zones"] = asyncio.create_task(
                 self._process_with_queue(
+                    "zones",
                     self.extractor.extract_zones(),
-                    self.repository.save_zones_batch,
+                    self.repository.encode_zones,
+                    self.repository.save_encoded_zones,
                 )
             )
-            parallel_tasks.append(task)
-            task_names.append("zones")
 
-        # Wait for all parallel tasks to complete
-        if parallel_tasks:
-            results = await asyncio.gather(*parallel_tasks, return_exceptions=True)
+        # Wait for all streams to complete
+        if tasks:
+            results = await asyncio.gather(*tasks.values(), return_exceptions=True)
 
-            for name, result in zip(task_names, results, strict=True):
-                if isinstance(result, Exception):
+            for name, result in zip(tasks, results, strict=True):
+                if isinstance(result, BaseException):
                     logger.error(
                         f"Failed to process {name}", error=str(result))
                     raise result
 
-                if name == "segments":
+                if name == "roads":
+                    roads_count = result
+                    logger.info("Roads processed", count=roads_count)
+                elif name == "segments":
                     segments_count = result
                     logger.info("Segments processed", count=segments_count)
                 elif name == "pois":
@@ -283,6 +387,9 @@ class RunPipelineUseCase:
                     zones_count = result
                     logger.info("Zones processed", count=zones_count)
 
+            if fused:
+                logger.info("Segments processed", count=segments_count)
+
         duration = perf_counter() - start
 
         return PipelineResult(
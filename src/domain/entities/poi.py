@@ -1,10 +1,31 @@
 """Point of Interest entity."""
 
-from dataclasses import dataclass, field
+from collections.abc import Mapping
+from dataclasses import dataclass
 
 from domain.enums import POICategory
 from domain.value_objects import Coordinates, Address, OperatingHours
 
+# amenity tag value -> category, built once from the grouped values
+_AMENITY_CATEGORIES: dict[str, POICategory] = {
+    amenity: category
+    for category, amenities in (
+        (POICategory.TRANSPORT, ("fuel", "parking", "bus_station", "taxi", "car_rental")),
+        (POICategory.FOOD, ("restaurant", "cafe", "fast_food", "bar", "food_court")),
+        (POICategory.LODGING, ("hotel", "guest_house", "motel", "hostel")),
+        (POICategory.HEALTH, ("hospital", "pharmacy", "clinic", "doctors", "dentist")),
+        (POICategory.SERVICES, ("bank", "atm", "post_office", "bureau_de_change")),
+        (POICategory.GOVERNMENT, ("police", "embassy", "townhall", "courthouse")),
+        (POICategory.EDUCATION, ("school", "university", "college", "library")),
+    )
+    for amenity in amenities
+}
+
+# shop tag values outside shopping; any other shop is SHOPPING
+_SHOP_CATEGORIES: dict[str, POICategory] = {
+    "pharmacy": POICategory.HEALTH,
+}
+
 
 @dataclass(slots=True)
 class POI:
@@ -38,7 +59,9 @@ class POI:
     opening_hours: OperatingHours | None = None
     price_range: int | None = None
     website: str | None = None
-    tags: dict[str, str] = field(default_factory=dict)
+    # None until a tag is stored; most entities never get one. Read-only:
+    # may be shared with other entities, so change it through add_tag
+    tags: Mapping[str, str] | None = None
     name_normalized: str | None = None
     search_text: str | None = None
     search_text_normalized: str | None = None
@@ -48,45 +71,26 @@ class POI:
     @classmethod
     def categorize(cls, amenity: str | None, shop: str | None) -> tuple[POICategory, str]:
         """Determine category and subcategory from OSM tags."""
-        # Transport
-        if amenity in ("fuel", "parking", "bus_station", "taxi", "car_rental"):
-            return POICategory.TRANSPORT, amenity
-
-        # Food
-        if amenity in ("restaurant", "cafe", "fast_food", "bar", "food_court"):
-            return POICategory.FOOD, amenity
-
-        # Lodging
-        if amenity in ("hotel", "guest_house", "motel", "hostel"):
-            return POICategory.LODGING, amenity
-
-        # Health
-        if amenity in ("hospital", "pharmacy", "clinic", "doctors", "dentist"):
-            return POICategory.HEALTH, amenity
-
-        # Services
-        if amenity in ("bank", "atm", "post_office", "bureau_de_change"):
-            return POICategory.SERVICES, amenity
-
-        # Government
-        if amenity in ("police", "embassy", "townhall", "courthouse"):
-            return POICategory.GOVERNMENT, amenity
-
-        # Education
-        if amenity in ("school", "university", "college", "library"):
-            return POICategory.EDUCATION, amenity
+        if amenity is not None:
+            category = _AMENITY_CATEGORIES.get(amenity)
+            if category is not None:
+                return category, amenity
 
         # Shopping (from shop tag)
         if shop:
-            if shop in ("supermarket", "convenience", "mall", "department_store"):
-                return POICategory.SHOPPING, shop
-            if shop in ("pharmacy",):
-                return POICategory.HEALTH, shop
-            return POICategory.SHOPPING, shop
+            return _SHOP_CATEGORIES.get(shop, POICategory.SHOPPING), shop
 
         # Default
         return POICategory.UNKNOWN, amenity or shop or "unknown"
 
+    def add_tag(self, key: str, value: str) -> None:
+        """Store an OSM tag.
+
+        The tag dict is replaced rather than updated in place: readers may
+        share one dict between entities with identical tags.
+        """
+        self.tags = {**(self.tags or {}), key: value}
+
     @property
     def is_24_7(self) -> bool:
         """Whether the POI is open 24/7 based on parsed opening hours."""
@@ -1,18 +1,36 @@
 """Road entity."""
 
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 
 from domain.enums import RoadType, Surface, Smoothness
-from domain.value_objects import Coordinates, RoadPenalty
-
-
-@dataclass(slots=True)
+from domain.value_objects import Coordinates, RoadPenalty, polyline_length
+
+# Default speed by road type (Madagascar context)
+DEFAULT_SPEEDS_KMH: dict[RoadType, int] = {
+    RoadType.MOTORWAY: 110,
+    RoadType.TRUNK: 90,
+    RoadType.PRIMARY: 80,
+    RoadType.SECONDARY: 60,
+    RoadType.TERTIARY: 50,
+    RoadType.RESIDENTIAL: 30,
+    RoadType.UNCLASSIFIED: 40,
+    RoadType.TRACK: 20,
+    RoadType.PATH: 10,
+}
+
+
+@dataclass(frozen=True, slots=True)
 class Road:
     """Road entity representing an OSM way with highway tag.
 
+    Frozen so the memoized penalty and effective speed cannot go stale:
+    build a new road (dataclasses.replace) to change its attributes.
+
     Attributes:
         id: Unique identifier (from OSM)
-        geometry: List of coordinates forming the road LineString
+        geometry: Coordinates forming the road LineString (a list, or
+            PackedCoordinates from the OSM reader)
         road_type: Classification (primary, secondary, etc.)
         surface: Road surface material
         smoothness: Road surface condition
@@ -23,7 +41,7 @@ class Road:
     """
 
     id: int
-    geometry: list[Coordinates]
+    geometry: Sequence[Coordinates]
     road_type: RoadType
     surface: Surface = Surface.UNKNOWN
     smoothness: Smoothness = Smoothness.UNKNOWN
@@ -31,20 +49,31 @@ class Road:
     lanes: int = 2
     oneway: bool = False
     max_speed: int | None = None
-    tags: dict[str, str] = field(default_factory=dict)
+    # None until a tag is stored; most entities never get one. Read-only:
+    # may be shared with other entities, so change it through add_tag
+    tags: Mapping[str, str] | None = None
+    # Derived values, computed on first access
+    _penalty: RoadPenalty | None = field(default=None, init=False, repr=False, compare=False)
+    _effective_speed: int | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate road has at least 2 points."""
         if len(self.geometry) < 2:
             raise ValueError("Road must have at least 2 coordinate points")
 
+    def add_tag(self, key: str, value: str) -> None:
+        """Store an OSM tag.
+
+        The tag dict is replaced rather than updated in place: readers may
+        share one dict between entities with identical tags. Tags do not
+        feed any derived value, so this is the one field that may change.
+        """
+        object.__setattr__(self, "tags", {**(self.tags or {}), key: value})
+
     @property
     def length(self) -> float:
         """Calculate total road length in meters."""
-        total = 0.0
-        for i in range(len(self.geometry) - 1):
-            total += self.geometry[i].distance_to(self.geometry[i + 1])
-        return total
+        return polyline_length(self.geometry)
 
     @property
     def start(self) -> Coordinates:
@@ -59,32 +88,29 @@ class Road:
     @property
     def default_speed_kmh(self) -> int:
         """Get default speed based on road type (Madagascar context)."""
-        defaults = {
-            RoadType.MOTORWAY: 110,
-            RoadType.TRUNK: 90,
-            RoadType.PRIMARY: 80,
-            RoadType.SECONDARY: 60,
-            RoadType.TERTIARY: 50,
-            RoadType.RESIDENTIAL: 30,
-            RoadType.UNCLASSIFIED: 40,
-            RoadType.TRACK: 20,
-            RoadType.PATH: 10,
-        }
-        return defaults.get(self.road_type, 40)
+        return DEFAULT_SPEEDS_KMH.get(self.road_type, 40)
 
     @property
     def effective_speed_kmh(self) -> int:
         """Get max_speed if set, otherwise default speed."""
-        return self.max_speed if self.max_speed else self.default_speed_kmh
+        speed = self._effective_speed
+        if speed is None:
+            speed = self.max_speed if self.max_speed else self.default_speed_kmh
+            object.__setattr__(self, "_effective_speed", speed)
+        return speed
 
     @property
     def penalty(self) -> RoadPenalty:
-        """Compute penalty factors for this road based on surface and smoothness."""
-        return RoadPenalty.from_road_attributes(
-            surface=self.surface,
-            smoothness=self.smoothness,
-            is_rainy_season=False,
-        )
+        """Penalty factors for this road based on surface and smoothness."""
+        penalty = self._penalty
+        if penalty is None:
+            penalty = RoadPenalty.from_road_attributes(
+                surface=self.surface,
+                smoothness=self.smoothness,
+                is_rainy_season=False,
+            )
+            object.__setattr__(self, "_penalty", penalty)
+        return penalty
 
     @property
     def surface_factor(self) -> float:
@@ -1,11 +1,11 @@
 """Road segment entity for routing graph."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from domain.value_objects import Coordinates, RoadPenalty
 
 
-@dataclass(slots=True)
+@dataclass(frozen=True, slots=True)
 class Segment:
     """Road segment for routing graph.
 
@@ -31,24 +31,33 @@ class Segment:
     penalty: RoadPenalty
     oneway: bool = False
     base_speed: int = 50
+    # Routing invariants, computed once at construction (hence frozen)
+    _effective_speed: float = field(init=False, repr=False, compare=False)
+    _travel_time: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute effective speed and travel time."""
+        speed = self.penalty.apply_to_speed(self.base_speed)
+        speed_ms = speed * 1000 / 3600  # km/h to m/s
+        object.__setattr__(self, "_effective_speed", speed)
+        object.__setattr__(
+            self, "_travel_time", float("inf") if speed_ms <= 0 else self.length / speed_ms
+        )
 
     @property
     def effective_speed_kmh(self) -> float:
-        """Calculate effective speed after applying penalties."""
-        return self.penalty.apply_to_speed(self.base_speed)
+        """Effective speed after applying penalties."""
+        return self._effective_speed
 
     @property
     def travel_time_seconds(self) -> float:
-        """Calculate travel time in seconds."""
-        speed_ms = self.effective_speed_kmh * 1000 / 3600  # km/h to m/s
-        if speed_ms <= 0:
-            return float("inf")
-        return self.length / speed_ms
+        """Travel time in seconds."""
+        return self._travel_time
 
     @property
     def cost(self) -> float:
         """Routing cost (travel time in seconds). Used for pathfinding."""
-        return self.travel_time_seconds
+        return self._travel_time
 
     def reverse(self) -> "Segment":
         """Create reversed segment (for bidirectional roads)."""
@@ -1,9 +1,19 @@
 """Administrative zone entity."""
 
+from collections.abc import Iterable, Mapping, Sequence
 from dataclasses import dataclass, field
 from math import cos, degrees, radians
 
-from domain.value_objects import Coordinates
+from domain.value_objects import Coordinates, lon_lat_columns
+
+# Ray-cast edge as (xi, yi, yj, dx/dy): the inverse slope is taken once
+# when the index is built instead of dividing on every test
+_Edge = tuple[float, float, float, float]
+
+# Horizontal bands for point queries: about this many edges per band,
+# capped so long polygons don't over-allocate
+_EDGES_PER_BAND = 8
+_MAX_BANDS = 1024
 
 
 @dataclass(slots=True)
@@ -12,7 +22,8 @@ class Zone:
 
     Attributes:
         id: Unique identifier (from OSM)
-        geometry: List of coordinates forming the polygon boundary
+        geometry: Coordinates forming the polygon boundary (a list, or
+            PackedCoordinates from the OSM reader)
         zone_type: Administrative type (country, region, district, commune, fokontany)
         name: Official name
         iso_code: ISO 3166-2 code (optional, e.g., MG-A for Antananarivo)
@@ -22,37 +33,102 @@ class Zone:
     """
 
     id: int
-    geometry: list[Coordinates]
+    geometry: Sequence[Coordinates]
     zone_type: str
     name: str
     level: int
     iso_code: str | None = None
     population: int | None = None
     parent_zone_id: int | None = None
-    tags: dict[str, str] = field(default_factory=dict)
+    # None until a tag is stored; most entities never get one. Read-only:
+    # may be shared with other entities, so change it through add_tag
+    tags: Mapping[str, str] | None = None
+    # Point-query index (edges bucketed by latitude band, bounding box),
+    # built on first use
+    _bands: list[list[_Edge]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _band_scale: float = field(default=0.0, init=False, repr=False, compare=False)
+    _bbox: tuple[float, float, float, float] = field(
+        default=(0.0, 0.0, 0.0, 0.0), init=False, repr=False, compare=False
+    )
+    # (area, centroid), computed on first access
+    _area_centroid: tuple[float, Coordinates] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Validate zone has at least 3 points (triangle)."""
         if len(self.geometry) < 3:
             raise ValueError("Zone must have at least 3 coordinate points")
 
+    def add_tag(self, key: str, value: str) -> None:
+        """Store an OSM tag.
+
+        The tag dict is replaced rather than updated in place: readers may
+        share one dict between entities with identical tags.
+        """
+        self.tags = {**(self.tags or {}), key: value}
+
+    def _band_index(self, y: float) -> int:
+        """Latitude band holding y (monotonic in y, clamped to the last band)."""
+        assert self._bands is not None
+        return min(int((y - self._bbox[1]) * self._band_scale), len(self._bands) - 1)
+
+    def _prepare_point_queries(self) -> list[list[_Edge]]:
+        """Build the point-query index: bounding box plus edges per band.
+
+        Each edge is filed under every latitude band its y-range overlaps,
+        so a query only tests the edges of its own band. Horizontal edges
+        are dropped: they can never cross the test ray. The geometry is
+        treated as immutable once queried.
+        """
+        xs, ys = lon_lat_columns(self.geometry)
+        min_y, max_y = min(ys), max(ys)
+        self._bbox = (min(xs), min_y, max(xs), max_y)
+
+        edges = [
+            (xi, yi, yj, (xj - xi) / (yj - yi))
+            for xi, yi, xj, yj in zip(xs, ys, xs[-1:] + xs[:-1], ys[-1:] + ys[:-1], strict=True)
+            if yi != yj
+        ]
+        band_count = min(max(1, len(edges) // _EDGES_PER_BAND), _MAX_BANDS)
+        self._band_scale = band_count / (max_y - min_y) if max_y > min_y else 0.0
+        self._bands = bands = [[] for _ in range(band_count)]
+
+        band_index = self._band_index
+        for edge in edges:
+            _, yi, yj, _ = edge
+            low, high = (yi, yj) if yi < yj else (yj, yi)
+            for band in range(band_index(low), band_index(high) + 1):
+                bands[band].append(edge)
+        return bands
+
     def contains_point(self, point: Coordinates) -> bool:
         """Check if a point is inside this zone (ray casting algorithm)."""
-        x, y = point.lon, point.lat
-        n = len(self.geometry)
-        inside = False
+        bands = self._bands
+        if bands is None:
+            bands = self._prepare_point_queries()
 
-        j = n - 1
-        for i in range(n):
-            xi, yi = self.geometry[i].lon, self.geometry[i].lat
-            xj, yj = self.geometry[j].lon, self.geometry[j].lat
+        x, y = point.lon, point.lat
+        min_x, min_y, max_x, max_y = self._bbox
+        if x < min_x or x > max_x or y < min_y or y > max_y:
+            return False
 
-            if ((yi > y) != (yj > y)) and (x < (xj - xi) * (y - yi) / (yj - yi) + xi):
+        # Inlined _band_index: this runs once per query
+        band = min(int((y - min_y) * self._band_scale), len(bands) - 1)
+        inside = False
+        for xi, yi, yj, inverse_slope in bands[band]:
+            if ((yi > y) != (yj > y)) and (x < inverse_slope * (y - yi) + xi):
                 inside = not inside
-            j = i
 
         return inside
 
+    def contains_points(self, points: Iterable[Coordinates]) -> list[bool]:
+        """Check many points against this zone (e.g. assigning POIs to zones)."""
+        contains = self.contains_point
+        return [contains(point) for point in points]
+
     @property
     def area(self) -> float:
         """Approximate polygon area in square meters (equirectangular projection)."""
@@ -66,37 +142,46 @@ class Zone:
         return centroid
 
     def _planar_area_and_centroid(self) -> tuple[float, Coordinates]:
-        """Compute area and centroid using a simple planar projection."""
-        coords = self.geometry
-        if coords[0] != coords[-1]:
-            coords = [*coords, coords[0]]
+        """Compute area and centroid using a simple planar projection.
+
+        One pass over the ring projects each vertex once and accumulates
+        the shoelace and centroid sums together; the result is cached, as
+        the writer reads both area and centroid.
+        """
+        cached = self._area_centroid
+        if cached is not None:
+            return cached
+
+        lons, lats = lon_lat_columns(self.geometry)
+        if lons[0] != lons[-1] or lats[0] != lats[-1]:
+            lons = [*lons, lons[0]]
+            lats = [*lats, lats[0]]
 
-        lats = [c.lat for c in coords]
         lat0 = radians(sum(lats) / len(lats))
+        cos_lat0 = cos(lat0)
 
         R = 6_371_000.0  # Earth radius in meters
-        points = [
-            (radians(c.lon) * R * cos(lat0), radians(c.lat) * R) for c in coords
-        ]
 
         area2 = 0.0
         cx = 0.0
         cy = 0.0
-        for i in range(len(points) - 1):
-            x0, y0 = points[i]
-            x1, y1 = points[i + 1]
+        x0, y0 = radians(lons[0]) * R * cos_lat0, radians(lats[0]) * R
+        for lon, lat in zip(lons[1:], lats[1:], strict=True):
+            x1, y1 = radians(lon) * R * cos_lat0, radians(lat) * R
             cross = x0 * y1 - x1 * y0
             area2 += cross
             cx += (x0 + x1) * cross
             cy += (y0 + y1) * cross
+            x0, y0 = x1, y1
 
         if area2 == 0.0:
-            return 0.0, coords[0]
-
-        area = abs(area2) / 2.0
-        cx /= 3.0 * area2
-        cy /= 3.0 * area2
-
-        lon = degrees(cx / (R * cos(lat0)))
-        lat = degrees(cy / R)
-        return area, Coordinates(lat=lat, lon=lon)
+            result = (0.0, self.geometry[0])
+        else:
+            cx /= 3.0 * area2
+            cy /= 3.0 * area2
+            lon = degrees(cx / (R * cos_lat0))
+            lat = degrees(cy / R)
+            result = (abs(area2) / 2.0, Coordinates(lat=lat, lon=lon))
+
+        self._area_centroid = result
+        return result
@@ -1,5 +1,22 @@
 """Domain services."""
 
-from domain.services.segmenter import split_roads_into_segments
+from domain.services.graph import SegmentArrays, build_segment_arrays
+from domain.services.segmenter import (
+    count_road_coordinates,
+    iter_road_segments,
+    keep_shared_coordinates,
+    split_road,
+    split_roads_into_segments,
+    tally_road_coordinates,
+)
 
-__all__ = ["split_roads_into_segments"]
+__all__ = [
+    "split_roads_into_segments",
+    "count_road_coordinates",
+    "tally_road_coordinates",
+    "iter_road_segments",
+    "keep_shared_coordinates",
+    "split_road",
+    "SegmentArrays",
+    "build_segment_arrays",
+]
@@ -3,73 +3,143 @@
 from __future__ import annotations
 
 import hashlib
-from collections import defaultdict
-from typing import Iterable
+import struct
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from itertools import chain
 
 from domain.entities import Road, Segment
-from domain.value_objects import RoadPenalty, Coordinates
+from domain.value_objects import Coordinates, iter_edge_lengths, iter_lat_lon
+
+CoordCounts = dict[tuple[float, float], int]
+
+
+_pack_segment_key = struct.Struct("<qdddd").pack
 
 
 def _segment_id(road_id: int, start: Coordinates, end: Coordinates) -> int:
-    """Generate a stable segment id based on endpoints."""
-    payload = f"{road_id}:{start.lat}:{start.lon}:{end.lat}:{end.lon}".encode("utf-8")
-    digest = hashlib.sha1(payload).digest()[:8]
+    """Generate a stable segment id based on endpoints.
+
+    Hashes the packed binary key with BLAKE2b (8-byte digest): no string
+    formatting, and much cheaper than a cryptographic-strength SHA-1.
+    """
+    payload = _pack_segment_key(road_id, start.lat, start.lon, end.lat, end.lon)
+    digest = hashlib.blake2b(payload, digest_size=8).digest()
     value = int.from_bytes(digest, byteorder="big", signed=False)
     return value & 0x7FFF_FFFF_FFFF_FFFF
 
 
-def split_roads_into_segments(roads: Iterable[Road]) -> list[Segment]:
-    """Split roads at shared coordinates to form routing segments."""
-    road_list = list(roads)
-    if not road_list:
-        return []
-
-    coord_counts: dict[tuple[float, float], int] = defaultdict(int)
-    for road in road_list:
-        for coord in road.geometry:
-            coord_counts[(coord.lat, coord.lon)] += 1
-
-    segments: list[Segment] = []
-    for road in road_list:
-        breakpoints: list[int] = []
-        for idx, coord in enumerate(road.geometry):
-            key = (coord.lat, coord.lon)
-            if idx == 0 or idx == len(road.geometry) - 1 or coord_counts[key] > 1:
-                breakpoints.append(idx)
-
-        if len(breakpoints) < 2:
+def tally_road_coordinates(road: Road, coord_counts: CoordCounts) -> None:
+    """Add one road's coordinates to a running coordinate count."""
+    get = coord_counts.get
+    for key in iter_lat_lon(road.geometry):
+        coord_counts[key] = get(key, 0) + 1
+
+
+def keep_shared_coordinates(coord_counts: CoordCounts) -> CoordCounts:
+    """Drop coordinates used by a single road vertex.
+
+    Segmenting only asks whether a coordinate is shared, and most vertices
+    are not, so this keeps a small fraction of the full tally alive for
+    the segment pass.
+    """
+    return {key: count for key, count in coord_counts.items() if count > 1}
+
+
+def count_road_coordinates(roads: Iterable[Road]) -> CoordCounts:
+    """Count coordinates appearing more than once across all roads.
+
+    Returns:
+        Counts for shared coordinates only (see keep_shared_coordinates)
+    """
+    # Counter over one flat stream of keys: iteration, key building and
+    # increments all run in C
+    coord_counts = Counter(
+        chain.from_iterable(iter_lat_lon(road.geometry) for road in roads)
+    )
+    return keep_shared_coordinates(coord_counts)
+
+
+def split_road(road: Road, coord_counts: CoordCounts) -> Iterator[Segment]:
+    """Split a single road at coordinates shared with other roads.
+
+    Args:
+        road: Road to split
+        coord_counts: Coordinate counts over the full road set, from
+            count_road_coordinates or tally_road_coordinates (singletons
+            may be dropped)
+
+    Yields:
+        The road's routing segments, in geometry order
+    """
+    geometry = road.geometry
+    last = len(geometry) - 1
+    if last < 1:
+        return
+
+    # Shared with the road (and its writer row) rather than rebuilt
+    penalty = road.penalty
+    base_speed = road.effective_speed_kmh
+    road_id = road.id
+    oneway = road.oneway
+    count = coord_counts.get
+
+    # Single walk over the road: accumulate length edge by edge and cut
+    # a segment at every shared coordinate and at the final point. Points
+    # are only built at cuts, from the (lat, lon) key already in hand
+    new_point = Coordinates.unchecked
+    keys = iter_lat_lon(geometry)
+    next(keys)
+    start = geometry[0]
+    length = 0.0
+    edges = zip(iter_edge_lengths(geometry), keys, strict=True)
+    for idx, (edge_length, key) in enumerate(edges, 1):
+        length += edge_length
+        if idx != last and count(key, 0) <= 1:
             continue
 
-        penalty = RoadPenalty.from_road_attributes(
-            surface=road.surface,
-            smoothness=road.smoothness,
-            is_rainy_season=False,
+        coord = new_point(*key)
+
+        yield Segment(
+            id=_segment_id(road_id, start, coord),
+            road_id=road_id,
+            start=start,
+            end=coord,
+            length=length,
+            penalty=penalty,
+            oneway=oneway,
+            base_speed=base_speed,
         )
-        base_speed = road.effective_speed_kmh
-
-        for i in range(len(breakpoints) - 1):
-            start_idx = breakpoints[i]
-            end_idx = breakpoints[i + 1]
-            if end_idx - start_idx < 1:
-                continue
-
-            coords = road.geometry[start_idx : end_idx + 1]
-            length = 0.0
-            for j in range(len(coords) - 1):
-                length += coords[j].distance_to(coords[j + 1])
-
-            start = coords[0]
-            end = coords[-1]
-            segment = Segment(
-                id=_segment_id(road.id, start, end),
-                road_id=road.id,
-                start=start,
-                end=end,
-                length=length,
-                penalty=penalty,
-                oneway=road.oneway,
-                base_speed=base_speed,
-            )
-            segments.append(segment)
-
-    return segments
+        start = coord
+        length = 0.0
+
+
+def iter_road_segments(
+    roads: Iterable[Road],
+    coord_counts: CoordCounts,
+) -> Iterator[Segment]:
+    """Lazily split roads at shared coordinates.
+
+    Args:
+        roads: Roads to split (may be a fresh pass over the source)
+        coord_counts: Coordinate counts over the full road set
+
+    Yields:
+        Routing segments, road by road
+    """
+    for road in roads:
+        yield from split_road(road, coord_counts)
+
+
+def split_roads_into_segments(roads: Iterable[Road]) -> Iterator[Segment]:
+    """Split roads at shared coordinates to form routing segments.
+
+    Roads are held in memory for the counting pass; segments are yielded
+    lazily so callers can stream them straight into a writer.
+    """
+    road_list = list(roads)
+    if not road_list:
+        return
+
+    coord_counts = count_road_coordinates(road_list)
+    yield from iter_road_segments(road_list, coord_counts)
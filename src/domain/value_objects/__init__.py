@@ -1,12 +1,26 @@
 """Domain value objects - Immutable domain values."""
 
-from domain.value_objects.coordinates import Coordinates
+from domain.value_objects.coordinates import (
+    Coordinates,
+    PackedCoordinates,
+    haversine_m,
+    iter_edge_lengths,
+    iter_lat_lon,
+    lon_lat_columns,
+    polyline_length,
+)
 from domain.value_objects.penalty import RoadPenalty
 from domain.value_objects.operating_hours import OperatingHours, TimeRange
 from domain.value_objects.address import Address
 
 __all__ = [
     "Coordinates",
+    "PackedCoordinates",
+    "haversine_m",
+    "iter_edge_lengths",
+    "iter_lat_lon",
+    "lon_lat_columns",
+    "polyline_length",
     "RoadPenalty",
     "OperatingHours",
     "TimeRange",
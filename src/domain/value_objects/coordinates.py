@@ -1,7 +1,30 @@
 """Coordinates value object."""
 
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass
-from math import radians, sin, cos, sqrt, atan2
+from itertools import islice
+from math import asin, cos, radians, sin, sqrt
+from operator import attrgetter
+from typing import overload
+
+EARTH_RADIUS_M = 6_371_000
+
+_new_object = object.__new__
+
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in meters between two points given in degrees.
+
+    Uses 2 * asin(sqrt(a)), equivalent to the atan2 form for the short
+    distances between road vertices and roughly half the cost.
+    """
+    lat1, lon1 = radians(lat1), radians(lon1)
+    lat2, lon2 = radians(lat2), radians(lon2)
+    a = sin((lat2 - lat1) / 2) ** 2 + cos(lat1) * cos(lat2) * sin((lon2 - lon1) / 2) ** 2
+    return EARTH_RADIUS_M * 2 * asin(sqrt(a))
 
 
 @dataclass(frozen=True, slots=True)
@@ -18,20 +41,41 @@ class Coordinates:
         if not -180 <= self.lon <= 180:
             raise ValueError(f"Longitude must be between -180 and 180, got {self.lon}")
 
-    def distance_to(self, other: "Coordinates") -> float:
-        """Calculate distance to another point in meters using Haversine formula."""
-        R = 6_371_000  # Earth's radius in meters
+    @classmethod
+    def unchecked(cls, lat: float, lon: float) -> Coordinates:
+        """Build a coordinate without bounds validation.
 
-        lat1, lon1 = radians(self.lat), radians(self.lon)
-        lat2, lon2 = radians(other.lat), radians(other.lon)
+        For trusted sources only: OSM node locations and points derived
+        from already-valid coordinates. Roughly 2.5x cheaper than the
+        validating constructor.
+        """
+        coord = _new_object(cls)
+        _set_lat(coord, lat)
+        _set_lon(coord, lon)
+        return coord
 
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
+    @classmethod
+    def unchecked_from_lon_lat(cls, values: Iterable[float]) -> list[Coordinates]:
+        """Build a polyline from packed lon, lat values without validation.
 
-        a = sin(dlat / 2) ** 2 + cos(lat1) * cos(lat2) * sin(dlon / 2) ** 2
-        c = 2 * atan2(sqrt(a), sqrt(1 - a))
+        Same as calling unchecked on every pair, without the per-vertex
+        method call. For trusted sources only, as unchecked. A dangling
+        lon without its lat raises ValueError.
+        """
+        new, set_lat, set_lon = _new_object, _set_lat, _set_lon
+        points: list[Coordinates] = []
+        append = points.append
+        pairs = iter(values)
+        for lon, lat in zip(pairs, pairs, strict=True):
+            point = new(cls)
+            set_lat(point, lat)
+            set_lon(point, lon)
+            append(point)
+        return points
 
-        return R * c
+    def distance_to(self, other: Coordinates) -> float:
+        """Calculate distance to another point in meters using Haversine formula."""
+        return haversine_m(self.lat, self.lon, other.lat, other.lon)
 
     def as_tuple(self) -> tuple[float, float]:
         """Return as (lat, lon) tuple."""
@@ -40,3 +84,138 @@ class Coordinates:
     def as_geojson(self) -> list[float]:
         """Return as GeoJSON [lon, lat] format."""
         return [self.lon, self.lat]
+
+
+# Frozen dataclass fields cannot be assigned normally; the slot descriptors
+# set them directly, skipping the frozen __setattr__ guard altogether
+_set_lat = Coordinates.lat.__set__  # type: ignore[attr-defined]
+_set_lon = Coordinates.lon.__set__  # type: ignore[attr-defined]
+
+
+class PackedCoordinates(Sequence[Coordinates]):
+    """Read-only polyline stored as packed float64 lon, lat values.
+
+    Coordinates objects are only built when an item is read, so code that
+    works on the raw values (see iter_lat_lon and lon_lat) never pays for
+    them. Items are built unchecked: use for trusted sources only.
+    """
+
+    __slots__ = ("_values",)
+
+    def __init__(self, values: Iterable[float]) -> None:
+        """Wrap packed values, as in RawWay.coords.
+
+        Args:
+            values: lon0, lat0, lon1, lat1, ...; a float64 array is kept
+                as is (not copied) and must not be modified afterwards
+
+        Raises:
+            ValueError: If the values do not form whole pairs
+        """
+        if not (isinstance(values, array) and values.typecode == "d"):
+            values = array("d", values)
+        if len(values) % 2:
+            raise ValueError("Packed coordinates need an even number of values")
+        self._values: array[float] = values
+
+    @property
+    def lon_lat(self) -> array[float]:
+        """The packed lon, lat values (read-only by convention)."""
+        return self._values
+
+    def __len__(self) -> int:
+        """Number of points."""
+        return len(self._values) // 2
+
+    @overload
+    def __getitem__(self, index: int) -> Coordinates: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> PackedCoordinates: ...
+
+    def __getitem__(self, index: int | slice) -> Coordinates | PackedCoordinates:
+        """Build the point at index, or a packed copy of a slice."""
+        if isinstance(index, slice):
+            points = range(len(self))[index]
+            if points.step == 1:
+                return PackedCoordinates(self._values[2 * points.start : 2 * points.stop])
+            return PackedCoordinates([v for i in points for v in self._values[2 * i : 2 * i + 2]])
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("PackedCoordinates index out of range")
+        return Coordinates.unchecked(self._values[2 * index + 1], self._values[2 * index])
+
+    def __iter__(self) -> Iterator[Coordinates]:
+        """Build every point, in order."""
+        return iter(Coordinates.unchecked_from_lon_lat(self._values))
+
+    def __eq__(self, other: object) -> bool:
+        """Compare point by point with any sequence of coordinates."""
+        if isinstance(other, PackedCoordinates):
+            return self._values == other._values
+        if isinstance(other, Sequence):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Show the points as a list would."""
+        return f"PackedCoordinates({list(self)!r})"
+
+
+# (lat, lon) pair of a coordinate, built in C
+_lat_lon = attrgetter("lat", "lon")
+
+
+def iter_lat_lon(points: Sequence[Coordinates]) -> Iterator[tuple[float, float]]:
+    """Yield (lat, lon) of each point without building packed points."""
+    if isinstance(points, PackedCoordinates):
+        values = points.lon_lat
+        return zip(islice(values, 1, None, 2), islice(values, 0, None, 2), strict=True)
+    return map(_lat_lon, points)
+
+
+def lon_lat_columns(points: Sequence[Coordinates]) -> tuple[Sequence[float], Sequence[float]]:
+    """Longitudes and latitudes of the points as two columns.
+
+    Packed points are sliced in C, without building Coordinates.
+    """
+    if isinstance(points, PackedCoordinates):
+        values = points.lon_lat
+        return values[0::2], values[1::2]
+    return [c.lon for c in points], [c.lat for c in points]
+
+
+def iter_edge_lengths(points: Sequence[Coordinates]) -> Iterator[float]:
+    """Yield the Haversine length in meters of each consecutive point pair.
+
+    Same result as haversine_m on every pair, but each vertex is
+    converted to radians (and its latitude cosine taken) once rather than
+    once per adjacent edge, with no per-edge method call.
+    """
+    pairs = iter_lat_lon(points)
+    first = next(pairs, None)
+    if first is None:
+        return
+
+    lat1, lon1 = radians(first[0]), radians(first[1])
+    cos_lat1 = cos(lat1)
+    for lat2, lon2 in pairs:
+        lat2, lon2 = radians(lat2), radians(lon2)
+        cos_lat2 = cos(lat2)
+
+        a = sin((lat2 - lat1) / 2) ** 2 + cos_lat1 * cos_lat2 * sin((lon2 - lon1) / 2) ** 2
+        yield EARTH_RADIUS_M * 2 * asin(sqrt(a))
+
+        lat1, lon1, cos_lat1 = lat2, lon2, cos_lat2
+
+
+def polyline_length(points: Sequence[Coordinates]) -> float:
+    """Total Haversine length in meters of a polyline."""
+    total = 0.0
+    for length in iter_edge_lengths(points):
+        total += length
+    return total
@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from datetime import time
 from typing import Self
 
+_DAY_INDEX = {"mo": 0, "tu": 1, "we": 2, "th": 3, "fr": 4, "sa": 5, "su": 6}
+
 
 @dataclass(frozen=True, slots=True)
 class TimeRange:
@@ -51,7 +53,7 @@ class OperatingHours:
             return cls(raw=raw, schedule={}, is_24_7=True)
 
         schedule: dict[int, list[TimeRange]] = {}
-        day_map = {"mo": 0, "tu": 1, "we": 2, "th": 3, "fr": 4, "sa": 5, "su": 6}
+        day_map = _DAY_INDEX
 
         # Split by semicolon for multiple rules
         for rule in raw.split(";"):
@@ -81,17 +83,15 @@ class OperatingHours:
                     if day_idx >= 0:
                         days = [day_idx]
 
-                # Parse time range
-                if "-" in time_part:
+                # Parse time range (skipped when no day matched)
+                if days and "-" in time_part:
                     start_str, end_str = time_part.split("-")
                     start_time = time.fromisoformat(start_str)
                     end_time = time.fromisoformat(end_str)
                     time_range = TimeRange(start=start_time, end=end_time)
 
                     for day in days:
-                        if day not in schedule:
-                            schedule[day] = []
-                        schedule[day].append(time_range)
+                        schedule.setdefault(day, []).append(time_range)
             except (ValueError, IndexError):
                 # Skip unparseable rules
                 continue
@@ -1,6 +1,7 @@
 """Road penalty value object for speed calculations."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cache
 
 from domain.enums import Surface, Smoothness
 
@@ -44,34 +45,71 @@ class RoadPenalty:
     surface_factor: float = 1.0
     smoothness_factor: float = 1.0
     rainy_season_factor: float = 1.0
+    # Combined factor, fixed at construction since the penalty is frozen
+    _multiplier: float = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Validate factors are in valid range."""
-        for name, value in [
-            ("surface_factor", self.surface_factor),
-            ("smoothness_factor", self.smoothness_factor),
-            ("rainy_season_factor", self.rainy_season_factor),
-        ]:
-            if not 0.0 <= value <= 1.0:
-                raise ValueError(f"{name} must be between 0.0 and 1.0, got {value}")
+        """Validate factors are in valid range and precompute the multiplier."""
+        if not 0.0 <= self.surface_factor <= 1.0:
+            raise ValueError(
+                f"surface_factor must be between 0.0 and 1.0, got {self.surface_factor}"
+            )
+        if not 0.0 <= self.smoothness_factor <= 1.0:
+            raise ValueError(
+                f"smoothness_factor must be between 0.0 and 1.0, got {self.smoothness_factor}"
+            )
+        if not 0.0 <= self.rainy_season_factor <= 1.0:
+            raise ValueError(
+                f"rainy_season_factor must be between 0.0 and 1.0, got {self.rainy_season_factor}"
+            )
+
+        object.__setattr__(
+            self,
+            "_multiplier",
+            self.surface_factor * self.smoothness_factor * self.rainy_season_factor,
+        )
 
     @property
     def effective_multiplier(self) -> float:
-        """Calculate combined speed multiplier."""
-        return self.surface_factor * self.smoothness_factor * self.rainy_season_factor
+        """Combined speed multiplier."""
+        return self._multiplier
 
     def apply_to_speed(self, base_speed: float) -> float:
         """Apply penalty to a base speed, returning effective speed in km/h."""
-        return base_speed * self.effective_multiplier
+        return base_speed * self._multiplier
+
+    @classmethod
+    def _unchecked(
+        cls,
+        surface_factor: float,
+        smoothness_factor: float,
+        rainy_season_factor: float,
+    ) -> "RoadPenalty":
+        """Build a penalty from factors known to be in range, skipping validation."""
+        penalty = object.__new__(cls)
+        object.__setattr__(penalty, "surface_factor", surface_factor)
+        object.__setattr__(penalty, "smoothness_factor", smoothness_factor)
+        object.__setattr__(penalty, "rainy_season_factor", rainy_season_factor)
+        object.__setattr__(
+            penalty,
+            "_multiplier",
+            surface_factor * smoothness_factor * rainy_season_factor,
+        )
+        return penalty
 
     @classmethod
+    @cache
     def from_road_attributes(
         cls,
         surface: Surface,
         smoothness: Smoothness,
         is_rainy_season: bool = False,
     ) -> "RoadPenalty":
-        """Create penalty from road surface and smoothness attributes."""
+        """Create penalty from road surface and smoothness attributes.
+
+        Results are interned: there are only a few hundred attribute
+        combinations, and the frozen penalty is safe to share between roads.
+        """
         surface_factor = SURFACE_FACTORS.get(surface, 0.6)
         smoothness_factor = SMOOTHNESS_FACTORS.get(smoothness, 0.7)
 
@@ -80,8 +118,5 @@ class RoadPenalty:
         if is_rainy_season and surface not in (Surface.ASPHALT, Surface.PAVED, Surface.CONCRETE):
             rainy_factor = RAINY_SEASON_UNPAVED_FACTOR
 
-        return cls(
-            surface_factor=surface_factor,
-            smoothness_factor=smoothness_factor,
-            rainy_season_factor=rainy_factor,
-        )
+        # Factors come from the tables above, so they are already in range
+        return cls._unchecked(surface_factor, smoothness_factor, rainy_factor)
@@ -3,6 +3,8 @@
 import asyncio
 import argparse
 
+from psycopg_pool import AsyncConnectionPool
+
 from application import ComputeZoneHierarchyUseCase
 from infrastructure.config import get_settings
 from infrastructure.logging import setup_logging, get_logger
@@ -11,6 +13,17 @@ from infrastructure.postgres import create_pool
 logger = get_logger(__name__)
 
 
+def _positive_int(raw: str) -> int:
+    """argparse type for counts of at least 1."""
+    try:
+        value = int(raw)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{raw}'") from None
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run data enrichment operations.")
     parser.add_argument(
@@ -18,24 +31,46 @@ def _parse_args() -> argparse.Namespace:
         action="store_true",
         help="Compute zone parent_zone_id relationships via spatial containment",
     )
+    parser.add_argument(
+        "--repeat",
+        type=_positive_int,
+        default=1,
+        metavar="N",
+        help="Run the operations N times, reusing one connection pool",
+    )
     return parser.parse_args()
 
 
-async def run(compute_hierarchy: bool) -> None:
+async def enrich(pool: AsyncConnectionPool, compute_hierarchy: bool) -> None:
+    """Run enrichment operations on an open pool.
+
+    Long-running callers can keep one pool and call this repeatedly, so
+    connection setup is paid once rather than per run.
+
+    Args:
+        pool: Open database connection pool
+        compute_hierarchy: Whether to compute zone hierarchy
+    """
+    if compute_hierarchy:
+        hierarchy_use_case = ComputeZoneHierarchyUseCase(pool)
+        await hierarchy_use_case.execute()
+
+
+async def run(compute_hierarchy: bool, repeat: int = 1) -> None:
     """Run enrichment operations.
     
     Args:
         compute_hierarchy: Whether to compute zone hierarchy
+        repeat: Number of runs sharing the connection pool
     """
     settings = get_settings()
     setup_logging(settings.log_level, settings.log_format)
 
-    logger.info("Starting enrichment operations")
+    logger.info("Starting enrichment operations", repeat=repeat)
 
     async with create_pool(settings) as pool:
-        if compute_hierarchy:
-            hierarchy_use_case = ComputeZoneHierarchyUseCase(pool)
-            await hierarchy_use_case.execute()
+        for _ in range(repeat):
+            await enrich(pool, compute_hierarchy)
 
     logger.info("Enrichment operations complete")
 
@@ -48,7 +83,7 @@ def main() -> None:
         logger.warning("No enrichment operations specified. Use --compute-hierarchy")
         return
     
-    asyncio.run(run(compute_hierarchy=args.compute_hierarchy))
+    asyncio.run(run(compute_hierarchy=args.compute_hierarchy, repeat=args.repeat))
 
 
 if __name__ == "__main__":
@@ -7,7 +7,7 @@ Contains:
 - Logging (structlog)
 """
 
-from infrastructure.config import Settings, settings, get_settings
+from infrastructure.config import Settings, get_settings
 from infrastructure.logging import setup_logging, get_logger
 from infrastructure.osm import PBFReader
 from infrastructure.postgres import create_pool, get_pool, PostgresWriter
@@ -15,7 +15,6 @@ from infrastructure.postgres import create_pool, get_pool, PostgresWriter
 __all__ = [
     # Config
     "Settings",
-    "settings",
     "get_settings",
     # Logging
     "setup_logging",
@@ -1,5 +1,5 @@
 """Configuration management using pydantic-settings."""
 
-from infrastructure.config.settings import Settings, get_settings, settings
+from infrastructure.config.settings import Settings, get_settings
 
-__all__ = ["Settings", "get_settings", "settings"]
+__all__ = ["Settings", "get_settings"]
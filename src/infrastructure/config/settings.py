@@ -23,6 +23,11 @@ class Settings(BaseSettings):
 
     # OSM
     osm_file_path: Path = Path("data/madagascar-latest.osm.pbf")
+    # osmium node location store; "dense_file_array,<path>" for huge extracts
+    osm_location_index: str = "flex_mem"
+    # Reuse relation member geometries from <pbf>.ways.cache across runs;
+    # off by default since it writes a file next to the input
+    osm_way_cache: bool = False
 
     # PostgreSQL (lemurion database)
     postgres_host: str = "localhost"
@@ -30,6 +35,29 @@ class Settings(BaseSettings):
     postgres_db: str = "lemurion"
     postgres_user: str = "postgres"
     postgres_password: SecretStr = SecretStr("")
+    postgres_pool_min_size: int = 2
+    postgres_pool_max_size: int | None = None  # None: derived, see pool_max_size
+    postgres_pool_max_idle: float = 300.0  # seconds before surplus connections close
+    postgres_pool_num_workers: int = 3  # background workers opening connections
+    # Executions before a statement is prepared server-side; None disables
+    postgres_prepare_threshold: int | None = 0
+    # Rows per write in sequential loads; COPY makes large writes cheap
+    postgres_write_batch_size: int = 10_000
+    # Zone rows carry whole boundary polygons, up to megabytes each
+    postgres_zone_write_batch_size: int = 200
+    # Smaller batches use executemany instead of COPY
+    postgres_copy_min_rows: int = 500
+    # Batches per transaction in sequential loads
+    postgres_commit_every: int = 10
+    # False: don't wait for WAL flushes on commit (a crash may lose the
+    # last commits, never consistency); loads are idempotent and rerunnable
+    postgres_synchronous_commit: bool = True
+    # Drop secondary indexes during the load and rebuild them after; for
+    # initial loads, as queries meanwhile run without those indexes
+    postgres_defer_indexes: bool = False
+    # Plain inserts without conflict handling; only for loads into empty
+    # tables, as rerunning over existing rows fails
+    postgres_insert_only: bool = False
 
     # Processing
     batch_size: int = 1000
@@ -37,11 +65,23 @@ class Settings(BaseSettings):
     # Parallel processing
     enable_parallel_pipeline: bool = True
     parallel_queue_depth: int = 10
+    parallel_consumer_concurrency: int = 4
 
     # Logging
     log_level: str = "INFO"
     log_format: str = "console"  # "json" or "console"
 
+    @property
+    def pool_max_size(self) -> int:
+        """Connection pool size.
+
+        Defaults to 2 x CPUs + 1, enough to keep the server busy without
+        oversubscribing it, and never below postgres_pool_min_size.
+        """
+        if self.postgres_pool_max_size is not None:
+            return self.postgres_pool_max_size
+        return max(self.postgres_pool_min_size, (os.cpu_count() or 1) * 2 + 1)
+
     @property
     def postgres_dsn(self) -> str:
         """Build PostgreSQL connection string."""
@@ -63,9 +103,9 @@ class Settings(BaseSettings):
 
 @lru_cache
 def get_settings() -> Settings:
-    """Get cached settings instance."""
-    return Settings()
-
+    """Get cached settings instance.
 
-# Convenience alias
-settings = get_settings()
+    Settings are read from the environment and .env on the first call,
+    not at import time.
+    """
+    return Settings()
@@ -1,10 +1,109 @@
 """Structured logging setup using structlog."""
 
+import atexit
+import json
 import logging
+import logging.handlers
+import queue
 import sys
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
 
 import structlog
-from structlog.typing import Processor
+from structlog.typing import EventDict, Processor, WrappedLogger
+
+# Background writer draining the log queue; replaced on reconfiguration
+_listener: logging.handlers.QueueListener | None = None
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves formatting to the listener's handler.
+
+    The stock prepare() formats every record before enqueueing it, only for
+    the listener to format it again; records here stay in-process, so they
+    are passed through untouched and formatted once, off the hot path.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the writer thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def _capture_exc_info(
+    logger: WrappedLogger, method_name: str, event_dict: EventDict
+) -> EventDict:
+    """Resolve exc_info=True to the active exception before the record is queued."""
+    if event_dict.get("exc_info") is True:
+        event_dict["exc_info"] = sys.exc_info()
+    return event_dict
+
+
+def _add_timestamp(
+    logger: WrappedLogger, method_name: str, event_dict: EventDict
+) -> EventDict:
+    """Add an ISO 8601 UTC timestamp taken from the record's creation time.
+
+    Runs on the listener thread, so the time the event was logged comes from
+    the record rather than the clock.
+    """
+    record: logging.LogRecord = event_dict["_record"]
+    stamp = datetime.fromtimestamp(record.created, tz=UTC).isoformat()
+    event_dict["timestamp"] = stamp.replace("+00:00", "Z")
+    return event_dict
+
+
+def _json_serializer() -> Callable[..., str]:
+    """Return an orjson-backed serializer when installed, else json.dumps.
+
+    The listener writes to a text stream, so orjson's bytes are decoded
+    here rather than handed to a bytes logger.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps
+
+    def dumps(obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(
+            obj, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+
+    return dumps
+
+
+def _install_queue_handler(level: int, formatter: logging.Formatter) -> None:
+    """Route stdlib logging through a queue drained by one writer thread.
+
+    Loggers only enqueue records, so concurrent batch consumers and worker
+    threads never contend on the stream lock or block on stdout writes.
+    """
+    global _listener
+    _stop_listener()
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+    _listener = logging.handlers.QueueListener(
+        log_queue, stream_handler, respect_handler_level=True
+    )
+    _listener.start()
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(_QueueHandler(log_queue))
+    root.setLevel(level)
+
+
+atexit.register(_stop_listener)
 
 
 def setup_logging(log_level: str = "INFO", log_format: str = "console") -> None:
@@ -14,44 +113,48 @@ def setup_logging(log_level: str = "INFO", log_format: str = "console") -> None:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
         log_format: Output format - "console" for dev, "json" for production
     """
-    # Shared processors for both formats
-    shared_processors: list[Processor] = [
+    # Processors that need the calling thread (context variables, stack,
+    # active exception) run inline; everything else runs in the listener
+    pre_processors: list[Processor] = [
         structlog.contextvars.merge_contextvars,
         structlog.processors.add_log_level,
-        structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.StackInfoRenderer(),
+        _capture_exc_info,
     ]
 
     if log_format == "json":
         # JSON output for production
-        processors: list[Processor] = [
-            *shared_processors,
+        renderers: list[Processor] = [
             structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=_json_serializer()),
         ]
     else:
         # Pretty console output for development
-        processors = [
-            *shared_processors,
-            structlog.dev.ConsoleRenderer(colors=True),
-        ]
+        renderers = [structlog.dev.ConsoleRenderer(colors=True)]
 
+    level = logging.getLevelName(log_level.upper())
+
+    # structlog only builds the event dict and hands it to stdlib logging,
+    # which enqueues it; the listener thread timestamps, renders and writes.
     structlog.configure(
-        processors=processors,
-        wrapper_class=structlog.make_filtering_bound_logger(
-            logging.getLevelName(log_level.upper())
-        ),
+        processors=[
+            *pre_processors,
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+        ],
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(file=sys.stdout),
+        logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
-
-    # Also configure standard library logging to use structlog
-    logging.basicConfig(
-        format="%(message)s",
-        level=logging.getLevelName(log_level.upper()),
-        handlers=[logging.StreamHandler(sys.stdout)],
+    formatter = structlog.stdlib.ProcessorFormatter(
+        processors=[
+            _add_timestamp,
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            *renderers,
+        ],
+        foreign_pre_chain=[structlog.processors.add_log_level],
     )
+    _install_queue_handler(level, formatter)
 
 
 def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
@@ -6,6 +6,8 @@ All OSM-specific knowledge (tag parsing, filtering) lives here in infrastructure
 
 from collections.abc import Iterator
 
+from osmium.filter import KeyFilter, TagFilter
+
 from application.ports.extractor import DataExtractor
 from domain import Road, POI, Zone
 from infrastructure.osm.reader import PBFReader
@@ -15,7 +17,7 @@ from infrastructure.logging import get_logger
 logger = get_logger(__name__)
 
 # OSM highway types we consider as roads
-ROAD_HIGHWAY_TYPES = {
+ROAD_HIGHWAY_TYPES: frozenset[str] = frozenset({
     "motorway",
     "motorway_link",
     "trunk",
@@ -33,10 +35,24 @@ ROAD_HIGHWAY_TYPES = {
     "path",
     "footway",
     "cycleway",
-}
+})
 
 # OSM tags that identify POIs
-POI_TAGS = {"amenity", "shop", "tourism"}
+POI_TAGS: frozenset[str] = frozenset({"amenity", "shop", "tourism"})
+
+
+# osmium filters reject non-matching objects in C++, before tags are
+# copied into Python; the Python-side checks below stay authoritative
+def _road_filter() -> TagFilter:
+    return TagFilter(*(("highway", highway) for highway in sorted(ROAD_HIGHWAY_TYPES)))
+
+
+def _poi_filter() -> KeyFilter:
+    return KeyFilter(*sorted(POI_TAGS))
+
+
+def _zone_filter() -> TagFilter:
+    return TagFilter(("boundary", "administrative"))
 
 
 class OSMExtractor(DataExtractor):
@@ -81,9 +97,9 @@ class OSMExtractor(DataExtractor):
         logger.info("Extracting roads from OSM data")
         count = 0
 
-        for raw_way in self.reader.read_raw_ways():
-            highway = raw_way.tags.get("highway")
-            if highway and highway in ROAD_HIGHWAY_TYPES:
+        for raw_way in self.reader.read_raw_ways(filters=[_road_filter()]):
+            # A missing tag gives None, which is never a member
+            if raw_way.tags.get("highway") in ROAD_HIGHWAY_TYPES:
                 road = transform_road(raw_way.id, raw_way.tags, raw_way.coords)
                 count += 1
                 yield road
@@ -102,8 +118,8 @@ class OSMExtractor(DataExtractor):
         logger.info("Extracting POIs from OSM data")
         count = 0
 
-        for raw_node in self.reader.read_raw_nodes():
-            if any(tag in raw_node.tags for tag in POI_TAGS):
+        for raw_node in self.reader.read_raw_nodes(filters=[_poi_filter()]):
+            if not POI_TAGS.isdisjoint(raw_node.tags):
                 poi = transform_poi(
                     raw_node.id,
                     raw_node.tags,
@@ -127,7 +143,7 @@ class OSMExtractor(DataExtractor):
         logger.info("Extracting zones from OSM data")
         count = 0
 
-        for raw_relation in self.reader.read_raw_relations():
+        for raw_relation in self.reader.read_raw_relations(filters=[_zone_filter()]):
             if raw_relation.tags.get("boundary") == "administrative":
                 zone = transform_zone(
                     raw_relation.id,
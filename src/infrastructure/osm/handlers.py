@@ -4,51 +4,142 @@ These handlers extract raw OSM data without any domain transformation.
 Transformation is handled by the application layer.
 """
 
-from collections.abc import Callable
+from __future__ import annotations
+
+import sys
+from array import array
+from collections.abc import Callable, Collection, Iterable
+from typing import NoReturn
 
 import osmium
-from osmium.osm import Node, Relation, Way
+from osmium.osm import Node, Relation, Tag, Way
 
 from infrastructure.osm.types import RawNode, RawRelation, RawWay
 
+_intern = sys.intern
 
-class NodeCollector(osmium.SimpleHandler):
-    """First pass: collect node coordinates for building way geometries."""
+# Longer values are mostly free text (names, notes, opening hours) that
+# rarely repeats; interning it would only grow the interned string table
+_MAX_INTERNED_VALUE = 32
 
-    def __init__(self) -> None:
-        super().__init__()
-        self.nodes: dict[int, tuple[float, float]] = {}
 
-    def node(self, n: Node) -> None:
-        """Store node coordinates."""
-        self.nodes[n.id] = (n.location.lon, n.location.lat)
+# Small tag sets without free text ({"highway": "residential"}, ...)
+# repeat across thousands of objects and are shared through a per-handler
+# memo, capped so a file of mostly unique tag sets cannot grow it unbounded
+_MAX_SHARED_TAGS = 4
+_MAX_SHARED_TAG_SETS = 4096
+
+
+class _SharedTags(dict[str, str]):
+    """Tag dict shared between entities; mutating it raises TypeError.
+
+    Still a dict, so tag parsing, JSON encoding and copying work as before.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args: object, **kwargs: object) -> NoReturn:
+        raise TypeError("shared OSM tag dicts are read-only; copy before changing them")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self) -> tuple[type[_SharedTags], tuple[dict[str, str]]]:
+        # The default dict pickling refills the instance through __setitem__
+        return _SharedTags, (dict(self),)
+
+
+_TagSets = dict[tuple[tuple[str, str], ...], _SharedTags]
+
+
+def _tag_dict(tags: Iterable[Tag], shared: _TagSets | None = None) -> dict[str, str]:
+    """Copy OSM tags into a dict of interned strings.
+
+    The same keys and values ("highway", "residential", "yes", ...) repeat
+    across millions of objects; interning makes every copy share one
+    string object, and lookups against literal keys compare by identity.
+    Only short values are interned, see _MAX_INTERNED_VALUE.
+
+    With a shared memo, identical small tag sets come back as one
+    read-only dict instance.
+    """
+    result: dict[str, str] = {}
+    free_text = False
+    for tag in tags:
+        value = tag.v
+        if len(value) < _MAX_INTERNED_VALUE:
+            value = _intern(value)
+        else:
+            free_text = True
+        result[_intern(tag.k)] = value
+
+    if shared is None or free_text or len(result) > _MAX_SHARED_TAGS:
+        return result
+    key = tuple(result.items())
+    cached = shared.get(key)
+    if cached is not None:
+        return cached
+    if len(shared) < _MAX_SHARED_TAG_SETS:
+        cached = shared[key] = _SharedTags(result)
+        return cached
+    return result
+
+
+# WKB linestring layout: byte order (1) + geometry type (4) + point count (4)
+_WKB_HEADER_SIZE = 9
+_NATIVE_WKB_ORDER = 1 if sys.byteorder == "little" else 0
+
+
+def _way_coords_slow(w: Way) -> array[float]:
+    """Pack a way's node locations one by one, skipping invalid locations."""
+    coords = array("d")
+    for node_ref in w.nodes:
+        location = node_ref.location
+        if location.valid():
+            coords.append(location.lon)
+            coords.append(location.lat)
+    return coords
+
+
+def _way_coords(w: Way, wkb: osmium.geom.WKBFactory) -> array[float]:
+    """Pack a way's node locations, skipping refs missing from the file.
+
+    The handler must be applied with locations=True so that osmium fills
+    node locations from its own index. The WKB factory assembles the
+    coordinates in C++, and its point payload is already packed
+    (lon, lat) doubles; ways it rejects (missing nodes, fewer than two
+    points) go through the per-node loop instead.
+    """
+    try:
+        raw = bytes.fromhex(wkb.create_linestring(w, osmium.geom.ALL))
+    except (osmium.InvalidLocationError, RuntimeError):
+        return _way_coords_slow(w)
+
+    coords = array("d")
+    coords.frombytes(memoryview(raw)[_WKB_HEADER_SIZE:])
+    if raw[0] != _NATIVE_WKB_ORDER:
+        coords.byteswap()
+    return coords
 
 
 class WayHandler(osmium.SimpleHandler):
-    """Extract all ways as raw data."""
+    """Extract all ways as raw data (apply with locations=True)."""
 
-    def __init__(
-        self,
-        nodes: dict[int, tuple[float, float]],
-        callback: Callable[[RawWay], None],
-    ) -> None:
+    def __init__(self, callback: Callable[[RawWay], None]) -> None:
         super().__init__()
-        self.nodes = nodes
         self.callback = callback
+        self._wkb = osmium.geom.WKBFactory()
+        self._tag_sets: _TagSets = {}
 
     def way(self, w: Way) -> None:
         """Process way and emit raw data."""
-        tags = {tag.k: tag.v for tag in w.tags}
-
-        # Build geometry from node references
-        coords: list[tuple[float, float]] = []
-        for node_ref in w.nodes:
-            if node_ref.ref in self.nodes:
-                coords.append(self.nodes[node_ref.ref])
+        coords = _way_coords(w, self._wkb)
 
-        if len(coords) < 2:
+        # Packed lon/lat pairs: fewer than 2 points
+        if len(coords) < 4:
             return
 
+        tags = _tag_dict(w.tags, self._tag_sets)
         raw = RawWay(id=w.id, tags=tags, coords=coords)
         self.callback(raw)
 
@@ -59,13 +150,14 @@ class NodeHandler(osmium.SimpleHandler):
     def __init__(self, callback: Callable[[RawNode], None]) -> None:
         super().__init__()
         self.callback = callback
+        self._tag_sets: _TagSets = {}
 
     def node(self, n: Node) -> None:
         """Process node and emit raw data if it has tags."""
         if not n.tags:
             return
 
-        tags = {tag.k: tag.v for tag in n.tags}
+        tags = _tag_dict(n.tags, self._tag_sets)
         raw = RawNode(
             id=n.id,
             tags=tags,
@@ -80,7 +172,7 @@ class RelationHandler(osmium.SimpleHandler):
 
     def __init__(
         self,
-        ways: dict[int, list[tuple[float, float]]],
+        ways: dict[int, array[float]],
         callback: Callable[[RawRelation], None],
     ) -> None:
         super().__init__()
@@ -89,36 +181,63 @@ class RelationHandler(osmium.SimpleHandler):
 
     def relation(self, r: Relation) -> None:
         """Process relation and emit raw data."""
-        tags = {tag.k: tag.v for tag in r.tags}
-
         # Build geometry from outer way members
-        coords: list[tuple[float, float]] = []
+        coords = array("d")
         for member in r.members:
             if member.type == "w" and member.role in ("outer", ""):
                 if member.ref in self.ways:
                     coords.extend(self.ways[member.ref])
 
-        if len(coords) < 3:
+        # Packed lon/lat pairs: fewer than 3 points
+        if len(coords) < 6:
             return
 
+        tags = _tag_dict(r.tags)
         raw = RawRelation(id=r.id, tags=tags, coords=coords)
         self.callback(raw)
 
 
-class WayCollector(osmium.SimpleHandler):
-    """Collect way geometries for building relation polygons."""
+class RelationMemberCollector(osmium.SimpleHandler):
+    """Collect the ids of ways used as outer members of relations."""
 
-    def __init__(self, nodes: dict[int, tuple[float, float]]) -> None:
+    def __init__(self) -> None:
         super().__init__()
-        self.nodes = nodes
-        self.ways: dict[int, list[tuple[float, float]]] = {}
+        self.way_ids: set[int] = set()
+
+    def relation(self, r: Relation) -> None:
+        """Record the relation's outer way members."""
+        for member in r.members:
+            if member.type == "w" and member.role in ("outer", ""):
+                self.way_ids.add(member.ref)
+
+
+class RelationAssembler(RelationHandler):
+    """Collect member way geometries and extract relations in one pass.
+
+    Apply with locations=True to a sorted PBF, where all ways precede the
+    relations that use them.
+    """
+
+    def __init__(
+        self,
+        way_ids: Collection[int],
+        callback: Callable[[RawRelation], None],
+    ) -> None:
+        """Initialize relation assembler.
+
+        Args:
+            way_ids: Member ways to keep (e.g. from RelationMemberCollector)
+            callback: Callback for each extracted relation
+        """
+        super().__init__({}, callback)
+        self.way_ids = way_ids
+        self._wkb = osmium.geom.WKBFactory()
 
     def way(self, w: Way) -> None:
-        """Store way coordinates."""
-        coords: list[tuple[float, float]] = []
-        for node_ref in w.nodes:
-            if node_ref.ref in self.nodes:
-                coords.append(self.nodes[node_ref.ref])
+        """Store the coordinates of member ways."""
+        if w.id not in self.way_ids:
+            return
+        coords = _way_coords(w, self._wkb)
         if coords:
             self.ways[w.id] = coords
 
@@ -126,28 +245,24 @@ class WayCollector(osmium.SimpleHandler):
 class CombinedHandler(osmium.SimpleHandler):
     """Extract ways, nodes, and relations in a single pass.
 
-    This handler processes all entity types during one file scan,
-    improving performance for parallel entity processing by avoiding
-    multiple passes over the PBF file.
+    Must be applied with locations=True: osmium then resolves way node
+    locations from its own index while reading, so no separate node or
+    way collection pass is needed. Way geometries are kept as they go by
+    and relations, which follow all ways in a sorted PBF, resolve their
+    outer members against them.
 
     Usage:
-        nodes = node_collector.nodes  # Pre-collected node coordinates
-        ways = way_collector.ways     # Pre-collected way geometries
-
         raw_ways, raw_nodes, raw_relations = [], [], []
         handler = CombinedHandler(
-            nodes, ways,
             on_way=raw_ways.append,
             on_node=raw_nodes.append,
             on_relation=raw_relations.append,
         )
-        handler.apply_file(str(file_path))
+        handler.apply_file(str(file_path), locations=True)
     """
 
     def __init__(
         self,
-        node_coords: dict[int, tuple[float, float]],
-        way_coords: dict[int, list[tuple[float, float]]],
         on_way: Callable[[RawWay], None],
         on_node: Callable[[RawNode], None],
         on_relation: Callable[[RawRelation], None],
@@ -155,32 +270,28 @@ class CombinedHandler(osmium.SimpleHandler):
         """Initialize combined handler.
 
         Args:
-            node_coords: Pre-collected node coordinates (id -> (lon, lat))
-            way_coords: Pre-collected way geometries (id -> [(lon, lat), ...])
             on_way: Callback for each extracted way
             on_node: Callback for each extracted node with tags
             on_relation: Callback for each extracted relation
         """
         super().__init__()
-        self.node_coords = node_coords
-        self.way_coords = way_coords
+        self.way_coords: dict[int, array[float]] = {}
+        self._wkb = osmium.geom.WKBFactory()
+        self._tag_sets: _TagSets = {}
         self.on_way = on_way
         self.on_node = on_node
         self.on_relation = on_relation
 
     def way(self, w: Way) -> None:
-        """Process way and emit raw data."""
-        tags = {tag.k: tag.v for tag in w.tags}
-
-        # Build geometry from node references
-        coords: list[tuple[float, float]] = []
-        for node_ref in w.nodes:
-            if node_ref.ref in self.node_coords:
-                coords.append(self.node_coords[node_ref.ref])
-
-        if len(coords) < 2:
+        """Process way, keep its geometry for relations, and emit raw data."""
+        coords = _way_coords(w, self._wkb)
+        if coords:
+            self.way_coords[w.id] = coords
+        # Packed lon/lat pairs: fewer than 2 points
+        if len(coords) < 4:
             return
 
+        tags = _tag_dict(w.tags, self._tag_sets)
         raw = RawWay(id=w.id, tags=tags, coords=coords)
         self.on_way(raw)
 
@@ -189,7 +300,7 @@ class CombinedHandler(osmium.SimpleHandler):
         if not n.tags:
             return
 
-        tags = {tag.k: tag.v for tag in n.tags}
+        tags = _tag_dict(n.tags, self._tag_sets)
         raw = RawNode(
             id=n.id,
             tags=tags,
@@ -200,17 +311,17 @@ class CombinedHandler(osmium.SimpleHandler):
 
     def relation(self, r: Relation) -> None:
         """Process relation and emit raw data."""
-        tags = {tag.k: tag.v for tag in r.tags}
-
         # Build geometry from outer way members
-        coords: list[tuple[float, float]] = []
+        coords = array("d")
         for member in r.members:
             if member.type == "w" and member.role in ("outer", ""):
                 if member.ref in self.way_coords:
                     coords.extend(self.way_coords[member.ref])
 
-        if len(coords) < 3:
+        # Packed lon/lat pairs: fewer than 3 points
+        if len(coords) < 6:
             return
 
+        tags = _tag_dict(r.tags)
         raw = RawRelation(id=r.id, tags=tags, coords=coords)
         self.on_relation(raw)
@@ -4,22 +4,39 @@ This reader extracts raw OSM data (ways, nodes, relations) without transformatio
 Domain transformation is handled by the application layer (OSMExtractor).
 """
 
-from collections.abc import Iterator
+from __future__ import annotations
+
+import queue
+import threading
+from collections.abc import Callable, Iterator, Sequence
 from pathlib import Path
+from typing import Any, TypeVar
+
+import osmium
 
 from infrastructure.logging import get_logger
 from infrastructure.osm.handlers import (
     CombinedHandler,
-    NodeCollector,
     NodeHandler,
+    RelationAssembler,
     RelationHandler,
-    WayCollector,
+    RelationMemberCollector,
     WayHandler,
 )
 from infrastructure.osm.types import RawNode, RawRelation, RawWay
+from infrastructure.osm.way_cache import load_ways, save_ways
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+# End-of-scan marker passed through the stream queue
+_DONE = object()
+
+
+class _StreamClosed(Exception):
+    """Raised inside a handler callback once the consumer stopped reading."""
+
 
 class PBFReader:
     """Read raw OSM data from PBF files.
@@ -36,99 +53,180 @@ class PBFReader:
             ...
     """
 
-    def __init__(self, file_path: Path) -> None:
+    def __init__(
+        self,
+        file_path: Path,
+        buffer_size: int = 10_000,
+        location_index: str = "flex_mem",
+        way_cache: bool = False,
+    ) -> None:
         """Initialize reader with PBF file path.
 
         Args:
             file_path: Path to .osm.pbf file
+            buffer_size: Max raw objects decoded ahead of the consumer
+            location_index: osmium node location store used to build way
+                geometries, e.g. "flex_mem", or "dense_file_array,<path>"
+                to keep the index in a file for very large extracts
+            way_cache: Keep relation member geometries in a cache file next
+                to the PBF and reuse them while it is newer than the PBF
         """
         self.file_path = file_path
         if not file_path.exists():
             raise FileNotFoundError(f"PBF file not found: {file_path}")
 
-        self._nodes: dict[int, tuple[float, float]] | None = None
-        self._ways: dict[int, list[tuple[float, float]]] | None = None
-
-    def _collect_nodes(self) -> dict[int, tuple[float, float]]:
-        """First pass: collect all node coordinates."""
-        if self._nodes is not None:
-            return self._nodes
-
-        logger.info("Collecting node coordinates", file=str(self.file_path))
-        collector = NodeCollector()
-        collector.apply_file(str(self.file_path), locations=True)
-        self._nodes = collector.nodes
-        logger.info("Collected nodes", count=len(self._nodes))
-        return self._nodes
-
-    def _collect_ways(self) -> dict[int, list[tuple[float, float]]]:
-        """Collect way geometries for relation processing."""
-        if self._ways is not None:
-            return self._ways
-
-        nodes = self._collect_nodes()
-        logger.info("Collecting way geometries")
-        collector = WayCollector(nodes)
-        collector.apply_file(str(self.file_path))
-        self._ways = collector.ways
-        logger.info("Collected ways", count=len(self._ways))
-        return self._ways
-
-    def read_raw_ways(self) -> Iterator[RawWay]:
+        self._buffer_size = buffer_size
+        self._location_index = location_index
+        self._way_cache = way_cache
+
+    def _relation_members(self, filters: Sequence[Any] = ()) -> set[int]:
+        """Find the ways used by relations passing filters.
+
+        Only relations are decoded, so this pass is cheap next to a located
+        one; it lets the located pass keep just these ways' coordinates
+        rather than every way in the file.
+        """
+        logger.info("Collecting relation members", file=str(self.file_path))
+        members = RelationMemberCollector()
+        members.apply_file(str(self.file_path), filters=list(filters))
+        return members.way_ids
+
+    def _stream(self, scan: Callable[[Callable[[T], None]], None]) -> Iterator[T]:
+        """Run a handler scan in a worker thread and yield what it emits.
+
+        The scan is called with the callback its handler should emit to.
+        A bounded queue hands objects over as they are decoded, so at most
+        buffer_size of them are held at once and downstream work overlaps
+        with decoding. Scan errors are re-raised in the consumer; if the
+        consumer stops early, the scan is aborted at its next callback.
+        """
+        items: queue.Queue[Any] = queue.Queue(maxsize=self._buffer_size)
+        closed = threading.Event()
+        failure: list[BaseException] = []
+
+        def put(item: Any) -> bool:
+            while not closed.is_set():
+                try:
+                    items.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def emit(item: T) -> None:
+            if not put(item):
+                raise _StreamClosed
+
+        def run() -> None:
+            try:
+                scan(emit)
+            except _StreamClosed:
+                pass
+            except BaseException as exc:  # handed to the consumer
+                failure.append(exc)
+            finally:
+                put(_DONE)
+
+        worker = threading.Thread(target=run, name="pbf-reader", daemon=True)
+        worker.start()
+        try:
+            while (item := items.get()) is not _DONE:
+                yield item
+        finally:
+            closed.set()
+            worker.join()
+
+        if failure:
+            raise failure[0]
+
+    def read_raw_ways(self, filters: Sequence[Any] = ()) -> Iterator[RawWay]:
         """Stream raw ways from PBF file.
 
+        Args:
+            filters: osmium filters (osmium.filter) applied before ways
+                reach Python, e.g. a KeyFilter on "highway"
+
         Yields:
             RawWay objects with id, tags, and coords
         """
-        nodes = self._collect_nodes()
-        ways: list[RawWay] = []
 
-        def collect(raw: RawWay) -> None:
-            ways.append(raw)
+        def scan(emit: Callable[[RawWay], None]) -> None:
+            WayHandler(emit).apply_file(
+                str(self.file_path),
+                locations=True,
+                idx=self._location_index,
+                filters=list(filters),
+            )
 
         logger.info("Extracting raw ways")
-        handler = WayHandler(nodes, collect)
-        handler.apply_file(str(self.file_path))
-        logger.info("Extracted raw ways", count=len(ways))
-
-        yield from ways
+        count = 0
+        for raw in self._stream(scan):
+            count += 1
+            yield raw
+        logger.info("Extracted raw ways", count=count)
 
-    def read_raw_nodes(self) -> Iterator[RawNode]:
+    def read_raw_nodes(self, filters: Sequence[Any] = ()) -> Iterator[RawNode]:
         """Stream raw nodes (with tags) from PBF file.
 
+        Args:
+            filters: osmium filters (osmium.filter) applied before nodes
+                reach Python
+
         Yields:
             RawNode objects with id, tags, lon, lat
         """
-        nodes: list[RawNode] = []
 
-        def collect(raw: RawNode) -> None:
-            nodes.append(raw)
+        def scan(emit: Callable[[RawNode], None]) -> None:
+            NodeHandler(emit).apply_file(str(self.file_path), filters=list(filters))
 
         logger.info("Extracting raw nodes")
-        handler = NodeHandler(collect)
-        handler.apply_file(str(self.file_path), locations=True)
-        logger.info("Extracted raw nodes", count=len(nodes))
-
-        yield from nodes
+        count = 0
+        for raw in self._stream(scan):
+            count += 1
+            yield raw
+        logger.info("Extracted raw nodes", count=count)
 
-    def read_raw_relations(self) -> Iterator[RawRelation]:
+    def read_raw_relations(self, filters: Sequence[Any] = ()) -> Iterator[RawRelation]:
         """Stream raw relations from PBF file.
 
+        Member way geometries are resolved in the same pass that extracts
+        the relations, or taken from the way cache when it is fresh.
+
+        Args:
+            filters: osmium filters (osmium.filter) applied before relations
+                reach Python; they are restricted to relations so member
+                ways still get through
+
         Yields:
             RawRelation objects with id, tags, and coords
         """
-        ways = self._collect_ways()
-        relations: list[RawRelation] = []
-
-        def collect(raw: RawRelation) -> None:
-            relations.append(raw)
+        filters = [f.enable_for(osmium.osm.RELATION) for f in filters]
+        way_ids = self._relation_members(filters)
+        cached = load_ways(self.file_path, way_ids) if self._way_cache else None
+
+        def scan(emit: Callable[[RawRelation], None]) -> None:
+            if cached is not None:
+                RelationHandler(cached, emit).apply_file(str(self.file_path), filters=filters)
+                return
+
+            logger.info("Collecting way geometries", members=len(way_ids))
+            handler = RelationAssembler(way_ids, emit)
+            handler.apply_file(
+                str(self.file_path),
+                locations=True,
+                idx=self._location_index,
+                filters=filters,
+            )
+            logger.info("Collected ways", count=len(handler.ways))
+            if self._way_cache:
+                save_ways(self.file_path, way_ids, handler.ways)
 
         logger.info("Extracting raw relations")
-        handler = RelationHandler(ways, collect)
-        handler.apply_file(str(self.file_path))
-        logger.info("Extracted raw relations", count=len(relations))
-
-        yield from relations
+        count = 0
+        for raw in self._stream(scan):
+            count += 1
+            yield raw
+        logger.info("Extracted raw relations", count=count)
 
     def extract_all_raw(
         self,
@@ -136,16 +234,13 @@ class PBFReader:
         """Extract all raw data in a single pass over the file.
 
         This method is optimized for parallel processing by reading
-        ways, nodes, and relations in one file scan instead of
-        multiple passes.
+        ways, nodes, and relations in one file scan: way geometries are
+        resolved through osmium's location index and relations reuse the
+        ways seen earlier in the same scan.
 
         Returns:
             Tuple of (raw_ways, raw_nodes, raw_relations)
         """
-        # Collect prerequisite data
-        nodes = self._collect_nodes()
-        ways = self._collect_ways()
-
         # Prepare result containers
         raw_ways: list[RawWay] = []
         raw_nodes: list[RawNode] = []
@@ -153,13 +248,11 @@ class PBFReader:
 
         logger.info("Extracting all raw data in single pass")
         handler = CombinedHandler(
-            nodes,
-            ways,
             on_way=raw_ways.append,
             on_node=raw_nodes.append,
             on_relation=raw_relations.append,
         )
-        handler.apply_file(str(self.file_path), locations=True)
+        handler.apply_file(str(self.file_path), locations=True, idx=self._location_index)
 
         logger.info(
             "Extracted raw data",
@@ -4,6 +4,9 @@ This module contains transformation logic that converts raw OSM data
 (from the infrastructure layer) into domain entities.
 """
 
+from collections.abc import Iterable
+from functools import lru_cache
+
 from domain import (
     Road,
     POI,
@@ -16,30 +19,54 @@ from domain import (
     Address,
     OperatingHours,
 )
+from domain.value_objects import PackedCoordinates
+
+
+# OSM highway value -> RoadType
+_ROAD_TYPES = {
+    "motorway": RoadType.MOTORWAY,
+    "motorway_link": RoadType.MOTORWAY,
+    "trunk": RoadType.TRUNK,
+    "trunk_link": RoadType.TRUNK,
+    "primary": RoadType.PRIMARY,
+    "primary_link": RoadType.PRIMARY,
+    "secondary": RoadType.SECONDARY,
+    "secondary_link": RoadType.SECONDARY,
+    "tertiary": RoadType.TERTIARY,
+    "tertiary_link": RoadType.TERTIARY,
+    "residential": RoadType.RESIDENTIAL,
+    "living_street": RoadType.RESIDENTIAL,
+    "unclassified": RoadType.UNCLASSIFIED,
+    "track": RoadType.TRACK,
+    "path": RoadType.PATH,
+    "footway": RoadType.PATH,
+    "cycleway": RoadType.PATH,
+}
 
 
 def parse_road_type(highway: str) -> RoadType:
     """Convert OSM highway tag to RoadType enum."""
-    mapping = {
-        "motorway": RoadType.MOTORWAY,
-        "motorway_link": RoadType.MOTORWAY,
-        "trunk": RoadType.TRUNK,
-        "trunk_link": RoadType.TRUNK,
-        "primary": RoadType.PRIMARY,
-        "primary_link": RoadType.PRIMARY,
-        "secondary": RoadType.SECONDARY,
-        "secondary_link": RoadType.SECONDARY,
-        "tertiary": RoadType.TERTIARY,
-        "tertiary_link": RoadType.TERTIARY,
-        "residential": RoadType.RESIDENTIAL,
-        "living_street": RoadType.RESIDENTIAL,
-        "unclassified": RoadType.UNCLASSIFIED,
-        "track": RoadType.TRACK,
-        "path": RoadType.PATH,
-        "footway": RoadType.PATH,
-        "cycleway": RoadType.PATH,
-    }
-    return mapping.get(highway, RoadType.UNCLASSIFIED)
+    return _ROAD_TYPES.get(highway, RoadType.UNCLASSIFIED)
+
+
+# OSM surface value (lowercased) -> Surface
+_SURFACES = {
+    "asphalt": Surface.ASPHALT,
+    "paved": Surface.PAVED,
+    "concrete": Surface.CONCRETE,
+    "concrete:plates": Surface.CONCRETE,
+    "concrete:lanes": Surface.CONCRETE,
+    "gravel": Surface.GRAVEL,
+    "fine_gravel": Surface.GRAVEL,
+    "compacted": Surface.GRAVEL,
+    "dirt": Surface.DIRT,
+    "earth": Surface.DIRT,
+    "mud": Surface.DIRT,
+    "sand": Surface.SAND,
+    "unpaved": Surface.UNPAVED,
+    "ground": Surface.GROUND,
+    "grass": Surface.GROUND,
+}
 
 
 def parse_surface(surface: str | None) -> Surface:
@@ -47,24 +74,20 @@ def parse_surface(surface: str | None) -> Surface:
     if not surface:
         return Surface.UNKNOWN
 
-    mapping = {
-        "asphalt": Surface.ASPHALT,
-        "paved": Surface.PAVED,
-        "concrete": Surface.CONCRETE,
-        "concrete:plates": Surface.CONCRETE,
-        "concrete:lanes": Surface.CONCRETE,
-        "gravel": Surface.GRAVEL,
-        "fine_gravel": Surface.GRAVEL,
-        "compacted": Surface.GRAVEL,
-        "dirt": Surface.DIRT,
-        "earth": Surface.DIRT,
-        "mud": Surface.DIRT,
-        "sand": Surface.SAND,
-        "unpaved": Surface.UNPAVED,
-        "ground": Surface.GROUND,
-        "grass": Surface.GROUND,
-    }
-    return mapping.get(surface.lower(), Surface.UNKNOWN)
+    return _SURFACES.get(surface.lower(), Surface.UNKNOWN)
+
+
+# OSM smoothness value (lowercased) -> Smoothness
+_SMOOTHNESS = {
+    "excellent": Smoothness.EXCELLENT,
+    "good": Smoothness.GOOD,
+    "intermediate": Smoothness.INTERMEDIATE,
+    "bad": Smoothness.BAD,
+    "very_bad": Smoothness.VERY_BAD,
+    "horrible": Smoothness.HORRIBLE,
+    "very_horrible": Smoothness.HORRIBLE,
+    "impassable": Smoothness.IMPASSABLE,
+}
 
 
 def parse_smoothness(smoothness: str | None) -> Smoothness:
@@ -72,17 +95,7 @@ def parse_smoothness(smoothness: str | None) -> Smoothness:
     if not smoothness:
         return Smoothness.UNKNOWN
 
-    mapping = {
-        "excellent": Smoothness.EXCELLENT,
-        "good": Smoothness.GOOD,
-        "intermediate": Smoothness.INTERMEDIATE,
-        "bad": Smoothness.BAD,
-        "very_bad": Smoothness.VERY_BAD,
-        "horrible": Smoothness.HORRIBLE,
-        "very_horrible": Smoothness.HORRIBLE,
-        "impassable": Smoothness.IMPASSABLE,
-    }
-    return mapping.get(smoothness.lower(), Smoothness.UNKNOWN)
+    return _SMOOTHNESS.get(smoothness.lower(), Smoothness.UNKNOWN)
 
 
 def parse_oneway(tags: dict[str, str]) -> bool:
@@ -93,8 +106,11 @@ def parse_oneway(tags: dict[str, str]) -> bool:
 
 def parse_lanes(tags: dict[str, str]) -> int:
     """Parse lanes tag, defaulting to 2."""
+    lanes = tags.get("lanes")
+    if lanes is None:
+        return 2
     try:
-        return int(tags.get("lanes", "2"))
+        return int(lanes)
     except ValueError:
         return 2
 
@@ -104,6 +120,9 @@ def parse_max_speed(tags: dict[str, str]) -> int | None:
     maxspeed = tags.get("maxspeed")
     if not maxspeed:
         return None
+    # Plain digits are the common case and need no suffix stripping
+    if maxspeed.isdecimal():
+        return int(maxspeed)
 
     # Remove common suffixes
     maxspeed = maxspeed.replace(" km/h", "").replace("km/h", "").replace(" mph", "")
@@ -116,23 +135,23 @@ def parse_max_speed(tags: dict[str, str]) -> int | None:
 def transform_road(
     id: int,
     tags: dict[str, str],
-    coords: list[tuple[float, float]],
+    coords: Iterable[float],
 ) -> Road:
     """Transform OSM way data to Road entity.
 
     Args:
         id: OSM way ID
         tags: OSM tags dictionary
-        coords: List of (lon, lat) coordinate tuples
+        coords: Packed (lon, lat) values, as in RawWay.coords
 
     Returns:
         Road domain entity
     """
-    geometry = [Coordinates(lat=lat, lon=lon) for lon, lat in coords]
-
+    # Node locations come straight from the OSM file: skip re-validation
+    # and keep them packed; points are built only where they are read
     return Road(
         id=id,
-        geometry=geometry,
+        geometry=PackedCoordinates(coords),
         road_type=parse_road_type(tags.get("highway", "")),
         surface=parse_surface(tags.get("surface")),
         smoothness=parse_smoothness(tags.get("smoothness")),
@@ -140,45 +159,55 @@ def transform_road(
         lanes=parse_lanes(tags),
         oneway=parse_oneway(tags),
         max_speed=parse_max_speed(tags),
-        tags=tags,
+        tags=tags or None,
     )
 
 
+# amenity tag value -> category, built once from the grouped values
+_AMENITY_CATEGORIES: dict[str, POICategory] = {
+    amenity: category
+    for category, amenities in (
+        (
+            POICategory.TRANSPORT,
+            ("fuel", "parking", "bus_station", "taxi", "car_rental", "ferry_terminal"),
+        ),
+        (POICategory.FOOD, ("restaurant", "cafe", "fast_food", "bar", "food_court", "pub")),
+        (POICategory.LODGING, ("hotel", "guest_house", "motel", "hostel")),
+        (POICategory.HEALTH, ("hospital", "pharmacy", "clinic", "doctors", "dentist")),
+        (
+            POICategory.SERVICES,
+            ("bank", "atm", "post_office", "bureau_de_change", "money_transfer"),
+        ),
+        (POICategory.GOVERNMENT, ("police", "embassy", "townhall", "courthouse")),
+        (
+            POICategory.EDUCATION,
+            ("school", "university", "college", "library", "kindergarten"),
+        ),
+    )
+    for amenity in amenities
+}
+
+# Amenity categories that take precedence over a tourism=* lodging tag
+_AMENITY_OVER_TOURISM = frozenset(
+    {POICategory.TRANSPORT, POICategory.FOOD, POICategory.LODGING}
+)
+
+_TOURISM_LODGING = frozenset({"hotel", "guest_house", "motel", "hostel", "camp_site"})
+
+
 def categorize_poi(tags: dict[str, str]) -> tuple[POICategory, str]:
     """Determine POI category and subcategory from tags."""
     amenity = tags.get("amenity")
     shop = tags.get("shop")
     tourism = tags.get("tourism")
 
-    # Transport
-    if amenity in ("fuel", "parking", "bus_station", "taxi", "car_rental", "ferry_terminal"):
-        return POICategory.TRANSPORT, amenity
-
-    # Food
-    if amenity in ("restaurant", "cafe", "fast_food", "bar", "food_court", "pub"):
-        return POICategory.FOOD, amenity
-
-    # Lodging
-    if amenity in ("hotel", "guest_house", "motel", "hostel"):
-        return POICategory.LODGING, amenity
-    if tourism in ("hotel", "guest_house", "motel", "hostel", "camp_site"):
+    category = _AMENITY_CATEGORIES.get(amenity) if amenity else None
+    if category in _AMENITY_OVER_TOURISM:
+        return category, amenity
+    if tourism in _TOURISM_LODGING:
         return POICategory.LODGING, tourism
-
-    # Health
-    if amenity in ("hospital", "pharmacy", "clinic", "doctors", "dentist"):
-        return POICategory.HEALTH, amenity
-
-    # Services
-    if amenity in ("bank", "atm", "post_office", "bureau_de_change", "money_transfer"):
-        return POICategory.SERVICES, amenity
-
-    # Government
-    if amenity in ("police", "embassy", "townhall", "courthouse"):
-        return POICategory.GOVERNMENT, amenity
-
-    # Education
-    if amenity in ("school", "university", "college", "library", "kindergarten"):
-        return POICategory.EDUCATION, amenity
+    if category is not None:
+        return category, amenity
 
     # Shopping
     if shop:
@@ -191,9 +220,9 @@ def normalize_text(text: str | None) -> str | None:
     """Normalize text for searching (lowercase, trim, remove extra spaces)."""
     if not text:
         return None
-    import re
-    normalized = text.lower().strip()
-    normalized = re.sub(r'\s+', ' ', normalized)
+    # split() drops leading/trailing whitespace and splits on the same
+    # characters as \s, so this matches a strip plus re.sub(r"\s+", " ")
+    normalized = " ".join(text.lower().split())
     return normalized if normalized else None
 
 
@@ -203,20 +232,21 @@ def build_search_text(name: str | None, tags: dict[str, str]) -> str:
     Combines name, brand, operator, old_name from tags. Falls back to
     amenity/shop/tourism if no name-like fields are present.
     """
+    get = tags.get
     parts = []
     
     if name:
         parts.append(name)
     
-    for key in ["brand", "operator", "old_name"]:
-        if key in tags and tags[key]:
-            parts.append(tags[key])
+    for key in ("brand", "operator", "old_name"):
+        if value := get(key):
+            parts.append(value)
     
     # If no name-like fields, use category tags
     if not parts:
-        for key in ["amenity", "shop", "tourism"]:
-            if key in tags and tags[key]:
-                parts.append(tags[key])
+        for key in ("amenity", "shop", "tourism"):
+            if value := get(key):
+                parts.append(value)
                 break
     
     # Last resort
@@ -226,6 +256,30 @@ def build_search_text(name: str | None, tags: dict[str, str]) -> str:
     return " ".join(parts).strip()
 
 
+# Keys read by Address.from_osm_tags; most POIs carry none of them
+_ADDRESS_TAGS = frozenset({
+    "addr:street",
+    "addr:housenumber",
+    "addr:city",
+    "addr:postcode",
+    "addr:district",
+    "addr:province",
+})
+
+
+@lru_cache(maxsize=4096)
+def _parse_opening_hours(raw: str) -> OperatingHours | None:
+    """Parse an opening_hours value, or None if it cannot be parsed.
+
+    A few dozen distinct values cover most POIs, so results are cached
+    and shared; OperatingHours is immutable.
+    """
+    try:
+        return OperatingHours.parse(raw)
+    except Exception:
+        return None  # Skip unparseable hours
+
+
 def transform_poi(
     id: int,
     tags: dict[str, str],
@@ -243,19 +297,19 @@ def transform_poi(
     Returns:
         POI domain entity
     """
+    # Each tag is looked up once, through a bound get
+    get = tags.get
     category, subcategory = categorize_poi(tags)
-    address = Address.from_osm_tags(tags)
+    # Any of the keys present gives a non-empty address
+    address = None if _ADDRESS_TAGS.isdisjoint(tags) else Address.from_osm_tags(tags)
 
-    opening_hours = None
-    if "opening_hours" in tags:
-        try:
-            opening_hours = OperatingHours.parse(tags["opening_hours"])
-        except Exception:
-            pass  # Skip unparseable hours
+    raw_hours = get("opening_hours")
+    opening_hours = _parse_opening_hours(raw_hours) if raw_hours is not None else None
 
-    name = tags.get("name")
-    has_name = bool(name and name.strip())
+    name = get("name")
     name_normalized = normalize_text(name)
+    # normalize_text gives None exactly for a missing or blank name
+    has_name = name_normalized is not None
     search_text = build_search_text(name, tags)
     search_text_normalized = normalize_text(search_text)
 
@@ -265,11 +319,11 @@ def transform_poi(
         category=category,
         subcategory=subcategory,
         name=name,
-        address=address if not address.is_empty else None,
-        phone=tags.get("phone") or tags.get("contact:phone"),
+        address=address,
+        phone=get("phone") or get("contact:phone"),
         opening_hours=opening_hours,
-        website=tags.get("website") or tags.get("contact:website"),
-        tags=tags,
+        website=get("website") or get("contact:website"),
+        tags=tags or None,
         name_normalized=name_normalized,
         search_text=search_text,
         search_text_normalized=search_text_normalized,
@@ -278,6 +332,16 @@ def transform_poi(
     )
 
 
+# OSM admin_level -> (zone type, hierarchy level)
+_ZONE_TYPES = {
+    "2": ("country", 0),
+    "4": ("region", 1),
+    "6": ("district", 2),
+    "8": ("commune", 3),
+    "10": ("fokontany", 4),
+}
+
+
 def parse_zone_type(level: str | None) -> tuple[str | None, int | None]:
     """Map OSM admin_level to a zone type string and hierarchy level.
     
@@ -287,27 +351,20 @@ def parse_zone_type(level: str | None) -> tuple[str | None, int | None]:
     if not level:
         return None, None
 
-    mapping = {
-        "2": ("country", 0),
-        "4": ("region", 1),
-        "6": ("district", 2),
-        "8": ("commune", 3),
-        "10": ("fokontany", 4),
-    }
-    return mapping.get(level.strip(), (None, None))
+    return _ZONE_TYPES.get(level.strip(), (None, None))
 
 
 def transform_zone(
     id: int,
     tags: dict[str, str],
-    coords: list[tuple[float, float]],
+    coords: Iterable[float],
 ) -> Zone | None:
     """Transform OSM relation data to Zone entity.
 
     Args:
         id: OSM relation ID
         tags: OSM tags dictionary
-        coords: List of (lon, lat) coordinate tuples for outer ring
+        coords: Packed (lon, lat) values of the outer ring
 
     Returns:
         Zone domain entity or None if invalid
@@ -320,7 +377,9 @@ def transform_zone(
     if not name:
         return None
 
-    geometry = [Coordinates(lat=lat, lon=lon) for lon, lat in coords]
+    # Node locations come straight from the OSM file: skip re-validation
+    # and keep them packed, as for roads
+    geometry = PackedCoordinates(coords)
     if len(geometry) < 3:
         return None
 
@@ -340,5 +399,5 @@ def transform_zone(
         iso_code=tags.get("ISO3166-2"),
         population=population,
         parent_zone_id=None,  # Will be computed later via spatial containment
-        tags=tags,
+        tags=tags or None,
     )
@@ -1,5 +1,8 @@
 """Raw OSM data types for infrastructure layer."""
 
+from __future__ import annotations
+
+from array import array
 from dataclasses import dataclass
 
 
@@ -9,7 +12,7 @@ class RawWay:
 
     id: int
     tags: dict[str, str]
-    coords: list[tuple[float, float]]  # (lon, lat) pairs
+    coords: array[float]  # packed float64: lon0, lat0, lon1, lat1, ...
 
 
 @dataclass(slots=True)
@@ -28,4 +31,4 @@ class RawRelation:
 
     id: int
     tags: dict[str, str]
-    coords: list[tuple[float, float]]  # outer ring (lon, lat) pairs
+    coords: array[float]  # outer ring, packed like RawWay.coords
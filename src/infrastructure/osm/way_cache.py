@@ -0,0 +1,121 @@
+"""On-disk cache of way geometries collected from a PBF file.
+
+Resolving way geometries needs a located pass over the whole file, while
+the result only depends on the file and the requested ways. The cache
+keeps it next to the PBF so later runs on the same file can skip that pass.
+
+Layout (native byte order, machine-local): a header, the requested way ids,
+then the ways that had a geometry in compressed sparse row form: their ids,
+offsets into the coordinate column, and the packed lon,lat coordinates.
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+from array import array
+from collections.abc import Collection
+from pathlib import Path
+from typing import BinaryIO
+
+from infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+_MAGIC = b"CHWAYS01"
+# magic, requested way count, stored way count, coordinate count
+_HEADER = struct.Struct("=8sqqq")
+
+
+def cache_path(pbf_path: Path) -> Path:
+    """Path of the way cache belonging to a PBF file."""
+    return pbf_path.with_name(f"{pbf_path.name}.ways.cache")
+
+
+def _read_array(f: BinaryIO, typecode: str, count: int) -> array:
+    """Read count values of typecode from f."""
+    values = array(typecode)
+    values.fromfile(f, count)
+    return values
+
+
+def load_ways(pbf_path: Path, way_ids: Collection[int]) -> dict[int, array[float]] | None:
+    """Load cached geometries for way_ids.
+
+    Args:
+        pbf_path: PBF file the geometries were collected from
+        way_ids: Ways the caller needs
+
+    Returns:
+        Geometries of the requested ways that have one, or None if the
+        cache is missing, unreadable, older than the PBF, or does not
+        cover way_ids
+    """
+    path = cache_path(pbf_path)
+    try:
+        if path.stat().st_mtime < pbf_path.stat().st_mtime:
+            logger.info("Way cache is stale", path=str(path))
+            return None
+        with path.open("rb") as f:
+            magic, requested, stored, coord_count = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != _MAGIC:
+                logger.warning("Way cache has an unknown format", path=str(path))
+                return None
+            if not set(_read_array(f, "q", requested)).issuperset(way_ids):
+                logger.info("Way cache does not cover requested ways", path=str(path))
+                return None
+            ids = _read_array(f, "q", stored)
+            offsets = _read_array(f, "q", stored + 1)
+            coords = _read_array(f, "d", coord_count)
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, ValueError, struct.error) as e:
+        # Truncated or otherwise unreadable: rescan, and rewrite it after
+        logger.warning("Could not read way cache", path=str(path), error=str(e))
+        return None
+
+    wanted = way_ids if isinstance(way_ids, (set, frozenset)) else set(way_ids)
+    ways = {
+        way_id: coords[offsets[i] : offsets[i + 1]]
+        for i, way_id in enumerate(ids)
+        if way_id in wanted
+    }
+    logger.info("Loaded way cache", path=str(path), ways=len(ways))
+    return ways
+
+
+def save_ways(
+    pbf_path: Path, way_ids: Collection[int], ways: dict[int, array[float]]
+) -> None:
+    """Write collected geometries to the cache of pbf_path.
+
+    Failures are logged and ignored: the cache is only an optimization.
+
+    Args:
+        pbf_path: PBF file the geometries were collected from
+        way_ids: Ways that were requested, including ones without geometry
+        ways: Collected geometries by way id
+    """
+    path = cache_path(pbf_path)
+    ids = array("q", ways)
+    offsets = array("q", [0])
+    coords = array("d")
+    for way_coords in ways.values():
+        coords.extend(way_coords)
+        offsets.append(len(coords))
+
+    tmp = path.with_name(f"{path.name}.tmp")
+    try:
+        with tmp.open("wb") as f:
+            f.write(_HEADER.pack(_MAGIC, len(way_ids), len(ids), len(coords)))
+            array("q", way_ids).tofile(f)
+            ids.tofile(f)
+            offsets.tofile(f)
+            coords.tofile(f)
+        # Readers never see a partially written cache
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning("Could not write way cache", path=str(path), error=str(e))
+        tmp.unlink(missing_ok=True)
+        return
+    logger.info("Saved way cache", path=str(path), ways=len(ids))
@@ -4,6 +4,7 @@ Writes transformed OSM data to the lemurion database.
 """
 
 from infrastructure.postgres.connection import create_pool, get_pool
+from infrastructure.postgres.indexes import deferred_indexes
 from infrastructure.postgres.writer import PostgresWriter
 
-__all__ = ["create_pool", "get_pool", "PostgresWriter"]
+__all__ = ["create_pool", "get_pool", "deferred_indexes", "PostgresWriter"]
@@ -2,12 +2,32 @@
 
 from contextlib import asynccontextmanager
 from collections.abc import AsyncIterator
+from typing import Any
 
 from psycopg_pool import AsyncConnectionPool
 
 from infrastructure.config import Settings
 
 
+def _build_pool(settings: Settings) -> AsyncConnectionPool:
+    """Configure an unopened pool from settings."""
+    kwargs: dict[str, Any] = {"prepare_threshold": settings.postgres_prepare_threshold}
+    if not settings.postgres_synchronous_commit:
+        kwargs["options"] = "-c synchronous_commit=off"
+    return AsyncConnectionPool(
+        conninfo=settings.postgres_dsn,
+        min_size=settings.postgres_pool_min_size,
+        max_size=settings.pool_max_size,
+        # Connections above min_size are closed after idling this long
+        max_idle=settings.postgres_pool_max_idle,
+        num_workers=settings.postgres_pool_num_workers,
+        # The writer repeats the same few upserts for every batch, so
+        # preparing them up front saves parsing and planning each time
+        kwargs=kwargs,
+        open=False,
+    )
+
+
 @asynccontextmanager
 async def create_pool(settings: Settings) -> AsyncIterator[AsyncConnectionPool]:
     """Create and manage an async connection pool.
@@ -23,12 +43,7 @@ async def create_pool(settings: Settings) -> AsyncIterator[AsyncConnectionPool]:
     Yields:
         Configured async connection pool
     """
-    pool = AsyncConnectionPool(
-        conninfo=settings.postgres_dsn,
-        min_size=2,
-        max_size=10,
-        open=False,
-    )
+    pool = _build_pool(settings)
 
     try:
         await pool.open()
@@ -54,11 +69,6 @@ async def get_pool(settings: Settings) -> AsyncConnectionPool:
     Returns:
         Opened async connection pool
     """
-    pool = AsyncConnectionPool(
-        conninfo=settings.postgres_dsn,
-        min_size=2,
-        max_size=10,
-        open=False,
-    )
+    pool = _build_pool(settings)
     await pool.open()
     return pool
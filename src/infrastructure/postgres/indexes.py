@@ -0,0 +1,63 @@
+"""Secondary index handling around bulk loads."""
+
+from collections.abc import AsyncIterator, Collection
+from contextlib import asynccontextmanager
+
+from psycopg import sql
+from psycopg_pool import AsyncConnectionPool
+
+from infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Non-unique indexes only: primary keys back the writer's ON CONFLICT and
+# constraint indexes cannot be dropped on their own
+_SECONDARY_INDEXES_SQL = """
+    SELECT i.relname, pg_get_indexdef(x.indexrelid)
+    FROM pg_index AS x
+    JOIN pg_class AS i ON i.oid = x.indexrelid
+    JOIN pg_class AS t ON t.oid = x.indrelid
+    JOIN pg_namespace AS n ON n.oid = t.relnamespace
+    WHERE n.nspname = current_schema()
+      AND t.relname = ANY(%s)
+      AND NOT x.indisunique
+    ORDER BY t.relname, i.relname
+"""
+
+
+@asynccontextmanager
+async def deferred_indexes(
+    pool: AsyncConnectionPool,
+    tables: Collection[str],
+) -> AsyncIterator[None]:
+    """Drop secondary indexes of tables for a bulk load, then rebuild them.
+
+    Building an index once over the loaded rows is much cheaper than
+    updating it row by row, GiST indexes especially. Indexes are rebuilt
+    from their original definitions even if the load fails. Queries
+    running meanwhile get no index support, so use for initial loads.
+
+    Each definition is logged at WARNING before its index is dropped: if
+    the process is killed mid-load, the rebuild never runs and the log is
+    where the CREATE INDEX statements can be recovered from.
+
+    Args:
+        pool: Database connection pool
+        tables: Tables about to be loaded
+    """
+    async with pool.connection() as conn:
+        cur = await conn.execute(_SECONDARY_INDEXES_SQL, (list(tables),))
+        indexes = await cur.fetchall()
+        for name, definition in indexes:
+            logger.warning("Dropping index for bulk load", index=name, definition=definition)
+            await conn.execute(sql.SQL("DROP INDEX {}").format(sql.Identifier(name)))
+    logger.info("Dropped secondary indexes for bulk load", count=len(indexes))
+
+    try:
+        yield
+    finally:
+        async with pool.connection() as conn:
+            for name, definition in indexes:
+                logger.info("Rebuilding index", index=name)
+                await conn.execute(definition)
+        logger.info("Rebuilt secondary indexes", count=len(indexes))
@@ -9,13 +9,13 @@ from alembic import context
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", ".."))
 
-from infrastructure.config import settings
+from infrastructure.config import get_settings
 
 # Alembic Config object
 config = context.config
 
 # Set database URL from settings
-config.set_main_option("sqlalchemy.url", settings.postgres_dsn)
+config.set_main_option("sqlalchemy.url", get_settings().postgres_dsn)
 
 # Interpret the config file for Python logging
 if config.config_file_name is not None:
@@ -18,10 +18,14 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    op.execute("ALTER TABLE zones ADD COLUMN zone_type VARCHAR(20)")
+    # Convert admin_level in place rather than adding zone_type, filling it
+    # with an UPDATE and dropping admin_level: the type change rewrites the
+    # table once and leaves no dead row versions behind, and the column
+    # keeps its NOT NULL without another scan to check it
+    op.execute("DROP INDEX IF EXISTS idx_zones_admin_level")
     op.execute("""
-        UPDATE zones
-        SET zone_type = CASE admin_level
+        ALTER TABLE zones ALTER COLUMN admin_level TYPE VARCHAR(20)
+        USING CASE admin_level
             WHEN 2 THEN 'country'
             WHEN 4 THEN 'region'
             WHEN 6 THEN 'district'
@@ -30,17 +34,18 @@ def upgrade() -> None:
             ELSE 'unknown'
         END
     """)
-    op.execute("ALTER TABLE zones ALTER COLUMN zone_type SET NOT NULL")
-    op.execute("DROP INDEX IF EXISTS idx_zones_admin_level")
-    op.execute("ALTER TABLE zones DROP COLUMN admin_level")
-    op.execute("CREATE INDEX idx_zones_zone_type ON zones (zone_type)")
+    op.execute("ALTER TABLE zones RENAME COLUMN admin_level TO zone_type")
+    # CONCURRENTLY cannot run in a transaction: commit the changes above and
+    # build the index without blocking writes to zones while it runs
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY idx_zones_zone_type ON zones (zone_type)")
 
 
 def downgrade() -> None:
-    op.execute("ALTER TABLE zones ADD COLUMN admin_level INT")
+    op.execute("DROP INDEX IF EXISTS idx_zones_zone_type")
     op.execute("""
-        UPDATE zones
-        SET admin_level = CASE zone_type
+        ALTER TABLE zones ALTER COLUMN zone_type TYPE INT
+        USING CASE zone_type
             WHEN 'country' THEN 2
             WHEN 'region' THEN 4
             WHEN 'district' THEN 6
@@ -49,7 +54,6 @@ def downgrade() -> None:
             ELSE NULL
         END
     """)
-    op.execute("ALTER TABLE zones ALTER COLUMN admin_level SET NOT NULL")
-    op.execute("DROP INDEX IF EXISTS idx_zones_zone_type")
-    op.execute("ALTER TABLE zones DROP COLUMN zone_type")
-    op.execute("CREATE INDEX idx_zones_admin_level ON zones (admin_level)")
+    op.execute("ALTER TABLE zones RENAME COLUMN zone_type TO admin_level")
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY idx_zones_admin_level ON zones (admin_level)")
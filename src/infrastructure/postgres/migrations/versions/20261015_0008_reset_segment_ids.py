@@ -0,0 +1,32 @@
+"""Clear segments after the segment id scheme changed.
+
+Segment ids are now a BLAKE2b hash of the packed road id and endpoints
+instead of a SHA-1 of their text form. Upserts key on id, so segments
+stored under the old ids would stay next to the reloaded ones and every
+road would be routed over twice. Segments are derived from roads and the
+next load rebuilds them.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-15
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("TRUNCATE segments")
+
+
+def downgrade() -> None:
+    # Older releases generate the previous ids; they rebuild segments too
+    op.execute("TRUNCATE segments")
@@ -1,37 +1,220 @@
 """Async PostgreSQL writer for domain entities."""
 
 import json
-from collections.abc import Iterable
+import struct
+import sys
+from array import array
+from collections.abc import AsyncIterator, Callable, Collection, Iterable, Mapping, Sequence
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from itertools import islice
 from typing import Any
 
 from psycopg import AsyncConnection
-from psycopg_pool import AsyncConnectionPool
+from psycopg_pool import AsyncConnectionPool, PoolTimeout
 
+from application.exceptions import PipelineRecoverableError
 from application.ports.repository import GeoRepository
-from domain import POI, Road, Segment, Zone
+from domain import POI, Coordinates, Road, Segment, Zone
+from domain.value_objects import PackedCoordinates
 from infrastructure.logging import get_logger
 
 logger = get_logger(__name__)
 
 
-def _coords_to_wkt_linestring(coords: list[Any]) -> str:
-    """Convert coordinates to WKT LineString."""
-    points = ", ".join(f"{c.lon} {c.lat}" for c in coords)
-    return f"SRID=4326;LINESTRING({points})"
+# Geometries are sent as hex EWKB, which PostGIS parses far faster than
+# WKT and which packs coordinates without formatting each float as text.
+# Layout: byte order (1 = little endian), geometry type with the SRID flag,
+# SRID, then counts and float64 lon/lat pairs.
+_SRID = 4326
+_EWKB_SRID_FLAG = 0x20000000
+_EWKB_POINT = struct.Struct("<BIIdd")
+_EWKB_LINESTRING = struct.Struct("<BIII")
+_EWKB_POLYGON = struct.Struct("<BIIII")
+_LITTLE_ENDIAN = sys.byteorder == "little"
 
 
-def _coords_to_wkt_point(coord: Any) -> str:
-    """Convert coordinate to WKT Point."""
-    return f"SRID=4326;POINT({coord.lon} {coord.lat})"
+def _pack_lon_lat(coords: Sequence[Coordinates]) -> bytes:
+    """Pack coordinates as little-endian float64 lon, lat pairs."""
+    if isinstance(coords, PackedCoordinates):
+        if _LITTLE_ENDIAN:
+            return coords.lon_lat.tobytes()
+        values = array("d", coords.lon_lat)
+    else:
+        values = array("d", [v for c in coords for v in (c.lon, c.lat)])
+    if not _LITTLE_ENDIAN:
+        values.byteswap()
+    return values.tobytes()
 
 
-def _coords_to_wkt_polygon(coords: list[Any]) -> str:
-    """Convert coordinates to WKT Polygon."""
-    points = ", ".join(f"{c.lon} {c.lat}" for c in coords)
+def _ewkb_linestring(coords: Sequence[Coordinates]) -> str:
+    """Encode coordinates as a hex EWKB LineString."""
+    header = _EWKB_LINESTRING.pack(1, 2 | _EWKB_SRID_FLAG, _SRID, len(coords))
+    return (header + _pack_lon_lat(coords)).hex()
+
+
+def _ewkb_point(coord: Coordinates) -> str:
+    """Encode a coordinate as a hex EWKB Point."""
+    return _EWKB_POINT.pack(1, 1 | _EWKB_SRID_FLAG, _SRID, coord.lon, coord.lat).hex()
+
+
+def _ewkb_polygon(coords: Sequence[Coordinates]) -> str:
+    """Encode coordinates as a hex EWKB Polygon with a single ring."""
+    ring: Sequence[Coordinates]
     # Close the ring if not already closed
-    if coords[0] != coords[-1]:
-        points += f", {coords[0].lon} {coords[0].lat}"
-    return f"SRID=4326;POLYGON(({points}))"
+    if isinstance(coords, PackedCoordinates):
+        values = coords.lon_lat
+        ring = coords if values[:2] == values[-2:] else PackedCoordinates(values + values[:2])
+    else:
+        ring = list(coords)
+        if ring[0] != ring[-1]:
+            ring.append(ring[0])
+    header = _EWKB_POLYGON.pack(1, 3 | _EWKB_SRID_FLAG, _SRID, 1, len(ring))
+    return (header + _pack_lon_lat(ring)).hex()
+
+
+def _json_serializer() -> Callable[[Any], str]:
+    """Return an orjson-backed serializer when installed, else json.dumps.
+
+    Rows are encoded as text for both executemany and COPY, so orjson's
+    bytes are decoded here.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps
+
+    def dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    return dumps
+
+
+# Tags and addresses are serialized for every row
+_dumps_json = _json_serializer()
+
+
+@dataclass(frozen=True, slots=True)
+class _UpsertSQL:
+    """Statements upserting rows into one table, by executemany or COPY.
+
+    COPY cannot resolve conflicts, so COPY loads go through a temporary
+    staging table and one INSERT ... SELECT applies the same ON CONFLICT
+    rule as the executemany path. The *_new statements are for loads of
+    rows known not to exist yet, which need no conflict handling.
+
+    Attributes:
+        insert: Parameterized upsert of one row, for executemany
+        stage: Creates the staging table unless the transaction already
+            has it (dropped on commit)
+        copy: COPY into the staging table
+        merge: Upserts the staged rows into the table
+        clear: Empties the staging table for the next batch
+        insert_new: Parameterized plain insert of one row
+        copy_new: COPY straight into the table, or None if values must be
+            wrapped and new rows still go through staging
+        merge_new: Plain insert of the staged rows into the table
+    """
+
+    insert: str
+    stage: str
+    copy: str
+    merge: str
+    clear: str
+    insert_new: str
+    copy_new: str | None
+    merge_new: str
+
+
+def _upsert_sql(
+    table: str,
+    columns: Sequence[str],
+    geometry: Collection[str],
+    wrap: Mapping[str, str] | None = None,
+) -> _UpsertSQL:
+    """Build the upsert statements for a table keyed by id.
+
+    Args:
+        table: Target table
+        columns: Inserted columns, in row tuple order; id first
+        geometry: Columns given as hex EWKB strings
+        wrap: SQL applied to a column's value before storing it, with {}
+            standing for the value
+    """
+    wrap = wrap or {}
+    stage = f"_stage_{table}"
+    names = ", ".join(columns)
+    values = ", ".join(
+        wrap.get(c, "{}").format("%s::geometry" if c in geometry else "%s")
+        for c in columns
+    )
+    # Unconstrained geometry in staging, so typmods only apply after wrap
+    staged = ", ".join(f"{c}::geometry AS {c}" if c in geometry else c for c in columns)
+    selected = ", ".join(wrap.get(c, "{}").format(c) for c in columns)
+    conflict = (
+        "ON CONFLICT (id) DO UPDATE SET "
+        + ", ".join(f"{c} = EXCLUDED.{c}" for c in columns if c != "id")
+        + ", updated_at = NOW()"
+    )
+    insert = f"INSERT INTO {table} ({names}) VALUES ({values})"
+    merge = f"INSERT INTO {table} ({names}) SELECT {selected} FROM {stage}"
+    return _UpsertSQL(
+        insert=f"{insert} {conflict}",
+        stage=(
+            f"CREATE TEMP TABLE IF NOT EXISTS {stage} ON COMMIT DROP AS "
+            f"SELECT {staged} FROM {table} WITH NO DATA"
+        ),
+        copy=f"COPY {stage} ({names}) FROM STDIN",
+        merge=f"{merge} {conflict}",
+        clear=f"TRUNCATE {stage}",
+        insert_new=insert,
+        copy_new=None if wrap else f"COPY {table} ({names}) FROM STDIN",
+        merge_new=merge,
+    )
+
+
+_ROADS_SQL = _upsert_sql(
+    "roads",
+    (
+        "id", "geometry", "road_type", "surface", "smoothness",
+        "name", "lanes", "oneway", "max_speed",
+        "length", "surface_factor", "smoothness_factor",
+        "effective_speed_kmh", "penalized_speed_kmh", "tags",
+    ),
+    geometry={"geometry"},
+)
+
+_POIS_SQL = _upsert_sql(
+    "pois",
+    (
+        "id", "geometry", "category", "subcategory", "name",
+        "address", "phone", "opening_hours", "price_range", "website",
+        "is_24_7", "formatted_address",
+        "name_normalized", "search_text", "search_text_normalized", "has_name", "popularity",
+        "tags",
+    ),
+    geometry={"geometry"},
+)
+
+_ZONES_SQL = _upsert_sql(
+    "zones",
+    (
+        "id", "geometry", "zone_type", "name", "level", "parent_zone_id",
+        "iso_code", "population", "area", "centroid", "tags",
+    ),
+    geometry={"geometry", "centroid"},
+    wrap={"geometry": "ST_Multi({})"},
+)
+
+_SEGMENTS_SQL = _upsert_sql(
+    "segments",
+    (
+        "id", "road_id", "geometry", "start_point", "end_point",
+        "length", "surface_factor", "smoothness_factor", "rainy_season_factor",
+        "oneway", "base_speed", "effective_speed_kmh", "travel_time_seconds", "cost",
+    ),
+    geometry={"geometry", "start_point", "end_point"},
+)
 
 
 class PostgresWriter(GeoRepository):
@@ -45,24 +228,133 @@ class PostgresWriter(GeoRepository):
             count = await writer.save_roads(roads)
     """
 
-    def __init__(self, pool: AsyncConnectionPool, batch_size: int = 1000) -> None:
+    def __init__(
+        self,
+        pool: AsyncConnectionPool,
+        batch_size: int = 1000,
+        copy_min_rows: int = 500,
+        commit_every: int = 10,
+        batch_sizes: Mapping[str, int] | None = None,
+        insert_only: bool = False,
+    ) -> None:
         """Initialize writer.
 
         Args:
             pool: Async connection pool
             batch_size: Number of records per batch insert
+            copy_min_rows: Batches of at least this many rows are loaded
+                with COPY; smaller ones use executemany, where the staging
+                table would cost more than it saves
+            commit_every: Batches per transaction in the streaming save_*
+                methods; a failed load rolls back at most this many
+            batch_sizes: batch_size overrides by entity type ("roads",
+                "pois", "zones", "segments") for the streaming save_*
+                methods, e.g. smaller batches for large zone polygons
+            insert_only: Write with plain INSERT and COPY straight into the
+                tables, skipping conflict handling and staging; only for
+                loads into empty tables, as an existing id fails the write
         """
         self.pool = pool
         self.batch_size = batch_size
+        self.copy_min_rows = copy_min_rows
+        self.commit_every = commit_every
+        self.batch_sizes = dict(batch_sizes or {})
+        self.insert_only = insert_only
+
+    @asynccontextmanager
+    async def _batch_connection(self) -> AsyncIterator[AsyncConnection]:
+        """Borrow a pooled connection for one batch write.
+
+        The write is committed when the block exits without error. Pool
+        exhaustion under concurrent batch writes is reported as
+        PipelineRecoverableError; the upserts are idempotent, so the
+        caller may safely retry the load sequentially. With insert_only
+        such a retry would fail on the rows already written, so the
+        PoolTimeout propagates as is.
+        """
+        try:
+            async with self.pool.connection() as conn:
+                yield conn
+        except PoolTimeout as exc:
+            if self.insert_only:
+                raise
+            raise PipelineRecoverableError(f"Connection pool exhausted: {exc}") from exc
+
+    async def _upsert(
+        self,
+        conn: AsyncConnection,
+        sql: _UpsertSQL,
+        batch: list[tuple[Any, ...]],
+    ) -> int:
+        """Upsert a batch of rows; the caller commits."""
+        if self.insert_only:
+            return await self._insert_new(conn, sql, batch)
+        async with conn.cursor() as cur:
+            if len(batch) >= self.copy_min_rows:
+                await cur.execute(sql.stage)
+                async with cur.copy(sql.copy) as copy:
+                    for row in batch:
+                        await copy.write_row(row)
+                await cur.execute(sql.merge)
+                await cur.execute(sql.clear)
+            else:
+                await cur.executemany(sql.insert, batch)
+        return len(batch)
+
+    async def _insert_new(
+        self,
+        conn: AsyncConnection,
+        sql: _UpsertSQL,
+        batch: list[tuple[Any, ...]],
+    ) -> int:
+        """Insert a batch of rows that do not exist yet; the caller commits."""
+        async with conn.cursor() as cur:
+            if len(batch) < self.copy_min_rows:
+                await cur.executemany(sql.insert_new, batch)
+            elif sql.copy_new:
+                async with cur.copy(sql.copy_new) as copy:
+                    for row in batch:
+                        await copy.write_row(row)
+            else:
+                await cur.execute(sql.stage)
+                async with cur.copy(sql.copy) as copy:
+                    for row in batch:
+                        await copy.write_row(row)
+                await cur.execute(sql.merge_new)
+                await cur.execute(sql.clear)
+        return len(batch)
+
+    async def _upsert_stream(
+        self, entity_type: str, rows: Iterable[tuple[Any, ...]], sql: _UpsertSQL
+    ) -> int:
+        """Upsert rows in batches of the entity type's size over one connection.
+
+        Commits every commit_every batches rather than after each one, so
+        a long load waits for far fewer WAL flushes; the pooled connection
+        commits the rest when it is returned.
+        """
+        batch_size = self.batch_sizes.get(entity_type, self.batch_size)
+        count = 0
+        batches = 0
+        rows = iter(rows)
+        async with self.pool.connection() as conn:
+            while batch := list(islice(rows, batch_size)):
+                count += await self._upsert(conn, sql, batch)
+                batches += 1
+                if batches % self.commit_every == 0:
+                    await conn.commit()
+        return count
 
     def _road_to_tuple(self, road: Road) -> tuple[Any, ...]:
         """Convert Road entity to insert tuple."""
+        # Enum values are read through _value_, a plain attribute; .value is
+        # a descriptor call costing about 50x more, paid on every row
         return (
             road.id,
-            _coords_to_wkt_linestring(road.geometry),
-            road.road_type.value,
-            road.surface.value if road.surface else None,
-            road.smoothness.value if road.smoothness else None,
+            _ewkb_linestring(road.geometry),
+            road.road_type._value_,
+            road.surface._value_ if road.surface else None,
+            road.smoothness._value_ if road.smoothness else None,
             road.name,
             road.lanes,
             road.oneway,
@@ -72,7 +364,7 @@ class PostgresWriter(GeoRepository):
             road.smoothness_factor,
             road.effective_speed_kmh,
             road.penalized_speed_kmh,
-            json.dumps(road.tags) if road.tags else None,
+            _dumps_json(road.tags) if road.tags else None,
         )
 
     async def save_roads(self, roads: Iterable[Road]) -> int:
@@ -84,21 +376,7 @@ class PostgresWriter(GeoRepository):
         Returns:
             Number of roads saved
         """
-        count = 0
-        batch: list[tuple[Any, ...]] = []
-
-        async with self.pool.connection() as conn:
-            for road in roads:
-                batch.append(self._road_to_tuple(road))
-
-                if len(batch) >= self.batch_size:
-                    count += await self._insert_roads_batch(conn, batch)
-                    batch = []
-
-            # Insert remaining
-            if batch:
-                count += await self._insert_roads_batch(conn, batch)
-
+        count = await self._upsert_stream("roads", map(self._road_to_tuple, roads), _ROADS_SQL)
         logger.info("Written roads", count=count)
         return count
 
@@ -113,12 +391,26 @@ class PostgresWriter(GeoRepository):
         Returns:
             Number of roads saved
         """
-        if not roads:
+        return await self.save_encoded_roads(self.encode_roads(roads))
+
+    def encode_roads(self, roads: list[Road]) -> list[tuple[Any, ...]]:
+        """Convert roads to insert tuples (safe to run in a worker thread)."""
+        return [self._road_to_tuple(road) for road in roads]
+
+    async def save_encoded_roads(self, rows: Sequence[tuple[Any, ...]]) -> int:
+        """Insert rows produced by encode_roads.
+
+        Args:
+            rows: Insert tuples (already batched)
+
+        Returns:
+            Number of roads saved
+        """
+        if not rows:
             return 0
 
-        async with self.pool.connection() as conn:
-            batch = [self._road_to_tuple(road) for road in roads]
-            return await self._insert_roads_batch(conn, batch)
+        async with self._batch_connection() as conn:
+            return await self._insert_roads_batch(conn, list(rows))
 
     async def _insert_roads_batch(
         self,
@@ -126,42 +418,13 @@ class PostgresWriter(GeoRepository):
         batch: list[tuple[Any, ...]],
     ) -> int:
         """Insert a batch of roads."""
-        query = """
-            INSERT INTO roads (
-                id, geometry, road_type, surface, smoothness,
-                name, lanes, oneway, max_speed,
-                length, surface_factor, smoothness_factor,
-                effective_speed_kmh, penalized_speed_kmh, tags
-            )
-            VALUES (%s, ST_GeomFromEWKT(%s), %s, %s, %s, %s, %s, %s, %s,
-                    %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (id) DO UPDATE SET
-                geometry = EXCLUDED.geometry,
-                road_type = EXCLUDED.road_type,
-                surface = EXCLUDED.surface,
-                smoothness = EXCLUDED.smoothness,
-                name = EXCLUDED.name,
-                lanes = EXCLUDED.lanes,
-                oneway = EXCLUDED.oneway,
-                max_speed = EXCLUDED.max_speed,
-                length = EXCLUDED.length,
-                surface_factor = EXCLUDED.surface_factor,
-                smoothness_factor = EXCLUDED.smoothness_factor,
-                effective_speed_kmh = EXCLUDED.effective_speed_kmh,
-                penalized_speed_kmh = EXCLUDED.penalized_speed_kmh,
-                tags = EXCLUDED.tags,
-                updated_at = NOW()
-        """
-        async with conn.cursor() as cur:
-            await cur.executemany(query, batch)
-        await conn.commit()
-        return len(batch)
+        return await self._upsert(conn, _ROADS_SQL, batch)
 
     def _poi_to_tuple(self, poi: POI) -> tuple[Any, ...]:
         """Convert POI entity to insert tuple."""
         address_json = None
         if poi.address:
-            address_json = json.dumps({
+            address_json = _dumps_json({
                 "street": poi.address.street,
                 "housenumber": poi.address.housenumber,
                 "city": poi.address.city,
@@ -170,8 +433,8 @@ class PostgresWriter(GeoRepository):
 
         return (
             poi.id,
-            _coords_to_wkt_point(poi.coordinates),
-            poi.category.value,
+            _ewkb_point(poi.coordinates),
+            poi.category._value_,
             poi.subcategory,
             poi.name,
             address_json,
@@ -186,7 +449,7 @@ class PostgresWriter(GeoRepository):
             poi.search_text_normalized,
             poi.has_name,
             poi.popularity,
-            json.dumps(poi.tags) if poi.tags else None,
+            _dumps_json(poi.tags) if poi.tags else None,
         )
 
     async def save_pois(self, pois: Iterable[POI]) -> int:
@@ -198,20 +461,7 @@ class PostgresWriter(GeoRepository):
         Returns:
             Number of POIs saved
         """
-        count = 0
-        batch: list[tuple[Any, ...]] = []
-
-        async with self.pool.connection() as conn:
-            for poi in pois:
-                batch.append(self._poi_to_tuple(poi))
-
-                if len(batch) >= self.batch_size:
-                    count += await self._insert_pois_batch(conn, batch)
-                    batch = []
-
-            if batch:
-                count += await self._insert_pois_batch(conn, batch)
-
+        count = await self._upsert_stream("pois", map(self._poi_to_tuple, pois), _POIS_SQL)
         logger.info("Written POIs", count=count)
         return count
 
@@ -226,12 +476,26 @@ class PostgresWriter(GeoRepository):
         Returns:
             Number of POIs saved
         """
-        if not pois:
+        return await self.save_encoded_pois(self.encode_pois(pois))
+
+    def encode_pois(self, pois: list[POI]) -> list[tuple[Any, ...]]:
+        """Convert POIs to insert tuples (safe to run in a worker thread)."""
+        return [self._poi_to_tuple(poi) for poi in pois]
+
+    async def save_encoded_pois(self, rows: Sequence[tuple[Any, ...]]) -> int:
+        """Insert rows produced by encode_pois.
+
+        Args:
+            rows: Insert tuples (already batched)
+
+        Returns:
+            Number of POIs saved
+        """
+        if not rows:
             return 0
 
-        async with self.pool.connection() as conn:
-            batch = [self._poi_to_tuple(poi) for poi in pois]
-            return await self._insert_pois_batch(conn, batch)
+        async with self._batch_connection() as conn:
+            return await self._insert_pois_batch(conn, list(rows))
 
     async def _insert_pois_batch(
         self,
@@ -239,46 +503,13 @@ class PostgresWriter(GeoRepository):
         batch: list[tuple[Any, ...]],
     ) -> int:
         """Insert a batch of POIs."""
-        query = """
-            INSERT INTO pois (
-                id, geometry, category, subcategory, name,
-                address, phone, opening_hours, price_range, website,
-                is_24_7, formatted_address,
-                name_normalized, search_text, search_text_normalized, has_name, popularity,
-                tags
-            )
-            VALUES (%s, ST_GeomFromEWKT(%s), %s, %s, %s, %s, %s, %s,
-                    %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            ON CONFLICT (id) DO UPDATE SET
-                geometry = EXCLUDED.geometry,
-                category = EXCLUDED.category,
-                subcategory = EXCLUDED.subcategory,
-                name = EXCLUDED.name,
-                address = EXCLUDED.address,
-                phone = EXCLUDED.phone,
-                opening_hours = EXCLUDED.opening_hours,
-                price_range = EXCLUDED.price_range,
-                website = EXCLUDED.website,
-                is_24_7 = EXCLUDED.is_24_7,
-                formatted_address = EXCLUDED.formatted_address,
-                name_normalized = EXCLUDED.name_normalized,
-                search_text = EXCLUDED.search_text,
-                search_text_normalized = EXCLUDED.search_text_normalized,
-                has_name = EXCLUDED.has_name,
-                popularity = EXCLUDED.popularity,
-                tags = EXCLUDED.tags,
-                updated_at = NOW()
-        """
-        async with conn.cursor() as cur:
-            await cur.executemany(query, batch)
-        await conn.commit()
-        return len(batch)
+        return await self._upsert(conn, _POIS_SQL, batch)
 
     def _zone_to_tuple(self, zone: Zone) -> tuple[Any, ...]:
         """Convert Zone entity to insert tuple."""
         return (
             zone.id,
-            _coords_to_wkt_polygon(zone.geometry),
+            _ewkb_polygon(zone.geometry),
             zone.zone_type,
             zone.name,
             zone.level,
@@ -286,8 +517,8 @@ class PostgresWriter(GeoRepository):
             zone.iso_code,
             zone.population,
             zone.area,
-            _coords_to_wkt_point(zone.centroid),
-            json.dumps(zone.tags) if zone.tags else None,
+            _ewkb_point(zone.centroid),
+            _dumps_json(zone.tags) if zone.tags else None,
         )
 
     async def save_zones(self, zones: Iterable[Zone]) -> int:
@@ -299,20 +530,7 @@ class PostgresWriter(GeoRepository):
         Returns:
             Number of zones saved
         """
-        count = 0
-        batch: list[tuple[Any, ...]] = []
-
-        async with self.pool.connection() as conn:
-            for zone in zones:
-                batch.append(self._zone_to_tuple(zone))
-
-                if len(batch) >= self.batch_size:
-                    count += await self._insert_zones_batch(conn, batch)
-                    batch = []
-
-            if batch:
-                count += await self._insert_zones_batch(conn, batch)
-
+        count = await self._upsert_stream("zones", map(self._zone_to_tuple, zones), _ZONES_SQL)
         logger.info("Written zones", count=count)
         return count
 
@@ -327,12 +545,26 @@ class PostgresWriter(GeoRepository):
         Returns:
             Number of zones saved
         """
-        if not zones:
+        return await self.save_encoded_zones(self.encode_zones(zones))
+
+    def encode_zones(self, zones: list[Zone]) -> list[tuple[Any, ...]]:
+        """Convert zones to insert tuples (safe to run in a worker thread)."""
+        return [self._zone_to_tuple(zone) for zone in zones]
+
+    async def save_encoded_zones(self, rows: Sequence[tuple[Any, ...]]) -> int:
+        """Insert rows produced by encode_zones.
+
+        Args:
+            rows: Insert tuples (already batched)
+
+        Returns:
+            Number of zones saved
+        """
+        if not rows:
             return 0
 
-        async with self.pool.connection() as conn:
-            batch = [self._zone_to_tuple(zone) for zone in zones]
-            return await self._insert_zones_batch(conn, batch)
+        async with self._batch_connection() as conn:
+            return await self._insert_zones_batch(conn, list(rows))
 
     async def _insert_zones_batch(
         self,
@@ -340,39 +572,16 @@ class PostgresWriter(GeoRepository):
         batch: list[tuple[Any, ...]],
     ) -> int:
         """Insert a batch of zones."""
-        query = """
-            INSERT INTO zones (
-                id, geometry, zone_type, name, level, parent_zone_id,
-                iso_code, population, area, centroid, tags
-            )
-            VALUES (%s, ST_Multi(ST_GeomFromEWKT(%s)), %s, %s, %s, %s, %s, %s,
-                    %s, ST_GeomFromEWKT(%s), %s)
-            ON CONFLICT (id) DO UPDATE SET
-                geometry = EXCLUDED.geometry,
-                zone_type = EXCLUDED.zone_type,
-                name = EXCLUDED.name,
-                level = EXCLUDED.level,
-                parent_zone_id = EXCLUDED.parent_zone_id,
-                iso_code = EXCLUDED.iso_code,
-                population = EXCLUDED.population,
-                area = EXCLUDED.area,
-                centroid = EXCLUDED.centroid,
-                tags = EXCLUDED.tags,
-                updated_at = NOW()
-        """
-        async with conn.cursor() as cur:
-            await cur.executemany(query, batch)
-        await conn.commit()
-        return len(batch)
+        return await self._upsert(conn, _ZONES_SQL, batch)
 
     def _segment_to_tuple(self, segment: Segment) -> tuple[Any, ...]:
         """Convert Segment entity to insert tuple."""
         return (
             segment.id,
             segment.road_id,
-            _coords_to_wkt_linestring([segment.start, segment.end]),
-            _coords_to_wkt_point(segment.start),
-            _coords_to_wkt_point(segment.end),
+            _ewkb_linestring([segment.start, segment.end]),
+            _ewkb_point(segment.start),
+            _ewkb_point(segment.end),
             segment.length,
             segment.penalty.surface_factor,
             segment.penalty.smoothness_factor,
@@ -393,20 +602,9 @@ class PostgresWriter(GeoRepository):
         Returns:
             Number of segments saved
         """
-        count = 0
-        batch: list[tuple[Any, ...]] = []
-
-        async with self.pool.connection() as conn:
-            for segment in segments:
-                batch.append(self._segment_to_tuple(segment))
-
-                if len(batch) >= self.batch_size:
-                    count += await self._insert_segments_batch(conn, batch)
-                    batch = []
-
-            if batch:
-                count += await self._insert_segments_batch(conn, batch)
-
+        count = await self._upsert_stream(
+            "segments", map(self._segment_to_tuple, segments), _SEGMENTS_SQL
+        )
         logger.info("Written segments", count=count)
         return count
 
@@ -421,12 +619,26 @@ class PostgresWriter(GeoRepository):
         Returns:
             Number of segments saved
         """
-        if not segments:
+        return await self.save_encoded_segments(self.encode_segments(segments))
+
+    def encode_segments(self, segments: list[Segment]) -> list[tuple[Any, ...]]:
+        """Convert segments to insert tuples (safe to run in a worker thread)."""
+        return [self._segment_to_tuple(segment) for segment in segments]
+
+    async def save_encoded_segments(self, rows: Sequence[tuple[Any, ...]]) -> int:
+        """Insert rows produced by encode_segments.
+
+        Args:
+            rows: Insert tuples (already batched)
+
+        Returns:
+            Number of segments saved
+        """
+        if not rows:
             return 0
 
-        async with self.pool.connection() as conn:
-            batch = [self._segment_to_tuple(segment) for segment in segments]
-            return await self._insert_segments_batch(conn, batch)
+        async with self._batch_connection() as conn:
+            return await self._insert_segments_batch(conn, list(rows))
 
     async def _insert_segments_batch(
         self,
@@ -434,33 +646,4 @@ class PostgresWriter(GeoRepository):
         batch: list[tuple[Any, ...]],
     ) -> int:
         """Insert a batch of segments."""
-        query = """
-            INSERT INTO segments (
-                id, road_id, geometry, start_point, end_point,
-                length, surface_factor, smoothness_factor, rainy_season_factor,
-                oneway, base_speed, effective_speed_kmh, travel_time_seconds, cost
-            )
-            VALUES (
-                %s, %s, ST_GeomFromEWKT(%s), ST_GeomFromEWKT(%s), ST_GeomFromEWKT(%s),
-                %s, %s, %s, %s, %s, %s, %s, %s, %s
-            )
-            ON CONFLICT (id) DO UPDATE SET
-                road_id = EXCLUDED.road_id,
-                geometry = EXCLUDED.geometry,
-                start_point = EXCLUDED.start_point,
-                end_point = EXCLUDED.end_point,
-                length = EXCLUDED.length,
-                surface_factor = EXCLUDED.surface_factor,
-                smoothness_factor = EXCLUDED.smoothness_factor,
-                rainy_season_factor = EXCLUDED.rainy_season_factor,
-                oneway = EXCLUDED.oneway,
-                base_speed = EXCLUDED.base_speed,
-                effective_speed_kmh = EXCLUDED.effective_speed_kmh,
-                travel_time_seconds = EXCLUDED.travel_time_seconds,
-                cost = EXCLUDED.cost,
-                updated_at = NOW()
-        """
-        async with conn.cursor() as cur:
-            await cur.executemany(query, batch)
-        await conn.commit()
-        return len(batch)
+        return await self._upsert(conn, _SEGMENTS_SQL, batch)
@@ -1,44 +1,71 @@
 """Zone hierarchy computation using spatial containment."""
 
-import logging
 from psycopg_pool import AsyncConnectionPool
 
-logger = logging.getLogger(__name__)
+from infrastructure.logging import get_logger
 
+logger = get_logger(__name__)
 
-async def compute_zone_hierarchy(pool: AsyncConnectionPool) -> None:
+# Deepest level that gets a parent: 4 (fokontany) down to 2 (district);
+# level 1 (region) has no parent.
+_MAX_CHILD_LEVEL = 4
+_MIN_CHILD_LEVEL = 2
+
+# One set-based UPDATE for every level. The LATERAL lookup only considers
+# zones one level up and ST_Contains lets the planner probe the GiST index
+# on zones.geometry, so each child is tested against a handful of
+# candidates rather than the whole table. LEFT JOIN keeps children with no
+# containing parent so their parent_zone_id is reset to NULL. The child's
+# centroid is the one the writer stores, rather than ST_Centroid over the
+# whole boundary again for every candidate the index returns; zones stored
+# without one fall back to computing it.
+_UPDATE_PARENTS_SQL = """
+    WITH matched AS (
+        SELECT child.id, parent.id AS parent_id
+        FROM zones AS child
+        LEFT JOIN LATERAL (
+            SELECT candidate.id
+            FROM zones AS candidate
+            WHERE candidate.level = child.level - 1
+              AND ST_Contains(
+                  candidate.geometry, COALESCE(child.centroid, ST_Centroid(child.geometry))
+              )
+            ORDER BY ST_Area(candidate.geometry) ASC
+            LIMIT 1
+        ) AS parent ON TRUE
+        WHERE child.level BETWEEN %s AND %s
+    ),
+    updated AS (
+        UPDATE zones AS z
+        SET parent_zone_id = matched.parent_id
+        FROM matched
+        WHERE z.id = matched.id
+        RETURNING z.parent_zone_id
+    )
+    SELECT count(*), count(parent_zone_id) FROM updated
+"""
+
+
+async def compute_zone_hierarchy(pool: AsyncConnectionPool) -> int:
     """Compute parent_zone_id for all zones using spatial containment.
-    
+
     For each zone, finds the smallest zone at the next level up (level - 1)
-    that contains its centroid. Processes bottom-up from level 4 to level 1.
-    
+    that contains its centroid. All levels are resolved by a single
+    statement in one transaction.
+
     Args:
         pool: Database connection pool
+
+    Returns:
+        Number of zones linked to a parent
     """
     async with pool.connection() as conn:
-        async with conn.cursor() as cur:
-            # Process each level from 4 (fokontany) to 2 (district)
-            # Level 1 (region) has no parent
-            for level in range(4, 1, -1):
-                await cur.execute(
-                    """
-                    UPDATE zones AS child
-                    SET parent_zone_id = (
-                        SELECT parent.id
-                        FROM zones AS parent
-                        WHERE parent.level = %s
-                          AND ST_Contains(parent.geometry, ST_Centroid(child.geometry))
-                        ORDER BY ST_Area(parent.geometry) ASC
-                        LIMIT 1
-                    )
-                    WHERE child.level = %s
-                    """,
-                    (level - 1, level),
-                )
-                
-                rows_updated = cur.rowcount
-                logger.info(
-                    f"Updated parent_zone_id for {rows_updated} zones at level {level}"
-                )
-            
-            await conn.commit()
+        async with conn.transaction():
+            cur = await conn.execute(
+                _UPDATE_PARENTS_SQL, (_MIN_CHILD_LEVEL, _MAX_CHILD_LEVEL)
+            )
+            row = await cur.fetchone()
+
+    updated, linked = row if row else (0, 0)
+    logger.info("Updated parent_zone_id", zones=updated, linked=linked)
+    return linked
@@ -2,18 +2,36 @@
 
 import argparse
 import asyncio
+import gc
+from collections.abc import Callable
+from contextlib import nullcontext
 from dataclasses import asdict
 
-from application import RunPipelineUseCase
+from application import DEFAULT_ENTITY_TYPES, RunPipelineUseCase
 from infrastructure.config import get_settings
 from infrastructure.logging import setup_logging, get_logger
 from infrastructure.osm import PBFReader, OSMExtractor
-from infrastructure.postgres import create_pool, PostgresWriter
+from infrastructure.postgres import PostgresWriter, create_pool, deferred_indexes
 
 logger = get_logger(__name__)
 
 ENTITY_TYPES = ("roads", "pois", "zones", "segments")
 
+# Cyclic GC thresholds for the run. Transforms allocate millions of acyclic
+# objects (coordinates, entities, encoded rows); with the default gen-0
+# threshold of 700 the collector keeps rescanning them and takes ~40% of
+# transform time.
+_GC_THRESHOLDS = (50_000, 20, 20)
+
+
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's loop factory when installed, else the asyncio default."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
 
 def _parse_entity_types(raw_values: list[str] | None) -> set[str] | None:
     if not raw_values:
@@ -57,14 +75,29 @@ async def run(entity_types: set[str] | None) -> None:
     settings = get_settings()
     setup_logging(settings.log_level, settings.log_format)
 
-    logger.info("Starting chorographer ETL pipeline")
+    logger.info(
+        "Starting chorographer ETL pipeline",
+        event_loop=type(asyncio.get_running_loop()).__module__,
+    )
 
     # Infrastructure adapters
-    reader = PBFReader(settings.osm_file_path)
+    reader = PBFReader(
+        settings.osm_file_path,
+        buffer_size=settings.parallel_queue_depth * settings.batch_size,
+        location_index=settings.osm_location_index,
+        way_cache=settings.osm_way_cache,
+    )
     extractor = OSMExtractor(reader)
 
     async with create_pool(settings) as pool:
-        repository = PostgresWriter(pool, settings.batch_size)
+        repository = PostgresWriter(
+            pool,
+            batch_size=settings.postgres_write_batch_size,
+            copy_min_rows=settings.postgres_copy_min_rows,
+            commit_every=settings.postgres_commit_every,
+            batch_sizes={"zones": settings.postgres_zone_write_batch_size},
+            insert_only=settings.postgres_insert_only,
+        )
 
         # Application use case
         pipeline = RunPipelineUseCase(
@@ -73,16 +106,19 @@ async def run(entity_types: set[str] | None) -> None:
             enable_parallel=settings.enable_parallel_pipeline,
             batch_size=settings.batch_size,
             queue_depth=settings.parallel_queue_depth,
+            consumer_concurrency=settings.parallel_consumer_concurrency,
+            # One write per pooled connection: writers never wait on the pool
+            max_concurrent_writes=settings.pool_max_size,
+        )
+        loading = (
+            deferred_indexes(pool, sorted(entity_types or DEFAULT_ENTITY_TYPES))
+            if settings.postgres_defer_indexes
+            else nullcontext()
         )
-        result = await pipeline.execute(entity_types=entity_types)
+        async with loading:
+            result = await pipeline.execute(entity_types=entity_types)
 
         logger.info("Pipeline complete", **asdict(result))
-        
-        # Optionally compute zone hierarchy
-        if compute_hierarchy:
-            hierarchy_use_case = ComputeZoneHierarchyUseCase(pool)
-            await hierarchy_use_case.execute()
-
 
 
 def main() -> None:
@@ -93,4 +129,14 @@ def main() -> None:
     except ValueError as exc:
         raise SystemExit(str(exc)) from exc
 
-    asyncio.run(run(entity_types
\ No newline at end of file
+    # Startup objects (modules, settings) live for the whole run: move them
+    # out of the collected generations before the pipeline starts
+    gc.freeze()
+    gc.set_threshold(*_GC_THRESHOLDS)
+
+    with asyncio.Runner(loop_factory=_loop_factory()) as runner:
+        runner.run(run(entity_types=entity_types))
+
+
+if __name__ == "__main__":
+    main()
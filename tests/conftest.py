@@ -1,6 +1,10 @@
 """Pytest fixtures and configuration."""
 
+from pathlib import Path
+
+import osmium
 import pytest
+from osmium.osm.mutable import Node, Relation, Way
 
 
 @pytest.fixture
@@ -12,3 +16,24 @@ def sample_osm_node() -> dict:
         "lon": 47.5079,
         "tags": {"name": "Antananarivo"},
     }
+
+
+@pytest.fixture
+def tiny_pbf(tmp_path: Path) -> Path:
+    """A sorted PBF with a tagged node, a closed road and a boundary over it."""
+    path = tmp_path / "tiny.osm.pbf"
+    writer = osmium.SimpleWriter(str(path))
+    corners = [(47.50, -18.90), (47.51, -18.90), (47.51, -18.91), (47.50, -18.91)]
+    for node_id, location in enumerate(corners, start=1):
+        tags = {"amenity": "cafe", "name": "Corner"} if node_id == 1 else {}
+        writer.add_node(Node(id=node_id, location=location, tags=tags))
+    writer.add_way(Way(id=10, nodes=[1, 2, 3, 4, 1], tags={"highway": "residential"}))
+    writer.add_relation(
+        Relation(
+            id=100,
+            members=[("w", 10, "outer")],
+            tags={"type": "boundary", "boundary": "administrative", "admin_level": "4"},
+        )
+    )
+    writer.close()
+    return path
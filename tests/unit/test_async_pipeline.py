@@ -0,0 +1,173 @@
+"""Tests for the producer-consumer batcher."""
+
+import contextvars
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from application.services.async_pipeline import AsyncBatcher
+
+PERMITS = 3
+
+
+def _free_permits(semaphore: threading.Semaphore) -> int:
+    """Count permits that can be taken right now, then give them back."""
+    taken = 0
+    while semaphore.acquire(blocking=False):
+        taken += 1
+    for _ in range(taken):
+        semaphore.release()
+    return taken
+
+
+async def test_run_processes_every_item_and_returns_permits() -> None:
+    inflight = threading.BoundedSemaphore(PERMITS)
+    seen: list[int] = []
+
+    async def processor(batch: list[int]) -> int:
+        seen.extend(batch)
+        return len(batch)
+
+    batcher = AsyncBatcher(iter(range(1000)), batch_size=7, max_queue_size=2, inflight=inflight)
+    total = await batcher.run(processor, consumer_concurrency=3)
+
+    assert total == 1000
+    assert sorted(seen) == list(range(1000))
+    assert _free_permits(inflight) == PERMITS
+
+
+async def test_run_applies_encoder_in_producer() -> None:
+    seen: list[str] = []
+
+    async def processor(rows: list[str]) -> int:
+        seen.extend(rows)
+        return len(rows)
+
+    batcher = AsyncBatcher(
+        iter(range(5)), batch_size=2, encoder=lambda batch: [str(i) for i in batch]
+    )
+
+    assert await batcher.run(processor, consumer_concurrency=1) == 5
+    assert sorted(seen) == ["0", "1", "2", "3", "4"]
+
+
+async def test_processor_error_propagates_and_releases_permits() -> None:
+    inflight = threading.BoundedSemaphore(PERMITS)
+    calls = 0
+
+    async def processor(batch: list[int]) -> int:
+        nonlocal calls
+        calls += 1
+        if calls == 2:
+            raise RuntimeError("write failed")
+        return len(batch)
+
+    # Many more batches than queue slots and permits: a producer left
+    # blocked on either would hang the run instead of failing it
+    batcher = AsyncBatcher(iter(range(10_000)), batch_size=10, max_queue_size=2, inflight=inflight)
+    with pytest.raises(RuntimeError, match="write failed"):
+        await batcher.run(processor, consumer_concurrency=2)
+
+    assert _free_permits(inflight) == PERMITS
+
+
+async def test_producer_error_propagates_and_releases_permits() -> None:
+    inflight = threading.BoundedSemaphore(PERMITS)
+
+    def items() -> Iterator[int]:
+        yield from range(25)
+        raise ValueError("bad record")
+
+    async def processor(batch: list[int]) -> int:
+        return len(batch)
+
+    batcher = AsyncBatcher(items(), batch_size=10, inflight=inflight)
+    with pytest.raises(ValueError, match="bad record"):
+        await batcher.run(processor, consumer_concurrency=2)
+
+    assert _free_permits(inflight) == PERMITS
+
+
+def _adapt(batcher: AsyncBatcher[int], full_puts: int, empty_gets: int) -> None:
+    """Run one full adaptation window with the given queue pressure."""
+    for _ in range(batcher.adapt_every):
+        batcher._queue_full_puts = full_puts
+        batcher._queue_empty_gets = empty_gets
+        batcher._adapt_batch_size()
+
+
+def test_batch_size_follows_queue_pressure_within_bounds() -> None:
+    batcher = AsyncBatcher(iter(()), batch_size=1000, min_batch=300, max_batch=3000, adapt_every=2)
+
+    _adapt(batcher, full_puts=8, empty_gets=0)
+    assert batcher.batch_size == 2000
+    _adapt(batcher, full_puts=8, empty_gets=0)
+    assert batcher.batch_size == 3000  # capped at max_batch
+
+    _adapt(batcher, full_puts=0, empty_gets=8)
+    assert batcher.batch_size == 1500
+    for _ in range(3):
+        _adapt(batcher, full_puts=0, empty_gets=8)
+    assert batcher.batch_size == 300  # floored at min_batch
+
+    _adapt(batcher, full_puts=4, empty_gets=4)
+    assert batcher.batch_size == 300  # mixed pressure leaves it alone
+
+
+def test_batch_size_only_changes_once_per_window() -> None:
+    batcher = AsyncBatcher(iter(()), batch_size=1000, adapt_every=4)
+    batcher._queue_full_puts = 8
+
+    for _ in range(3):
+        batcher._adapt_batch_size()
+    assert batcher.batch_size == 1000
+
+    batcher._adapt_batch_size()
+    assert batcher.batch_size == 2000
+    assert batcher._queue_full_puts == 0
+
+
+def test_batches_resume_the_iterator_and_end_short() -> None:
+    batcher = AsyncBatcher(iter(range(7)), batch_size=3)
+
+    assert batcher._iter_batches() == [0, 1, 2]
+    assert batcher._iter_batches() == [3, 4, 5]
+    assert batcher._iter_batches() == [6]
+    assert batcher._iter_batches() is None
+
+
+async def test_consume_merges_queued_batches_up_to_the_cap() -> None:
+    calls: list[list[int]] = []
+
+    async def processor(batch: list[int]) -> int:
+        calls.append(batch)
+        return len(batch)
+
+    batcher = AsyncBatcher(iter(()), batch_size=2, max_merge_factor=2)
+    for batch in ([0, 1], [2, 3], [4, 5], [6], None):
+        batcher.queue.put_nowait(batch)
+
+    assert await batcher.consume(processor) == 7
+    assert calls == [[0, 1, 2, 3], [4, 5, 6]]
+
+
+async def test_dedicated_executor_sees_the_callers_context() -> None:
+    request = contextvars.ContextVar("request", default="unset")
+    request.set("load-42")
+    seen: list[tuple[str, str]] = []
+
+    def encode(batch: list[int]) -> list[int]:
+        seen.append((threading.current_thread().name, request.get()))
+        return batch
+
+    async def processor(batch: list[int]) -> int:
+        return len(batch)
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="batcher-test") as executor:
+        batcher = AsyncBatcher(iter(range(4)), batch_size=2, executor=executor, encoder=encode)
+        assert await batcher.run(processor, consumer_concurrency=1) == 4
+
+    assert [value for _, value in seen] == ["load-42", "load-42"]
+    assert all(name.startswith("batcher-test") for name, _ in seen)
@@ -0,0 +1,39 @@
+"""Tests for polyline measurements on coordinates."""
+
+import random
+
+import pytest
+
+from domain import Coordinates
+from domain.value_objects import PackedCoordinates, iter_edge_lengths, polyline_length
+
+
+def _polyline(vertices: int) -> list[Coordinates]:
+    """A random walk of short road-like steps around Antananarivo."""
+    rng = random.Random(3)
+    lat, lon = -18.9, 47.5
+    points = []
+    for _ in range(vertices):
+        points.append(Coordinates(lat=lat, lon=lon))
+        lat += rng.uniform(-0.001, 0.001)
+        lon += rng.uniform(-0.001, 0.001)
+    return points
+
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_edge_lengths_match_pairwise_distance(packed: bool) -> None:
+    points = _polyline(50)
+    coords = PackedCoordinates([v for c in points for v in (c.lon, c.lat)]) if packed else points
+
+    expected = [a.distance_to(b) for a, b in zip(points, points[1:], strict=False)]
+
+    assert list(iter_edge_lengths(coords)) == expected
+    assert polyline_length(coords) == sum(expected)
+
+
+@pytest.mark.parametrize("vertices", [0, 1])
+def test_degenerate_polylines_have_no_length(vertices: int) -> None:
+    points = _polyline(vertices)
+
+    assert list(iter_edge_lengths(points)) == []
+    assert polyline_length(points) == 0.0
@@ -0,0 +1,17 @@
+"""Tests for the enrichment command line."""
+
+import argparse
+
+import pytest
+
+from enrich import _positive_int
+
+
+def test_repeat_accepts_positive_counts() -> None:
+    assert _positive_int("3") == 3
+
+
+@pytest.mark.parametrize("raw", ["0", "-1", "two"])
+def test_repeat_rejects_counts_below_one(raw: str) -> None:
+    with pytest.raises(argparse.ArgumentTypeError):
+        _positive_int(raw)
@@ -0,0 +1,99 @@
+"""Tests for the Arrow export of the DataExtractor port."""
+
+from collections.abc import Iterator
+
+import pytest
+
+from application import DataExtractor
+from domain import POI, Coordinates, Road, RoadType, Surface, Zone
+from domain.value_objects import PackedCoordinates
+
+pa = pytest.importorskip("pyarrow")
+
+
+class RoadsExtractor(DataExtractor):
+    """Extractor yielding fixed roads."""
+
+    def __init__(self, roads: list[Road]) -> None:
+        self.roads = roads
+
+    def extract_roads(self) -> Iterator[Road]:
+        return iter(self.roads)
+
+    def extract_pois(self) -> Iterator[POI]:
+        return iter(())
+
+    def extract_zones(self) -> Iterator[Zone]:
+        return iter(())
+
+
+def _road(road_id: int, **kwargs) -> Road:
+    geometry = PackedCoordinates([47.5, -18.9, 47.6 + road_id / 100, -18.8])
+    return Road(id=road_id, geometry=geometry, road_type=RoadType.PRIMARY, **kwargs)
+
+
+def test_batches_split_at_batch_size() -> None:
+    extractor = RoadsExtractor([_road(i) for i in range(5)])
+
+    batches = list(extractor.extract_roads_arrow(batch_size=2))
+
+    assert [batch.num_rows for batch in batches] == [2, 2, 1]
+    assert [i for batch in batches for i in batch.column("id").to_pylist()] == list(range(5))
+
+
+def test_schema_and_columns() -> None:
+    road = Road(
+        id=42,
+        geometry=[Coordinates(lat=-18.9, lon=47.5), Coordinates(lat=-18.8, lon=47.6)],
+        road_type=RoadType.TRACK,
+        surface=Surface.GRAVEL,
+        name="RN7",
+        lanes=1,
+        oneway=True,
+        max_speed=30,
+        tags={"highway": "track"},
+    )
+
+    (batch,) = RoadsExtractor([road]).extract_roads_arrow()
+
+    assert batch.schema.names == [
+        "id",
+        "lons",
+        "lats",
+        "road_type",
+        "surface",
+        "smoothness",
+        "name",
+        "lanes",
+        "oneway",
+        "max_speed",
+        "tags",
+    ]
+    assert batch.schema.field("tags").type == pa.map_(pa.string(), pa.string())
+    assert batch.to_pylist() == [
+        {
+            "id": 42,
+            "lons": [47.5, 47.6],
+            "lats": [-18.9, -18.8],
+            "road_type": "track",
+            "surface": "gravel",
+            "smoothness": "unknown",
+            "name": "RN7",
+            "lanes": 1,
+            "oneway": True,
+            "max_speed": 30,
+            "tags": [("highway", "track")],
+        }
+    ]
+
+
+def test_missing_tags_and_optional_values() -> None:
+    (batch,) = RoadsExtractor([_road(1)]).extract_roads_arrow()
+
+    row = batch.to_pylist()[0]
+    assert row["tags"] == []
+    assert (row["name"], row["max_speed"]) == (None, None)
+
+
+def test_no_roads_yield_no_batches() -> None:
+    assert list(RoadsExtractor([]).extract_roads_arrow()) == []
@@ -0,0 +1,47 @@
+"""Tests for the column-oriented routing graph."""
+
+from domain.entities import Segment
+from domain.services import build_segment_arrays
+from domain.value_objects import Coordinates, RoadPenalty
+
+
+def _segment(segment_id: int, start: Coordinates, end: Coordinates, oneway: bool) -> Segment:
+    return Segment(
+        id=segment_id,
+        road_id=1,
+        start=start,
+        end=end,
+        length=100.0 * segment_id,
+        penalty=RoadPenalty(),
+        oneway=oneway,
+    )
+
+
+def test_build_segment_arrays_interns_shared_endpoints() -> None:
+    a = Coordinates(lat=-18.90, lon=47.50)
+    b = Coordinates(lat=-18.91, lon=47.51)
+    c = Coordinates(lat=-18.92, lon=47.52)
+    segments = [
+        _segment(1, a, b, oneway=False),
+        _segment(2, b, c, oneway=True),
+        # Equal coordinates from another object still map to node b
+        _segment(3, Coordinates(lat=-18.91, lon=47.51), a, oneway=False),
+    ]
+
+    arrays = build_segment_arrays(iter(segments))
+
+    assert arrays.nodes == [a, b, c]
+    assert list(arrays.start_idx) == [0, 1, 1]
+    assert list(arrays.end_idx) == [1, 2, 0]
+    assert list(arrays.segment_id) == [1, 2, 3]
+    assert list(arrays.length) == [100.0, 200.0, 300.0]
+    assert list(arrays.cost) == [s.cost for s in segments]
+    assert list(arrays.oneway) == [0, 1, 0]
+    assert len(arrays) == 3
+
+
+def test_index_columns_are_64_bit() -> None:
+    arrays = build_segment_arrays([])
+
+    assert arrays.start_idx.itemsize == arrays.end_idx.itemsize == 8
+    assert len(arrays) == 0
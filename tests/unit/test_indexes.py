@@ -0,0 +1,66 @@
+"""Tests for dropping and rebuilding secondary indexes around a load."""
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import pytest
+from psycopg import sql
+from structlog.testing import capture_logs
+
+from infrastructure.postgres import deferred_indexes
+
+INDEXES = [
+    ("idx_zones_geometry", "CREATE INDEX idx_zones_geometry ON zones USING gist (geometry)"),
+    ("idx_zones_parent_id", "CREATE INDEX idx_zones_parent_id ON zones USING btree (parent_id)"),
+]
+
+
+class FakeCursor:
+    async def fetchall(self) -> list[tuple[str, str]]:
+        return INDEXES
+
+
+class FakeConnection:
+    def __init__(self, executed: list[str]) -> None:
+        self.executed = executed
+
+    async def execute(self, query, params=None) -> FakeCursor:
+        if isinstance(query, sql.Composable):
+            query = query.as_string(None)
+        self.executed.append(query)
+        return FakeCursor()
+
+
+class FakePool:
+    def __init__(self) -> None:
+        self.executed: list[str] = []
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[FakeConnection]:
+        yield FakeConnection(self.executed)
+
+
+async def test_definitions_are_logged_before_indexes_are_dropped() -> None:
+    pool = FakePool()
+
+    with capture_logs() as logs:
+        async with deferred_indexes(pool, ["zones"]):
+            dropped = list(pool.executed)
+
+    warnings = [log for log in logs if log["log_level"] == "warning"]
+    assert [(w["index"], w["definition"]) for w in warnings] == INDEXES
+    assert dropped[1:] == [
+        'DROP INDEX "idx_zones_geometry"',
+        'DROP INDEX "idx_zones_parent_id"',
+    ]
+    assert pool.executed[len(dropped) :] == [definition for _, definition in INDEXES]
+
+
+async def test_indexes_are_rebuilt_when_the_load_fails() -> None:
+    pool = FakePool()
+
+    with pytest.raises(RuntimeError, match="load failed"):
+        async with deferred_indexes(pool, ["zones"]):
+            raise RuntimeError("load failed")
+
+    assert pool.executed[-2:] == [definition for _, definition in INDEXES]
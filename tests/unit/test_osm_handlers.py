@@ -0,0 +1,41 @@
+"""Tests for OSM tag copying in the PBF handlers."""
+
+import pickle
+from typing import NamedTuple
+
+import pytest
+
+from infrastructure.osm.handlers import _tag_dict
+
+
+class Tag(NamedTuple):
+    k: str
+    v: str
+
+
+def test_identical_small_tag_sets_share_one_read_only_dict() -> None:
+    shared: dict = {}
+    first = _tag_dict([Tag("highway", "residential")], shared)
+    second = _tag_dict([Tag("highway", "residential")], shared)
+
+    assert first is second
+    with pytest.raises(TypeError):
+        first["surface"] = "asphalt"
+    with pytest.raises(TypeError):
+        first.update(surface="asphalt")
+    assert second == {"highway": "residential"}
+
+
+def test_shared_tag_dict_survives_pickling() -> None:
+    tags = _tag_dict([Tag("highway", "residential")], {})
+
+    assert pickle.loads(pickle.dumps(tags)) == {"highway": "residential"}
+
+
+def test_tag_sets_with_free_text_are_not_shared() -> None:
+    shared: dict = {}
+    note = "x" * 40
+    tags = _tag_dict([Tag("highway", "track"), Tag("note", note)], shared)
+
+    tags["surface"] = "dirt"
+    assert not shared
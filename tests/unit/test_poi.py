@@ -0,0 +1,54 @@
+"""Tests for POI categorization from OSM tags."""
+
+from itertools import product
+
+import pytest
+
+from domain import POI, POICategory
+
+
+def _categorize_by_scans(amenity: str | None, shop: str | None) -> tuple[POICategory, str]:
+    """Original categorization: one membership scan per category."""
+    groups = [
+        (POICategory.TRANSPORT, ("fuel", "parking", "bus_station", "taxi", "car_rental")),
+        (POICategory.FOOD, ("restaurant", "cafe", "fast_food", "bar", "food_court")),
+        (POICategory.LODGING, ("hotel", "guest_house", "motel", "hostel")),
+        (POICategory.HEALTH, ("hospital", "pharmacy", "clinic", "doctors", "dentist")),
+        (POICategory.SERVICES, ("bank", "atm", "post_office", "bureau_de_change")),
+        (POICategory.GOVERNMENT, ("police", "embassy", "townhall", "courthouse")),
+        (POICategory.EDUCATION, ("school", "university", "college", "library")),
+    ]
+    for category, amenities in groups:
+        if amenity in amenities:
+            return category, amenity
+    if shop:
+        if shop in ("pharmacy",):
+            return POICategory.HEALTH, shop
+        return POICategory.SHOPPING, shop
+    return POICategory.UNKNOWN, amenity or shop or "unknown"
+
+
+AMENITIES = [
+    None,
+    "",
+    "fuel",
+    "food_court",
+    "hostel",
+    "pharmacy",
+    "bureau_de_change",
+    "courthouse",
+    "library",
+    "kindergarten",
+    "bench",
+]
+SHOPS = [None, "", "supermarket", "pharmacy", "bakery"]
+
+
+@pytest.mark.parametrize(("amenity", "shop"), list(product(AMENITIES, SHOPS)))
+def test_categorize_matches_sequential_scans(amenity: str | None, shop: str | None) -> None:
+    assert POI.categorize(amenity, shop) == _categorize_by_scans(amenity, shop)
+
+
+def test_amenity_takes_precedence_over_shop() -> None:
+    assert POI.categorize("cafe", "pharmacy") == (POICategory.FOOD, "cafe")
+    assert POI.categorize("bench", "pharmacy") == (POICategory.HEALTH, "pharmacy")
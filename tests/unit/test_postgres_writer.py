@@ -0,0 +1,187 @@
+"""Tests for the PostgreSQL writer: EWKB encoding and connection handling."""
+
+import struct
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager
+from dataclasses import replace
+
+import pytest
+from psycopg_pool import PoolTimeout
+
+from application import DataExtractor, PipelineRecoverableError, RunPipelineUseCase
+from domain import POI, Coordinates, POICategory, Road, Zone
+from domain.value_objects import PackedCoordinates
+from infrastructure.postgres import PostgresWriter
+from infrastructure.postgres.writer import _ewkb_linestring, _ewkb_point, _ewkb_polygon
+
+_SRID_FLAG = 0x20000000
+
+
+def _decode(hex_ewkb: str, header: str) -> tuple[tuple[int, ...], tuple[float, ...]]:
+    """Split hex EWKB into its little-endian header fields and doubles."""
+    raw = bytes.fromhex(hex_ewkb)
+    fields = struct.unpack_from(header, raw)
+    body = raw[struct.calcsize(header) :]
+    return fields, struct.unpack(f"<{len(body) // 8}d", body)
+
+
+def test_ewkb_point_layout() -> None:
+    fields, values = _decode(_ewkb_point(Coordinates(lat=-18.9, lon=47.5)), "<BII")
+
+    assert fields == (1, 1 | _SRID_FLAG, 4326)
+    assert values == (47.5, -18.9)
+
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_ewkb_linestring_layout(packed: bool) -> None:
+    points = [Coordinates(lat=-18.9, lon=47.5), Coordinates(lat=-18.8, lon=47.6)]
+    coords = PackedCoordinates([47.5, -18.9, 47.6, -18.8]) if packed else points
+
+    fields, values = _decode(_ewkb_linestring(coords), "<BIII")
+
+    assert fields == (1, 2 | _SRID_FLAG, 4326, 2)
+    assert values == (47.5, -18.9, 47.6, -18.8)
+
+
+@pytest.mark.parametrize("packed", [False, True])
+@pytest.mark.parametrize("closed", [False, True])
+def test_ewkb_polygon_layout_closes_ring_once(packed: bool, closed: bool) -> None:
+    ring = [(47.5, -18.9), (47.6, -18.9), (47.6, -18.8)] + ([(47.5, -18.9)] if closed else [])
+    coords = (
+        PackedCoordinates([v for point in ring for v in point])
+        if packed
+        else [Coordinates(lat=lat, lon=lon) for lon, lat in ring]
+    )
+
+    fields, values = _decode(_ewkb_polygon(coords), "<BIIII")
+
+    assert fields == (1, 3 | _SRID_FLAG, 4326, 1, 4)
+    assert values == (47.5, -18.9, 47.6, -18.9, 47.6, -18.8, 47.5, -18.9)
+
+
+class ExhaustedPool:
+    """Pool whose connections always time out."""
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[None]:
+        raise PoolTimeout("couldn't get a connection after 30.00 sec")
+        yield
+
+
+class CountingExtractor(DataExtractor):
+    """Extractor yielding a few POIs and counting extraction passes."""
+
+    def __init__(self) -> None:
+        self.poi_passes = 0
+
+    def extract_roads(self) -> Iterator[Road]:
+        return iter(())
+
+    def extract_pois(self) -> Iterator[POI]:
+        self.poi_passes += 1
+        for i in range(5):
+            yield POI(
+                id=i,
+                coordinates=Coordinates(lat=-18.9, lon=47.5),
+                category=POICategory.FOOD,
+                subcategory="restaurant",
+            )
+
+    def extract_zones(self) -> Iterator[Zone]:
+        return iter(())
+
+
+async def test_pool_timeout_is_recoverable_for_upserts() -> None:
+    writer = PostgresWriter(ExhaustedPool())
+    rows = writer.encode_pois(list(CountingExtractor().extract_pois()))
+
+    with pytest.raises(PipelineRecoverableError):
+        await writer.save_encoded_pois(rows)
+
+
+async def test_pool_timeout_is_not_recoverable_when_insert_only() -> None:
+    writer = PostgresWriter(ExhaustedPool(), insert_only=True)
+    rows = writer.encode_pois(list(CountingExtractor().extract_pois()))
+
+    with pytest.raises(PoolTimeout):
+        await writer.save_encoded_pois(rows)
+
+
+async def test_insert_only_pipeline_skips_sequential_fallback() -> None:
+    extractor = CountingExtractor()
+    writer = PostgresWriter(ExhaustedPool(), insert_only=True)
+    pipeline = RunPipelineUseCase(extractor, writer, batch_size=2, max_concurrent_writes=1)
+
+    with pytest.raises(PoolTimeout):
+        await pipeline.execute(entity_types={"pois"})
+
+    assert extractor.poi_passes == 1
+
+
+class RecordingCursor:
+    def __init__(self, calls: list[tuple]) -> None:
+        self.calls = calls
+
+    async def __aenter__(self) -> "RecordingCursor":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        return None
+
+    async def executemany(self, query: str, rows: list[tuple]) -> None:
+        self.calls.append(("executemany", [row[0] for row in rows]))
+
+
+class RecordingConnection:
+    def __init__(self) -> None:
+        self.calls: list[tuple] = []
+
+    def cursor(self) -> RecordingCursor:
+        return RecordingCursor(self.calls)
+
+    async def commit(self) -> None:
+        self.calls.append(("commit",))
+
+
+class RecordingPool:
+    """Pool handing out one connection that records batches and commits."""
+
+    def __init__(self) -> None:
+        self.conn = RecordingConnection()
+        self.checkouts = 0
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[RecordingConnection]:
+        self.checkouts += 1
+        yield self.conn
+
+
+async def test_streaming_save_commits_every_few_batches() -> None:
+    pool = RecordingPool()
+    writer = PostgresWriter(pool, batch_size=2, copy_min_rows=100, commit_every=2)
+    pois = list(CountingExtractor().extract_pois())  # ids 0..4
+
+    assert await writer.save_pois(pois + [replace(p, id=p.id + 5) for p in pois]) == 10
+
+    assert pool.checkouts == 1
+    assert pool.conn.calls == [
+        ("executemany", [0, 1]),
+        ("executemany", [2, 3]),
+        ("commit",),
+        ("executemany", [4, 5]),
+        ("executemany", [6, 7]),
+        ("commit",),
+        # The last, partial group is committed when the connection returns
+        ("executemany", [8, 9]),
+    ]
+
+
+async def test_streaming_save_uses_entity_batch_size() -> None:
+    pool = RecordingPool()
+    writer = PostgresWriter(
+        pool, batch_size=2, copy_min_rows=100, commit_every=10, batch_sizes={"pois": 3}
+    )
+
+    await writer.save_pois(list(CountingExtractor().extract_pois()))
+
+    assert pool.conn.calls == [("executemany", [0, 1, 2]), ("executemany", [3, 4])]
@@ -0,0 +1,63 @@
+"""Tests for the Road entity's derived values."""
+
+from dataclasses import FrozenInstanceError, replace
+
+import pytest
+
+from domain import Coordinates, Road, RoadPenalty, RoadType, Smoothness, Surface
+
+
+def _road(**kwargs) -> Road:
+    geometry = [Coordinates(lat=-18.90, lon=47.50), Coordinates(lat=-18.90, lon=47.51)]
+    return Road(id=1, geometry=geometry, road_type=RoadType.SECONDARY, **kwargs)
+
+
+def test_penalty_follows_surface_and_smoothness() -> None:
+    road = _road(surface=Surface.GRAVEL, smoothness=Smoothness.BAD)
+
+    assert road.penalty == RoadPenalty.from_road_attributes(
+        surface=Surface.GRAVEL, smoothness=Smoothness.BAD, is_rainy_season=False
+    )
+
+
+def test_effective_speed_prefers_max_speed() -> None:
+    assert _road().effective_speed_kmh == 60
+    assert _road(max_speed=45).effective_speed_kmh == 45
+
+
+@pytest.mark.parametrize(
+    ("name", "value"),
+    [
+        ("surface", Surface.DIRT),
+        ("smoothness", Smoothness.HORRIBLE),
+        ("road_type", RoadType.TRACK),
+        ("max_speed", 20),
+    ],
+)
+def test_inputs_of_memoized_values_cannot_be_reassigned(name: str, value: object) -> None:
+    road = _road()
+    road.penalty, road.effective_speed_kmh  # noqa: B018 - fill the memos
+
+    with pytest.raises(FrozenInstanceError):
+        setattr(road, name, value)
+
+
+def test_replace_recomputes_derived_values() -> None:
+    road = _road(surface=Surface.ASPHALT)
+    asphalt_penalty, asphalt_speed = road.penalty, road.effective_speed_kmh
+
+    repaved = replace(road, surface=Surface.DIRT, max_speed=25)
+
+    assert repaved.penalty != asphalt_penalty
+    assert repaved.penalty.surface_factor < asphalt_penalty.surface_factor
+    assert (repaved.effective_speed_kmh, asphalt_speed) == (25, 60)
+
+
+def test_add_tag_replaces_shared_tags() -> None:
+    shared = {"highway": "secondary"}
+    road = _road(tags=shared)
+
+    road.add_tag("surface", "asphalt")
+
+    assert road.tags == {"highway": "secondary", "surface": "asphalt"}
+    assert shared == {"highway": "secondary"}
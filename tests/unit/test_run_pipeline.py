@@ -0,0 +1,87 @@
+"""Tests for parallel scheduling in the pipeline use case."""
+
+import asyncio
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
+
+from application import DataExtractor, GeoRepository, RunPipelineUseCase
+from domain import POI, Coordinates, POICategory, Road, RoadType, Segment, Zone
+
+_A = Coordinates(lat=-18.90, lon=47.50)
+_B = Coordinates(lat=-18.90, lon=47.51)
+_C = Coordinates(lat=-18.91, lon=47.51)
+
+
+class OneOfEachExtractor(DataExtractor):
+    """Extractor yielding a single road, POI and zone."""
+
+    def extract_roads(self) -> Iterator[Road]:
+        yield Road(id=1, geometry=[_A, _B], road_type=RoadType.SECONDARY)
+
+    def extract_pois(self) -> Iterator[POI]:
+        yield POI(id=2, coordinates=_A, category=POICategory.FOOD, subcategory="cafe")
+
+    def extract_zones(self) -> Iterator[Zone]:
+        yield Zone(id=3, geometry=[_A, _B, _C], zone_type="commune", name="Test", level=3)
+
+
+class TrackingRepository(GeoRepository):
+    """Repository recording how many batch writes run at the same time."""
+
+    def __init__(self, barrier: asyncio.Barrier | None = None) -> None:
+        self.barrier = barrier
+        self.active = 0
+        self.peak = 0
+
+    async def _save(self, rows: Sequence[Any]) -> int:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            if self.barrier is not None:
+                await self.barrier.wait()
+            await asyncio.sleep(0.01)
+        finally:
+            self.active -= 1
+        return len(rows)
+
+    def _encode(self, entities: list[Any]) -> Sequence[Any]:
+        return entities
+
+    encode_roads = encode_pois = encode_zones = encode_segments = _encode
+    save_encoded_roads = save_encoded_pois = _save
+    save_encoded_zones = save_encoded_segments = _save
+
+    async def save_roads(self, roads: Iterable[Road]) -> int:
+        return await self._save(list(roads))
+
+    async def save_pois(self, pois: Iterable[POI]) -> int:
+        return await self._save(list(pois))
+
+    async def save_zones(self, zones: Iterable[Zone]) -> int:
+        return await self._save(list(zones))
+
+    async def save_segments(self, segments: Iterable[Segment]) -> int:
+        return await self._save(list(segments))
+
+
+async def test_parallel_mode_writes_streams_together() -> None:
+    # Each stream's only write waits for the other two: run one after the
+    # other, the barrier would never fill
+    repository = TrackingRepository(asyncio.Barrier(3))
+    pipeline = RunPipelineUseCase(OneOfEachExtractor(), repository)
+
+    result = await asyncio.wait_for(
+        pipeline.execute(entity_types={"roads", "pois", "zones"}), timeout=5
+    )
+
+    assert (result.roads_count, result.pois_count, result.zones_count) == (1, 1, 1)
+    assert repository.peak == 3
+
+
+async def test_parallel_writes_share_the_concurrency_cap() -> None:
+    repository = TrackingRepository()
+    pipeline = RunPipelineUseCase(OneOfEachExtractor(), repository, max_concurrent_writes=1)
+
+    await pipeline.execute(entity_types={"roads", "pois", "zones"})
+
+    assert repository.peak == 1
@@ -0,0 +1,52 @@
+"""Tests for the Segment entity's precomputed routing values."""
+
+from dataclasses import FrozenInstanceError, replace
+
+import pytest
+
+from domain import Coordinates, RoadPenalty, Segment, Smoothness, Surface
+
+
+def _segment(**kwargs) -> Segment:
+    defaults = {
+        "id": 7,
+        "road_id": 1,
+        "start": Coordinates(lat=-18.90, lon=47.50),
+        "end": Coordinates(lat=-18.90, lon=47.51),
+        "length": 1000.0,
+        "penalty": RoadPenalty.from_road_attributes(
+            surface=Surface.GRAVEL, smoothness=Smoothness.BAD, is_rainy_season=False
+        ),
+        "base_speed": 60,
+    }
+    return Segment(**{**defaults, **kwargs})
+
+
+def test_speed_and_travel_time_are_precomputed() -> None:
+    segment = _segment()
+    speed = segment.penalty.apply_to_speed(60)
+
+    assert segment.effective_speed_kmh == speed
+    assert segment.travel_time_seconds == pytest.approx(1000 / (speed / 3.6))
+    assert segment.cost == segment.travel_time_seconds
+
+
+def test_zero_speed_takes_forever() -> None:
+    assert _segment(base_speed=0).travel_time_seconds == float("inf")
+
+
+@pytest.mark.parametrize(("name", "value"), [("length", 1.0), ("base_speed", 10)])
+def test_inputs_of_precomputed_values_cannot_be_reassigned(name: str, value: object) -> None:
+    with pytest.raises(FrozenInstanceError):
+        setattr(_segment(), name, value)
+
+
+def test_replace_and_reverse_recompute() -> None:
+    segment = _segment()
+
+    assert replace(segment, length=2000.0).travel_time_seconds == pytest.approx(
+        2 * segment.travel_time_seconds
+    )
+    reverse = segment.reverse()
+    assert (reverse.id, reverse.start, reverse.end) == (-7, segment.end, segment.start)
+    assert reverse.travel_time_seconds == segment.travel_time_seconds
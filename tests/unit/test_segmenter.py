@@ -0,0 +1,140 @@
+"""Tests for splitting roads into routing segments."""
+
+from collections import Counter
+
+import pytest
+
+from domain import Coordinates, Road, RoadPenalty, RoadType, Segment, Surface
+from domain.services import (
+    count_road_coordinates,
+    iter_road_segments,
+    split_road,
+    split_roads_into_segments,
+    tally_road_coordinates,
+)
+from domain.services.segmenter import _segment_id
+from domain.value_objects import PackedCoordinates
+
+
+def _split_per_road(roads: list[Road]) -> list[Segment]:
+    """Original splitter: cut at the ends and at every shared coordinate."""
+    coord_counts = Counter((c.lat, c.lon) for road in roads for c in road.geometry)
+    segments = []
+    for road in roads:
+        geometry = list(road.geometry)
+        cuts = [
+            idx
+            for idx, coord in enumerate(geometry)
+            if idx in (0, len(geometry) - 1) or coord_counts[(coord.lat, coord.lon)] > 1
+        ]
+        for start_idx, end_idx in zip(cuts, cuts[1:], strict=False):
+            coords = geometry[start_idx : end_idx + 1]
+            start, end = coords[0], coords[-1]
+            segments.append(
+                Segment(
+                    id=_segment_id(road.id, start, end),
+                    road_id=road.id,
+                    start=start,
+                    end=end,
+                    length=sum(a.distance_to(b) for a, b in zip(coords, coords[1:], strict=False)),
+                    penalty=RoadPenalty.from_road_attributes(
+                        surface=road.surface,
+                        smoothness=road.smoothness,
+                        is_rainy_season=False,
+                    ),
+                    oneway=road.oneway,
+                    base_speed=road.effective_speed_kmh,
+                )
+            )
+    return segments
+
+
+def _road(road_id: int, points: list[tuple[float, float]], packed: bool, **kwargs) -> Road:
+    geometry = (
+        PackedCoordinates([v for lat, lon in points for v in (lon, lat)])
+        if packed
+        else [Coordinates(lat=lat, lon=lon) for lat, lon in points]
+    )
+    return Road(id=road_id, geometry=geometry, road_type=RoadType.RESIDENTIAL, **kwargs)
+
+
+def _network(packed: bool) -> list[Road]:
+    """A crossing, a T junction, a dead end and a self-touching loop."""
+    return [
+        _road(1, [(-18.90, 47.50), (-18.90, 47.51), (-18.90, 47.52), (-18.90, 47.53)], packed),
+        _road(
+            2,
+            [(-18.89, 47.51), (-18.90, 47.51), (-18.91, 47.51)],
+            packed,
+            oneway=True,
+            surface=Surface.GRAVEL,
+        ),
+        _road(3, [(-18.92, 47.52), (-18.91, 47.52), (-18.90, 47.52)], packed),
+        _road(4, [(-18.95, 47.60), (-18.96, 47.61)], packed),
+        _road(
+            5,
+            [(-18.80, 47.40), (-18.81, 47.41), (-18.82, 47.40), (-18.81, 47.41), (-18.83, 47.42)],
+            packed,
+        ),
+    ]
+
+
+def _key(segment: Segment) -> tuple:
+    return (
+        segment.id,
+        segment.road_id,
+        segment.start,
+        segment.end,
+        segment.oneway,
+        segment.base_speed,
+        segment.penalty,
+    )
+
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_iter_road_segments_matches_per_road_splitter(packed: bool) -> None:
+    roads = _network(packed)
+    expected = _split_per_road(roads)
+
+    segments = list(iter_road_segments(roads, count_road_coordinates(roads)))
+
+    assert [_key(s) for s in segments] == [_key(s) for s in expected]
+    assert [s.length for s in segments] == pytest.approx([s.length for s in expected])
+    assert len(segments) == 10
+
+
+def test_split_road_cuts_at_shared_coordinates() -> None:
+    roads = _network(packed=True)
+    coord_counts = count_road_coordinates(roads)
+
+    segments = list(split_road(roads[0], coord_counts))
+
+    assert [(s.start.lon, s.end.lon) for s in segments] == [
+        (47.50, 47.51),
+        (47.51, 47.52),
+        (47.52, 47.53),
+    ]
+    assert all(s.road_id == 1 for s in segments)
+
+
+def test_tallied_counts_split_like_counted_ones() -> None:
+    roads = _network(packed=False)
+    tallied: dict[tuple[float, float], int] = {}
+    for road in roads:
+        tally_road_coordinates(road, tallied)
+
+    by_tally = list(iter_road_segments(roads, tallied))
+    by_count = list(split_roads_into_segments(roads))
+
+    assert [_key(s) for s in by_tally] == [_key(s) for s in by_count]
+
+
+def test_segment_ids_are_stable_distinct_and_63_bit() -> None:
+    a = Coordinates(lat=-18.9, lon=47.5)
+    b = Coordinates(lat=-18.8, lon=47.6)
+
+    # Pinned: ids are primary keys, so a change here needs a migration
+    assert _segment_id(42, a, b) == 3642890733212539542
+    ids = {_segment_id(42, a, b), _segment_id(43, a, b), _segment_id(42, b, a)}
+    assert len(ids) == 3
+    assert all(0 <= segment_id < 2**63 for segment_id in ids)
@@ -0,0 +1,27 @@
+"""Tests for settings derived from the environment."""
+
+import pytest
+
+from infrastructure.config.settings import Settings
+
+
+@pytest.fixture
+def four_cpus(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("infrastructure.config.settings.os.cpu_count", lambda: 4)
+
+
+@pytest.mark.usefixtures("four_cpus")
+@pytest.mark.parametrize("queue_depth", [2, 10, 50])
+def test_pool_size_defaults_to_cpu_bound_whatever_the_queue_depth(queue_depth: int) -> None:
+    settings = Settings(_env_file=None, parallel_queue_depth=queue_depth)
+
+    assert settings.pool_max_size == 9
+
+
+@pytest.mark.usefixtures("four_cpus")
+def test_pool_size_is_never_below_min_size() -> None:
+    assert Settings(_env_file=None, postgres_pool_min_size=12).pool_max_size == 12
+
+
+def test_explicit_pool_size_wins() -> None:
+    assert Settings(_env_file=None, postgres_pool_max_size=3).pool_max_size == 3
@@ -0,0 +1,160 @@
+"""Tests for OSM tag parsing in the transformers."""
+
+from collections.abc import Iterator
+from itertools import product
+
+import pytest
+
+from domain import POICategory
+from domain.value_objects import OperatingHours
+from infrastructure.osm.transformers import (
+    _parse_opening_hours,
+    categorize_poi,
+    parse_lanes,
+    parse_max_speed,
+    transform_poi,
+)
+
+
+def _categorize_by_cascade(tags: dict[str, str]) -> tuple[POICategory, str]:
+    """Original categorize_poi: amenity tuples and tourism lodging in turn."""
+    amenity = tags.get("amenity")
+    shop = tags.get("shop")
+    tourism = tags.get("tourism")
+    if amenity in ("fuel", "parking", "bus_station", "taxi", "car_rental", "ferry_terminal"):
+        return POICategory.TRANSPORT, amenity
+    if amenity in ("restaurant", "cafe", "fast_food", "bar", "food_court", "pub"):
+        return POICategory.FOOD, amenity
+    if amenity in ("hotel", "guest_house", "motel", "hostel"):
+        return POICategory.LODGING, amenity
+    if tourism in ("hotel", "guest_house", "motel", "hostel", "camp_site"):
+        return POICategory.LODGING, tourism
+    if amenity in ("hospital", "pharmacy", "clinic", "doctors", "dentist"):
+        return POICategory.HEALTH, amenity
+    if amenity in ("bank", "atm", "post_office", "bureau_de_change", "money_transfer"):
+        return POICategory.SERVICES, amenity
+    if amenity in ("police", "embassy", "townhall", "courthouse"):
+        return POICategory.GOVERNMENT, amenity
+    if amenity in ("school", "university", "college", "library", "kindergarten"):
+        return POICategory.EDUCATION, amenity
+    if shop:
+        return POICategory.SHOPPING, shop
+    return POICategory.UNKNOWN, amenity or shop or tourism or "unknown"
+
+
+AMENITIES = [None, "", "ferry_terminal", "pub", "motel", "dentist", "money_transfer", "police"]
+AMENITIES += ["kindergarten", "bench"]
+TOURISM = [None, "camp_site", "hotel", "museum"]
+SHOPS = [None, "", "bakery"]
+
+
+@pytest.mark.parametrize(
+    ("amenity", "tourism", "shop"), list(product(AMENITIES, TOURISM, SHOPS))
+)
+def test_categorize_poi_matches_cascade(
+    amenity: str | None, tourism: str | None, shop: str | None
+) -> None:
+    tags = {
+        key: value
+        for key, value in (("amenity", amenity), ("tourism", tourism), ("shop", shop))
+        if value is not None
+    }
+
+    assert categorize_poi(tags) == _categorize_by_cascade(tags)
+
+
+def test_tourism_lodging_sits_between_amenity_groups() -> None:
+    assert categorize_poi({"amenity": "cafe", "tourism": "hotel"}) == (POICategory.FOOD, "cafe")
+    assert categorize_poi({"amenity": "bank", "tourism": "hotel"}) == (
+        POICategory.LODGING,
+        "hotel",
+    )
+
+
+def _parse_lanes_by_default_string(tags: dict[str, str]) -> int:
+    """Original parse_lanes: parse the tag, or the string "2"."""
+    try:
+        return int(tags.get("lanes", "2"))
+    except ValueError:
+        return 2
+
+
+def _parse_max_speed_by_stripping(tags: dict[str, str]) -> int | None:
+    """Original parse_max_speed: strip unit suffixes before every parse."""
+    maxspeed = tags.get("maxspeed")
+    if not maxspeed:
+        return None
+    maxspeed = maxspeed.replace(" km/h", "").replace("km/h", "").replace(" mph", "")
+    try:
+        return int(maxspeed)
+    except ValueError:
+        return None
+
+
+TAG_VALUES = [
+    None,
+    "",
+    "2",
+    "50",
+    "007",
+    " 40 ",
+    "+30",
+    "-1",
+    "4.5",
+    "50;30",
+    "50 km/h",
+    "50km/h",
+    "30 mph",
+    "50 knots",
+    "walk",
+    "٣٠",  # Arabic-Indic digits: isdecimal, and int() accepts them
+    "²",  # isdigit but not isdecimal
+]
+
+
+@pytest.mark.parametrize("value", TAG_VALUES)
+def test_parse_lanes_matches_original(value: str | None) -> None:
+    tags = {} if value is None else {"lanes": value}
+
+    assert parse_lanes(tags) == _parse_lanes_by_default_string(tags)
+
+
+@pytest.mark.parametrize("value", TAG_VALUES)
+def test_parse_max_speed_matches_original(value: str | None) -> None:
+    tags = {} if value is None else {"maxspeed": value}
+
+    assert parse_max_speed(tags) == _parse_max_speed_by_stripping(tags)
+
+
+@pytest.fixture
+def clean_hours_cache() -> Iterator[None]:
+    _parse_opening_hours.cache_clear()
+    yield
+    _parse_opening_hours.cache_clear()
+
+
+@pytest.mark.usefixtures("clean_hours_cache")
+def test_opening_hours_are_parsed_once_and_shared() -> None:
+    raw = "Mo-Fr 08:00-18:00; Sa 08:00-12:00"
+    first = transform_poi(1, {"amenity": "cafe", "opening_hours": raw}, 47.5, -18.9)
+    second = transform_poi(2, {"shop": "bakery", "opening_hours": raw}, 47.6, -18.8)
+
+    assert first.opening_hours == OperatingHours.parse(raw)
+    assert second.opening_hours is first.opening_hours
+    assert _parse_opening_hours.cache_info().hits == 1
+
+
+@pytest.mark.usefixtures("clean_hours_cache")
+def test_unparseable_opening_hours_become_none(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(cls, raw: str) -> OperatingHours:
+        raise ValueError(raw)
+
+    monkeypatch.setattr(OperatingHours, "parse", classmethod(fail))
+
+    poi = transform_poi(1, {"amenity": "cafe", "opening_hours": "sunrise-sunset"}, 47.5, -18.9)
+
+    assert poi.opening_hours is None
+
+
+def test_missing_opening_hours_stay_none() -> None:
+    assert transform_poi(1, {"amenity": "cafe"}, 47.5, -18.9).opening_hours is None
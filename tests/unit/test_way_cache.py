@@ -0,0 +1,91 @@
+"""Tests for the on-disk way geometry cache."""
+
+import os
+from array import array
+from pathlib import Path
+
+import pytest
+
+from infrastructure.osm import PBFReader
+from infrastructure.osm.way_cache import cache_path, load_ways, save_ways
+
+WAYS = {
+    1: array("d", [47.5, -18.9, 47.6, -18.8]),
+    2: array("d", [47.6, -18.8, 47.7, -18.7, 47.8, -18.6]),
+}
+
+
+@pytest.fixture
+def pbf(tmp_path: Path) -> Path:
+    path = tmp_path / "area.osm.pbf"
+    path.write_bytes(b"not read by the cache")
+    return path
+
+
+def test_round_trip_returns_requested_ways(pbf: Path) -> None:
+    save_ways(pbf, {1, 2, 3}, WAYS)
+
+    assert load_ways(pbf, {1, 2}) == WAYS
+    # Way 3 was requested but had no geometry: covered, just absent
+    assert load_ways(pbf, {2, 3}) == {2: WAYS[2]}
+
+
+def test_cache_older_than_pbf_is_rejected(pbf: Path) -> None:
+    save_ways(pbf, {1, 2}, WAYS)
+    stamp = cache_path(pbf).stat().st_mtime
+    os.utime(pbf, (stamp + 10, stamp + 10))
+
+    assert load_ways(pbf, {1, 2}) is None
+
+
+def test_cache_not_covering_requested_ways_is_rejected(pbf: Path) -> None:
+    save_ways(pbf, {1, 2}, WAYS)
+
+    assert load_ways(pbf, {1, 4}) is None
+
+
+def test_missing_cache_is_rejected(pbf: Path) -> None:
+    assert load_ways(pbf, {1}) is None
+
+
+@pytest.mark.parametrize(
+    "corrupt",
+    [
+        lambda data: b"NOTWAYS!" + data[8:],
+        lambda data: data[: len(data) - 12],
+        lambda data: data[:10],
+    ],
+    ids=["bad-magic", "truncated-coordinates", "truncated-header"],
+)
+def test_corrupt_cache_is_rejected(pbf: Path, corrupt) -> None:
+    save_ways(pbf, {1, 2}, WAYS)
+    path = cache_path(pbf)
+    path.write_bytes(corrupt(path.read_bytes()))
+
+    assert load_ways(pbf, {1, 2}) is None
+
+
+def test_reader_uses_fresh_cache(tiny_pbf: Path) -> None:
+    cached = array("d", [45.0, -20.0, 45.1, -20.0, 45.1, -20.1, 45.0, -20.0])
+    save_ways(tiny_pbf, {10}, {10: cached})
+
+    (relation,) = PBFReader(tiny_pbf, way_cache=True).read_raw_relations()
+
+    assert relation.coords == cached
+
+
+def test_reader_rescans_and_rewrites_corrupt_cache(tiny_pbf: Path) -> None:
+    expected = list(PBFReader(tiny_pbf).read_raw_relations())
+    path = cache_path(tiny_pbf)
+    path.write_bytes(b"NOTWAYS!" + bytes(64))
+
+    relations = list(PBFReader(tiny_pbf, way_cache=True).read_raw_relations())
+
+    assert [(r.id, r.coords) for r in relations] == [(r.id, r.coords) for r in expected]
+    assert load_ways(tiny_pbf, {10}) == {10: expected[0].coords}
+
+
+def test_reader_leaves_no_cache_by_default(tiny_pbf: Path) -> None:
+    list(PBFReader(tiny_pbf).read_raw_relations())
+
+    assert not cache_path(tiny_pbf).exists()
@@ -0,0 +1,126 @@
+"""Tests for zone point-in-polygon queries."""
+
+import random
+from math import cos, pi, sin
+
+import pytest
+
+from domain import Coordinates, Zone
+from domain.value_objects import PackedCoordinates
+
+
+def _ray_cast(ring: list[tuple[float, float]], x: float, y: float) -> bool:
+    """Reference even-odd test over every edge, with the original division."""
+    inside = False
+    j = len(ring) - 1
+    for i in range(len(ring)):
+        xi, yi = ring[i]
+        xj, yj = ring[j]
+        if ((yi > y) != (yj > y)) and (x < (xj - xi) * (y - yi) / (yj - yi) + xi):
+            inside = not inside
+        j = i
+    return inside
+
+
+def _star(vertices: int, seed: int = 7) -> list[tuple[float, float]]:
+    """A jagged (lon, lat) ring around Antananarivo, concave at most vertices."""
+    rng = random.Random(seed)
+    ring = []
+    for k in range(vertices):
+        angle = 2 * pi * k / vertices
+        radius = 0.05 + 0.04 * rng.random()
+        ring.append((47.5 + radius * cos(angle), -18.9 + radius * sin(angle)))
+    return ring
+
+
+def _zone(ring: list[tuple[float, float]], packed: bool = False) -> Zone:
+    geometry = (
+        PackedCoordinates([v for point in ring for v in point])
+        if packed
+        else [Coordinates(lat=lat, lon=lon) for lon, lat in ring]
+    )
+    return Zone(id=1, geometry=geometry, zone_type="commune", name="Test", level=3)
+
+
+def _probes(ring: list[tuple[float, float]], count: int) -> list[tuple[float, float]]:
+    """Random points over the bounding box (plus a margin) and the vertices."""
+    rng = random.Random(11)
+    lons = [x for x, _ in ring]
+    lats = [y for _, y in ring]
+    probes = [
+        (
+            rng.uniform(min(lons) - 0.01, max(lons) + 0.01),
+            rng.uniform(min(lats) - 0.01, max(lats) + 0.01),
+        )
+        for _ in range(count)
+    ]
+    # On band boundaries: vertex latitudes, including the extremes
+    extremes = [min(ring, key=lambda p: p[1]), max(ring, key=lambda p: p[1])]
+    vertices = rng.sample(ring, min(len(ring), 100)) + extremes
+    return probes + [(x + 1e-9, y) for x, y in vertices]
+
+
+@pytest.mark.parametrize("vertices", [3, 12, 200, 3000])
+@pytest.mark.parametrize("packed", [False, True])
+def test_banded_query_matches_full_ray_cast(vertices: int, packed: bool) -> None:
+    ring = _star(vertices)
+    zone = _zone(ring, packed)
+
+    probes = _probes(ring, 500)
+    got = zone.contains_points(Coordinates(lat=y, lon=x) for x, y in probes)
+
+    assert got == [_ray_cast(ring, x, y) for x, y in probes]
+    assert any(got) and not all(got)
+
+
+def test_large_polygons_are_split_into_bands() -> None:
+    zone = _zone(_star(3000))
+    zone.contains_point(Coordinates(lat=-18.9, lon=47.5))
+
+    assert zone._bands is not None
+    assert 1 < len(zone._bands) <= 1024
+    # Every non-horizontal edge is filed at least once; most in one band
+    assert sum(map(len, zone._bands)) >= 3000
+
+
+def test_points_outside_the_bounding_box_are_rejected() -> None:
+    zone = _zone(_star(200))
+
+    assert not zone.contains_point(Coordinates(lat=-18.9, lon=48.0))
+    assert not zone.contains_point(Coordinates(lat=-19.5, lon=47.5))
+
+
+def test_flat_polygon_gets_a_single_band() -> None:
+    # Degenerate ring: every edge is horizontal, so no band has any edge
+    zone = _zone([(47.5, -18.9), (47.6, -18.9), (47.7, -18.9)])
+
+    assert not zone.contains_point(Coordinates(lat=-18.9, lon=47.55))
+    assert zone._bands == [[]]
+
+
+def test_edges_store_inverse_slope_and_skip_horizontal_ones() -> None:
+    ring = _star(12) + [(47.45, -18.95), (47.40, -18.95)]  # one horizontal edge
+    zone = _zone(ring)
+    zone.contains_point(Coordinates(lat=-18.9, lon=47.5))
+
+    expected = {}
+    for (xi, yi), (xj, yj) in zip(ring, ring[-1:] + ring[:-1], strict=True):
+        if yi != yj:
+            expected[(xi, yi, yj)] = (xj - xi) / (yj - yi)
+    stored = {(xi, yi, yj): slope for band in zone._bands for xi, yi, yj, slope in band}
+
+    assert stored == expected
+
+
+@pytest.mark.parametrize("offset", [-1e-7, 1e-7])
+def test_points_next_to_edges_match_the_division_form(offset: float) -> None:
+    ring = _star(12)
+    zone = _zone(ring)
+    midpoints = [
+        ((xi + xj) / 2 + offset, (yi + yj) / 2)
+        for (xi, yi), (xj, yj) in zip(ring, ring[1:] + ring[:1], strict=True)
+    ]
+
+    got = [zone.contains_point(Coordinates(lat=y, lon=x)) for x, y in midpoints]
+
+    assert got == [_ray_cast(ring, x, y) for x, y in midpoints]